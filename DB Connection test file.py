@@ -1,33 +1,28 @@
-import cx_Oracle
+import oracledb
+
+oracledb.defaults.arraysize = 10000
+oracledb.defaults.prefetchrows = 10001
 
 
 def fetch_data():
     try:
-        dsn = cx_Oracle.makedsn("localhost", 1522, sid="xe")
-        connection = cx_Oracle.connect(user="system", password="test", dsn=dsn)
-
-        print("Database connection established successfully.")
+        with oracledb.connect(user="system", password="test", dsn=oracledb.makedsn("localhost", 1522, sid="xe")) as connection:
+            print("Database connection established successfully.")
 
-        cursor = connection.cursor()
+            with connection.cursor() as cursor:
+                # No semicolon at the end
+                query = "SELECT table_name FROM user_tables WHERE table_name = 'BANK_DATABASE_SYSTEM'"
 
-        # No semicolon at the end
-        query = "SELECT table_name FROM user_tables WHERE table_name = 'BANK_DATABASE_SYSTEM'"
+                cursor.execute(query)
+                rows = cursor.fetchall()
 
-        cursor.execute(query)
-        rows = cursor.fetchall()
+                for row in rows:
+                    print(row)
 
-        for row in rows:
-            print(row)
+        print("Database connection closed.")
 
-    except cx_Oracle.DatabaseError as e:
+    except oracledb.DatabaseError as e:
         print(f"An error occurred: {e}")
 
-    finally:
-        if cursor:
-            cursor.close()
-        if connection:
-            connection.close()
-            print("Database connection closed.")
-
 
 fetch_data()
@@ -1,10 +1,43 @@
 import oracledb
 import csv
 import os
+import re
 import datetime
+import pickle
+import shutil
+import sqlite3
+import tempfile
 import subprocess
 import time
-from notify_on_completion import send_telegram_notification, BOT_TOKEN, CHAT_IDS
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, wait
+from operator import itemgetter
+from notify_on_completion import queue_telegram_notification, BOT_TOKEN, CHAT_IDS
+
+# Fetch tuning for every cursor, including the plain connection.cursor() ones:
+# 10000 rows per round trip instead of the driver default of 100.
+oracledb.defaults.arraysize = 10000
+oracledb.defaults.prefetchrows = 10001
+
+# Default number of tables validated concurrently (one session per side per
+# worker); the prompt can change it. Beyond ~5 concurrent sessions the
+# databases tend to stall on lock contention.
+MAX_WORKERS = 5
+
+# Oracle Net session data unit: 64KB packets instead of the 8KB default, so
+# large fetches need far fewer network packets. The server settles on the
+# smaller of its own SDU and this value.
+SDU_SIZE = 65535
+
+# Statements kept parsed per session. The metadata lookups (columns, keys,
+# indexes, triggers) run once per table with the same SQL text and bind
+# variables, so they are reused from the cache instead of being re-parsed.
+STATEMENT_CACHE_SIZE = 100
+
+# Server-side cursor cache per session, so the per-table statements that are
+# closed and executed again (same text for every worker) skip the re-parse
+SESSION_CACHED_CURSORS = 200
 
 ###############################################################################
 # Prompt for User Inputs
@@ -23,10 +56,25 @@ def prompt_user_for_info():
     new_db_dsn = input("  New DB DSN (e.g. host:port/service_name): ").strip()
     new_schema_name = input("  New Schema Name: ").strip()
 
-    print("\nSpecify a chunk size for any full data comparisons (number of rows per chunk).")
+    print("\nOptional: a database link from the OLD database to the NEW database.")
+    print("  With a link (or when both schemas are on the same database) row differences are computed server-side.")
+    db_link = input("  DB Link Name (leave blank if none): ").strip()
+
+    print("\nSpecify a chunk size: the number of rows fetched per database round trip.")
+    print("  Larger values (up to ~50000 for narrow tables) trade memory for throughput;")
+    print("  keep it lower for very wide rows.")
     chunk_size_str = input("  Chunk Size (e.g. 10000): ").strip()
     chunk_size = int(chunk_size_str) if chunk_size_str.isdigit() else 10000
 
+    print("\nOptional fast mode: skip the full-scan checks (aggregates, joins, values, nulls)")
+    print("  for tables whose optimizer statistics estimate more rows than a limit.")
+    max_scan_rows_str = input("  Max Rows Per Table (leave blank for no limit): ").strip()
+    max_scan_rows = int(max_scan_rows_str) if max_scan_rows_str.isdigit() else None
+
+    print("\nSpecify how many tables to validate in parallel (one session per database each).")
+    workers_str = input(f"  Parallel Workers (e.g. {MAX_WORKERS}): ").strip()
+    workers = int(workers_str) if workers_str.isdigit() and int(workers_str) > 0 else MAX_WORKERS
+
     return {
         "old_db_config": {
             "user": old_db_user,
@@ -40,32 +88,256 @@ def prompt_user_for_info():
             "dsn": new_db_dsn,
             "schema": new_schema_name
         },
-        "chunk_size": chunk_size
+        "db_link": db_link,
+        "chunk_size": chunk_size,
+        "max_scan_rows": max_scan_rows,
+        "workers": workers
     }
 
 ###############################################################################
 # Database Connection Helpers
 ###############################################################################
 
+def init_session(connection, requested_tag=None):
+    """
+    Session setup run once for every new connection (also used as the pool's
+    session callback).
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(f"ALTER SESSION SET SESSION_CACHED_CURSORS = {SESSION_CACHED_CURSORS}")
+
 def get_oracle_connection(db_config):
     try:
         connection = oracledb.connect(
             user=db_config["user"],
             password=db_config["password"],
-            dsn=db_config["dsn"]
+            dsn=db_config["dsn"],
+            sdu=SDU_SIZE,
+            stmtcachesize=STATEMENT_CACHE_SIZE
         )
+        init_session(connection)
         return connection
     except oracledb.DatabaseError as e:
         print(f"[ERROR] Connection failed: {e}")
         raise
 
+def get_oracle_pool(db_config, min_sessions=MAX_WORKERS, max_sessions=MAX_WORKERS + 3):
+    """
+    Creates a session pool so each worker thread can use its own connection.
+    acquire() waits for a free session once all of them are in use.
+    """
+    try:
+        pool = oracledb.create_pool(
+            user=db_config["user"],
+            password=db_config["password"],
+            dsn=db_config["dsn"],
+            min=min_sessions,
+            max=max_sessions,
+            increment=1,
+            getmode=oracledb.POOL_GETMODE_WAIT,
+            sdu=SDU_SIZE,
+            stmtcachesize=STATEMENT_CACHE_SIZE,
+            session_callback=init_session
+        )
+        return pool
+    except oracledb.DatabaseError as e:
+        print(f"[ERROR] Connection pool creation failed: {e}")
+        raise
+
 def close_connection(connection):
+    """
+    Closes a connection or a session pool.
+    """
     try:
         if connection:
             connection.close()
     except Exception as e:
         print(f"[ERROR] Closing connection: {e}")
 
+def set_fetch_size(chunk_size):
+    """
+    Makes `chunk_size` the number of rows every cursor fetches per round trip,
+    including cursors created without make_bulk_cursor.
+    """
+    oracledb.defaults.arraysize = chunk_size
+    oracledb.defaults.prefetchrows = chunk_size + 1
+
+def make_bulk_cursor(connection, arraysize=None):
+    """
+    Returns a cursor tuned for multi-row fetches.
+    The driver default arraysize of 100 costs one round trip per 100 rows;
+    prefetchrows is arraysize + 1 so a result that fits in one batch needs
+    no extra round trip to detect the end of the fetch.
+    Without `arraysize`, the run's chunk size (see set_fetch_size) is used.
+    """
+    if arraysize is None:
+        arraysize = oracledb.defaults.arraysize
+    cursor = connection.cursor()
+    cursor.arraysize = arraysize
+    cursor.prefetchrows = arraysize + 1
+    return cursor
+
+def stream_batches(cursor, chunk_size=10000):
+    """
+    Yields the rows of an executed cursor as lists of up to `chunk_size` rows,
+    one list per round trip.
+    """
+    while True:
+        rows = cursor.fetchmany(chunk_size)
+        if not rows:
+            break
+        yield rows
+
+def stream_rows(cursor, chunk_size=10000):
+    """
+    Yields the rows of an executed cursor, fetching `chunk_size` rows at a time.
+    """
+    for rows in stream_batches(cursor, chunk_size):
+        yield from rows
+
+###############################################################################
+# Parallel Execution Helpers
+###############################################################################
+
+_workers = MAX_WORKERS
+
+def run_per_table(tables, process_table, max_workers=None):
+    """
+    Runs process_table(table) for every table on a bounded thread pool of
+    `max_workers` threads (the run's parallelism by default, see set_parallelism).
+    The driver releases the GIL while waiting on the database, so tables are
+    validated concurrently. Results are yielded in the order of `tables`.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers or _workers) as executor:
+        yield from executor.map(process_table, tables)
+
+# Runs the new-database half of a two-sided query while the calling thread
+# runs the old-database half. Side tasks never submit work themselves, so
+# workers waiting on them cannot deadlock.
+_SIDE_EXECUTOR = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+
+def query_both_sides(old_call, new_call):
+    """
+    Runs old_call() and new_call() concurrently, since they wait on different
+    databases. Returns (old_result, new_result); an error on either side is raised.
+    """
+    future = _SIDE_EXECUTOR.submit(new_call)
+    try:
+        old_result = old_call()
+    finally:
+        # The new-side session must not go back to the pool while still in use
+        wait([future])
+    return old_result, future.result()
+
+def set_parallelism(workers):
+    """
+    Sets how many tables are validated at once and sizes the side-query pool
+    to match. Session pools should allow at least `workers` sessions per database.
+    """
+    global _workers, _SIDE_EXECUTOR
+    _workers = workers
+    _SIDE_EXECUTOR.shutdown(wait=False)
+    _SIDE_EXECUTOR = ThreadPoolExecutor(max_workers=workers)
+
+def fetch_one(connection, query):
+    """
+    Executes a query and returns its first row.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(query)
+        return cursor.fetchone()
+
+class SpooledRows:
+    """
+    Collects the CSV rows of one table in a temporary file, so a worker thread
+    can write them while it compares and the report can append them in table
+    order once the table is done.
+    """
+    def __init__(self):
+        self._file = tempfile.TemporaryFile("w+", newline="", buffering=1 << 20)
+        self._writer = csv.writer(self._file)
+
+    def writerow(self, row):
+        self._writer.writerow(row)
+
+    def copy_to(self, file):
+        # seek() flushes the pending buffer first
+        self._file.seek(0)
+        shutil.copyfileobj(self._file, file)
+
+    def close(self):
+        self._file.close()
+
+###############################################################################
+# CSV Report Helpers
+###############################################################################
+
+class ValidationReport:
+    """
+    Writes a validation CSV while results are still coming in.
+    Discrepancy rows go straight to the file; detailed comparison rows are
+    spooled to a temporary file and appended below the "Detailed Comparison
+    Below" banner when the report is closed, so neither section is held in memory.
+    Rows are tuples in `fieldnames` (or `detail_fieldnames`) order.
+    """
+    def __init__(self, path, fieldnames, detail_fieldnames=None):
+        self.path = path
+        self.fieldnames = fieldnames
+        # The detailed section gets its own header only when its columns differ
+        self.detail_fieldnames = detail_fieldnames
+        self.discrepancy_count = 0
+        # Worker threads may write rows directly
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        self._file = open(self.path, "w", newline="", buffering=1 << 20)
+        # Plain csv.writer: positional rows skip DictWriter's per-field lookups
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(self.fieldnames)
+        self._detail_file = tempfile.TemporaryFile("w+", newline="", buffering=1 << 20)
+        self._detail_writer = csv.writer(self._detail_file)
+        return self
+
+    def _banner(self, text=""):
+        # Marker rows keep the full width of the discrepancy columns
+        self._writer.writerow((text,) + ("",) * (len(self.fieldnames) - 1))
+
+    def add_discrepancy(self, row):
+        with self._lock:
+            self._writer.writerow(row)
+            self.discrepancy_count += 1
+
+    def add_spooled_discrepancies(self, spool, count):
+        # Rows a worker spooled for one table, appended in one piece
+        with self._lock:
+            spool.copy_to(self._file)
+            self.discrepancy_count += count
+
+    def add_detail(self, row):
+        with self._lock:
+            self._detail_writer.writerow(row)
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if not self.discrepancy_count:
+                self._banner("No discrepancies noted")
+
+            # Add blank lines for separation
+            self._banner()
+            self._banner()
+
+            # Detailed comparison
+            self._banner("Detailed Comparison Below")
+            self._banner()
+            if self.detail_fieldnames:
+                self._writer.writerow(self.detail_fieldnames)
+            self._detail_file.seek(0)
+            shutil.copyfileobj(self._detail_file, self._file)
+        finally:
+            self._detail_file.close()
+            self._file.close()
+        return False
+
 ###############################################################################
 # Helper Functions for Tables, Schemas, PK
 ###############################################################################
@@ -77,17 +349,96 @@ def get_table_list(connection, schema_name):
         WHERE owner = UPPER(:schema_param)
         ORDER BY table_name
     """
-    cursor = connection.cursor()
-    cursor.execute(query, schema_param=schema_name)
-    tables = [row[0] for row in cursor.fetchall()]
-    cursor.close()
+    with make_bulk_cursor(connection) as cursor:
+        cursor.execute(query, schema_param=schema_name)
+        tables = [row[0] for row in cursor.fetchall()]
     return tables
 
+def diff_table_lists(old_tables, new_tables):
+    """
+    Splits two table lists into (missing, extra, common) in one merge pass:
+    tables only in the old list, only in the new list, and in both.
+    get_table_list already returns names in order; sorting again is linear on
+    sorted input and guards against a non-binary NLS_SORT on either database.
+    """
+    old_tables = sorted(old_tables)
+    new_tables = sorted(new_tables)
+    missing, extra, common = [], [], []
+    i = j = 0
+    while i < len(old_tables) and j < len(new_tables):
+        if old_tables[i] == new_tables[j]:
+            common.append(old_tables[i])
+            i += 1
+            j += 1
+        elif old_tables[i] < new_tables[j]:
+            missing.append(old_tables[i])
+            i += 1
+        else:
+            extra.append(new_tables[j])
+            j += 1
+    missing.extend(old_tables[i:])
+    extra.extend(new_tables[j:])
+    return missing, extra, common
+
+# Table metadata cache: (dsn, SCHEMA, TABLE) -> columns / primary key columns.
+# Every validation step asks for the same tables, so each is looked up once per run.
+_schema_cache = {}
+_primary_key_cache = {}
+
+def _metadata_key(connection, schema_name, table_name):
+    return (connection.dsn, schema_name.upper(), table_name.upper())
+
+def load_schema_metadata(connection, schema_name):
+    """
+    Fetches the columns and primary keys of every table in the schema in two
+    queries and fills the metadata cache, so later per-table lookups need no
+    round trip to the data dictionary.
+    """
+    columns_query = """
+        SELECT table_name, column_name, data_type, data_length
+        FROM all_tab_columns
+        WHERE owner = UPPER(:schema_param)
+        ORDER BY table_name, column_id
+    """
+    pk_query = """
+        SELECT ac.table_name, acc.column_name
+        FROM all_constraints ac
+        JOIN all_cons_columns acc
+             ON ac.owner = acc.owner
+            AND ac.constraint_name = acc.constraint_name
+        WHERE ac.owner = UPPER(:schema_param)
+          AND ac.constraint_type = 'P'
+        ORDER BY ac.table_name, acc.position
+    """
+    schemas = {}
+    primary_keys = {}
+    cursor = make_bulk_cursor(connection)
+    try:
+        cursor.execute(columns_query, schema_param=schema_name)
+        for table_name, col_name, data_type, data_length in cursor:
+            schemas.setdefault(table_name, {})[col_name] = (data_type, data_length)
+            primary_keys.setdefault(table_name, [])
+
+        cursor.execute(pk_query, schema_param=schema_name)
+        for table_name, col_name in cursor:
+            primary_keys.setdefault(table_name, []).append(col_name)
+    finally:
+        cursor.close()
+
+    for table_name, schema in schemas.items():
+        _schema_cache[_metadata_key(connection, schema_name, table_name)] = schema
+    for table_name, columns in primary_keys.items():
+        _primary_key_cache[_metadata_key(connection, schema_name, table_name)] = columns
+
 def get_table_schema(connection, schema_name, table_name):
     """
     Retrieves a dictionary of column_name -> (data_type, data_length) for the given table.
-    Uses Oracle's ALL_TAB_COLUMNS view.
+    Uses Oracle's ALL_TAB_COLUMNS view; results are cached per table.
     """
+    key = _metadata_key(connection, schema_name, table_name)
+    if key in _schema_cache:
+        return dict(_schema_cache[key])
+
     query = """
         SELECT column_name, data_type, data_length
         FROM all_tab_columns
@@ -95,21 +446,25 @@ def get_table_schema(connection, schema_name, table_name):
           AND table_name = UPPER(:table_param)
         ORDER BY column_id
     """
-    cursor = connection.cursor()
-    cursor.execute(query, schema_param=schema_name, table_param=table_name)
-    schema = {}
-    for row in cursor.fetchall():
-        col_name, data_type, data_length = row
-        # Store (data_type, data_length) if needed, e.g., {"CUSTOMER_ID": ("NUMBER", 22)}
-        schema[col_name] = (data_type, data_length)
-    cursor.close()
-    return schema
+    with make_bulk_cursor(connection) as cursor:
+        cursor.execute(query, schema_param=schema_name, table_param=table_name)
+        schema = {}
+        for row in cursor.fetchall():
+            col_name, data_type, data_length = row
+            # Store (data_type, data_length) if needed, e.g., {"CUSTOMER_ID": ("NUMBER", 22)}
+            schema[col_name] = (data_type, data_length)
+    _schema_cache[key] = schema
+    return dict(schema)
 
 def get_primary_key_columns(connection, schema_name, table_name):
     """
     Returns a list of primary key column names for the given table (Oracle).
-    If the table has no primary key, returns an empty list.
+    If the table has no primary key, returns an empty list. Results are cached per table.
     """
+    key = _metadata_key(connection, schema_name, table_name)
+    if key in _primary_key_cache:
+        return list(_primary_key_cache[key])
+
     query = """
         SELECT acc.column_name
         FROM all_constraints ac
@@ -121,23 +476,24 @@ def get_primary_key_columns(connection, schema_name, table_name):
           AND ac.constraint_type = 'P'
         ORDER BY acc.position
     """
-    cursor = connection.cursor()
-    cursor.execute(query, schema_param=schema_name, table_param=table_name)
-    columns = [row[0] for row in cursor.fetchall()]
-    cursor.close()
-    return columns
+    with make_bulk_cursor(connection) as cursor:
+        cursor.execute(query, schema_param=schema_name, table_param=table_name)
+        columns = [row[0] for row in cursor.fetchall()]
+    _primary_key_cache[key] = columns
+    return list(columns)
 
 ###############################################################################
 # Original get_table_data (Used By Original Value-by-Value Comparison)
 ###############################################################################
 
-def get_table_data(connection, schema_name, table_name):
+def get_table_data(connection, schema_name, table_name, chunk_size=10000):
     """
-    Original helper function (unchanged).
+    Original helper function.
     Fetches all rows (SELECT *), returns (columns, rows).
+    Rows are fetched `chunk_size` at a time per round trip.
     """
     query = f"SELECT * FROM {schema_name}.{table_name}"
-    cursor = connection.cursor()
+    cursor = make_bulk_cursor(connection, chunk_size)
     try:
         cursor.execute(query)
         columns = [desc[0] for desc in cursor.description]
@@ -153,320 +509,275 @@ def get_table_data(connection, schema_name, table_name):
 # Count Validation (SELECT COUNT(*))
 ###############################################################################
 
-def count_validation(old_conn, new_conn, old_schema, new_schema, results_dir):
+def get_row_estimates(connection, schema_name):
+    """
+    Returns table -> row count estimate from the optimizer statistics
+    (ALL_TAB_STATISTICS) in one query. Estimates can be stale, so they are only
+    used to pick tables to skip in fast mode, never as counts.
+    """
+    query = """
+        SELECT table_name, num_rows
+        FROM all_tab_statistics
+        WHERE owner = UPPER(:schema_param)
+          AND object_type = 'TABLE'
+          AND num_rows IS NOT NULL
+    """
+    cursor = make_bulk_cursor(connection)
+    try:
+        cursor.execute(query, schema_param=schema_name)
+        return dict(cursor.fetchall())
+    finally:
+        cursor.close()
+
+# Names that are safe to splice into SQL unquoted
+SIMPLE_IDENTIFIER = re.compile(r"^[A-Z][A-Z0-9_$#]*$")
+
+def get_row_counts(connection, schema_name, tables, batch_size=200):
+    """
+    Counts the rows of many tables with one UNION ALL statement per
+    `batch_size` tables instead of one COUNT(*) round trip per table.
+    Batches are kept small enough to stay well below Oracle's statement size limit.
+    If a batch fails, its tables are counted one by one so a single bad table
+    does not hide the others. Table names that are not plain identifiers are
+    reported as errors rather than spliced into the statement.
+    Returns (counts, errors): table -> row count, and table -> error message.
+    """
+    counts = {}
+    errors = {}
+    for table in tables:
+        if not SIMPLE_IDENTIFIER.match(table):
+            errors[table] = f"Unsupported table name '{table}' (not a plain identifier)"
+    tables = sorted(table for table in tables if table not in errors)
+
+    # One cursor for every batch (and any per-table retries)
+    with make_bulk_cursor(connection, batch_size) as cursor:
+        for i in range(0, len(tables), batch_size):
+            batch = tables[i:i + batch_size]
+            query = " UNION ALL ".join(
+                f"SELECT '{table}', COUNT(*) FROM {schema_name}.{table}" for table in batch
+            )
+            try:
+                cursor.execute(query)
+                counts.update(dict(cursor.fetchall()))
+            except oracledb.DatabaseError:
+                for table in batch:
+                    try:
+                        cursor.execute(f"SELECT COUNT(*) FROM {schema_name}.{table}")
+                        counts[table] = cursor.fetchone()[0]
+                    except oracledb.DatabaseError as e:
+                        errors[table] = str(e)
+
+    return counts, errors
+
+def count_validation(old_pool, new_pool, old_schema, new_schema, results_dir, table_diff=None):
     """
     Validates table existence, row counts, and total cell counts
     (rows * columns) between the old and new databases.
+    Common tables are counted concurrently, one pooled session per side per worker.
+    `table_diff` is an optional (missing, extra, common) result of diff_table_lists
+    already computed by the caller.
+    Returns the set of common tables that are empty in both databases.
     Discrepancies and a detailed comparison are saved to a CSV file.
     """
     count_validation_csv = os.path.join(results_dir, "count_validation.csv")
-    discrepancies = []
-    detailed_comparison = []
-
-    old_tables = get_table_list(old_conn, old_schema)
-    new_tables = get_table_list(new_conn, new_schema)
-
-    # Identify missing and extra tables
-    missing_tables = set(old_tables) - set(new_tables)
-    extra_tables = set(new_tables) - set(old_tables)
-
-    for table in missing_tables:
-        discrepancies.append({
-            "Type": "Missing Table",
-            "Table": table,
-            "Old Row Count": "",
-            "New Row Count": "",
-            "Old Column Count": "",
-            "New Column Count": "",
-            "Old Total Values": "",
-            "New Total Values": "",
-            "Details": "Table is missing in the new database."
-        })
-
-    for table in extra_tables:
-        discrepancies.append({
-            "Type": "Extra Table",
-            "Table": table,
-            "Old Row Count": "",
-            "New Row Count": "",
-            "Old Column Count": "",
-            "New Column Count": "",
-            "Old Total Values": "",
-            "New Total Values": "",
-            "Details": "Table is extra in the new database."
-        })
-
-    # Compare row counts and total cell counts for common tables
-    common_tables = set(old_tables).intersection(new_tables)
-    for table in common_tables:
-        try:
-            # Get row count from old DB
-            old_cursor = old_conn.cursor()
-            old_cursor.execute(f"SELECT COUNT(*) FROM {old_schema}.{table}")
-            old_row_count = old_cursor.fetchone()[0]
-            old_cursor.close()
-
-            # Get row count from new DB
-            new_cursor = new_conn.cursor()
-            new_cursor.execute(f"SELECT COUNT(*) FROM {new_schema}.{table}")
-            new_row_count = new_cursor.fetchone()[0]
-            new_cursor.close()
-
-            # Get column count from old DB schema
-            old_table_def = get_table_schema(old_conn, old_schema, table)
-            old_col_count = len(old_table_def)
-
-            # Get column count from new DB schema
-            new_table_def = get_table_schema(new_conn, new_schema, table)
-            new_col_count = len(new_table_def)
-
-            # Compute total cell count (row_count * col_count)
-            old_total_values = old_row_count * old_col_count
-            new_total_values = new_row_count * new_col_count
-
-            # Check row count mismatch
-            if old_row_count != new_row_count:
-                discrepancies.append({
-                    "Type": "Row Count Mismatch",
-                    "Table": table,
-                    "Old Row Count": old_row_count,
-                    "New Row Count": new_row_count,
-                    "Old Column Count": old_col_count,
-                    "New Column Count": new_col_count,
-                    "Old Total Values": old_total_values,
-                    "New Total Values": new_total_values,
-                    "Details": f"Row counts do not match: Old={old_row_count}, New={new_row_count}"
-                })
-
-            # Check total cell-count mismatch
-            if old_total_values != new_total_values:
-                discrepancies.append({
-                    "Type": "Total Value Count Mismatch",
-                    "Table": table,
-                    "Old Row Count": old_row_count,
-                    "New Row Count": new_row_count,
-                    "Old Column Count": old_col_count,
-                    "New Column Count": new_col_count,
-                    "Old Total Values": old_total_values,
-                    "New Total Values": new_total_values,
-                    "Details": (
-                        f"Mismatch in total values (rows*columns): "
-                        f"Old={old_total_values}, New={new_total_values}"
+    fieldnames = [
+        "Type", "Table",
+        "Old Row Count", "New Row Count",
+        "Old Column Count", "New Column Count",
+        "Old Total Values", "New Total Values",
+        "Details"
+    ]
+
+    with ValidationReport(count_validation_csv, fieldnames) as report:
+        # Identify missing, extra and common tables
+        if table_diff is None:
+            with old_pool.acquire() as old_conn, new_pool.acquire() as new_conn:
+                table_diff = diff_table_lists(get_table_list(old_conn, old_schema), get_table_list(new_conn, new_schema))
+        missing_tables, extra_tables, common_tables = table_diff
+
+        for table in missing_tables:
+            report.add_discrepancy((
+                "Missing Table", table, "", "", "", "", "", "",
+                "Table is missing in the new database."
+            ))
+
+        for table in extra_tables:
+            report.add_discrepancy((
+                "Extra Table", table, "", "", "", "", "", "",
+                "Table is extra in the new database."
+            ))
+
+        # Compare row counts and total cell counts for common tables
+        # Row counts for every common table, a few statements per database
+        with old_pool.acquire() as old_conn, new_pool.acquire() as new_conn:
+            (old_counts, old_errors), (new_counts, new_errors) = query_both_sides(
+                lambda: get_row_counts(old_conn, old_schema, common_tables),
+                lambda: get_row_counts(new_conn, new_schema, common_tables)
+            )
+
+        def process_table(table):
+            table_discrepancies = []
+            detail = None
+            count_error = old_errors.get(table) or new_errors.get(table)
+            if count_error:
+                table_discrepancies.append((
+                    "Database Error", table, "N/A", "N/A", "N/A", "N/A", "", "",
+                    count_error
+                ))
+                return table_discrepancies, detail
+
+            try:
+                with old_pool.acquire() as old_conn, new_pool.acquire() as new_conn:
+                    old_row_count = old_counts[table]
+                    new_row_count = new_counts[table]
+
+                    # Get column count from old DB schema
+                    old_table_def = get_table_schema(old_conn, old_schema, table)
+                    old_col_count = len(old_table_def)
+
+                    # Get column count from new DB schema
+                    new_table_def = get_table_schema(new_conn, new_schema, table)
+                    new_col_count = len(new_table_def)
+
+                    # Compute total cell count (row_count * col_count)
+                    old_total_values = old_row_count * old_col_count
+                    new_total_values = new_row_count * new_col_count
+
+                    # Check row count mismatch
+                    if old_row_count != new_row_count:
+                        table_discrepancies.append((
+                            "Row Count Mismatch",
+                            table,
+                            old_row_count,
+                            new_row_count,
+                            old_col_count,
+                            new_col_count,
+                            old_total_values,
+                            new_total_values,
+                            f"Row counts do not match: Old={old_row_count}, New={new_row_count}"
+                        ))
+
+                    # Check total cell-count mismatch
+                    if old_total_values != new_total_values:
+                        table_discrepancies.append((
+                            "Total Value Count Mismatch",
+                            table,
+                            old_row_count,
+                            new_row_count,
+                            old_col_count,
+                            new_col_count,
+                            old_total_values,
+                            new_total_values,
+                            (
+                                f"Mismatch in total values (rows*columns): "
+                                f"Old={old_total_values}, New={new_total_values}"
+                            )
+                        ))
+
+                    # Add to detailed comparison for each table
+                    detail = (
+                        "Detailed Comparison",
+                        table,
+                        old_row_count,
+                        new_row_count,
+                        old_col_count,
+                        new_col_count,
+                        old_total_values,
+                        new_total_values,
+                        "OK"
                     )
-                })
-
-            # Add to detailed comparison for each table
-            detailed_comparison.append({
-                "Table": table,
-                "Old Row Count": old_row_count,
-                "New Row Count": new_row_count,
-                "Old Column Count": old_col_count,
-                "New Column Count": new_col_count,
-                "Old Total Values": old_total_values,
-                "New Total Values": new_total_values,
-                "Details": "OK"
-            })
 
-        except oracledb.DatabaseError as e:
-            discrepancies.append({
-                "Type": "Database Error",
-                "Table": table,
-                "Old Row Count": "N/A",
-                "New Row Count": "N/A",
-                "Old Column Count": "N/A",
-                "New Column Count": "N/A",
-                "Old Total Values": "",
-                "New Total Values": "",
-                "Details": str(e)
-            })
-
-    # Write CSV
-    with open(count_validation_csv, "w", newline="") as f:
-        fieldnames = [
-            "Type", "Table",
-            "Old Row Count", "New Row Count",
-            "Old Column Count", "New Column Count",
-            "Old Total Values", "New Total Values",
-            "Details"
-        ]
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-
-        # Discrepancies first
-        if discrepancies:
-            writer.writerows(discrepancies)
-        else:
-            writer.writerow({
-                "Type": "No discrepancies noted",
-                "Table": "",
-                "Old Row Count": "",
-                "New Row Count": "",
-                "Old Column Count": "",
-                "New Column Count": "",
-                "Old Total Values": "",
-                "New Total Values": "",
-                "Details": ""
-            })
-
-        writer.writerow({})
-        writer.writerow({})
-
-        # Detailed comparison
-        writer.writerow({
-            "Type": "Detailed Comparison Below",
-            "Table": "",
-            "Old Row Count": "",
-            "New Row Count": "",
-            "Old Column Count": "",
-            "New Column Count": "",
-            "Old Total Values": "",
-            "New Total Values": "",
-            "Details": ""
-        })
-        writer.writerow({})
-        for row in detailed_comparison:
-            row_out = {
-                "Type": "Detailed Comparison",
-                "Table": row["Table"],
-                "Old Row Count": row["Old Row Count"],
-                "New Row Count": row["New Row Count"],
-                "Old Column Count": row["Old Column Count"],
-                "New Column Count": row["New Column Count"],
-                "Old Total Values": row["Old Total Values"],
-                "New Total Values": row["New Total Values"],
-                "Details": row["Details"]
-            }
-            writer.writerow(row_out)
+            except oracledb.DatabaseError as e:
+                table_discrepancies.append((
+                    "Database Error", table, "N/A", "N/A", "N/A", "N/A", "", "",
+                    str(e)
+                ))
+
+            return table_discrepancies, detail
+
+        for table_discrepancies, detail in run_per_table(common_tables, process_table):
+            for row in table_discrepancies:
+                report.add_discrepancy(row)
+            if detail:
+                report.add_detail(detail)
 
     print(f"[INFO] Count validation saved to {count_validation_csv}")
+    return {table for table in common_tables if old_counts.get(table) == 0 and new_counts.get(table) == 0}
 
 
 ###############################################################################
 # Schema Validation
 ###############################################################################
 
-def schema_validation(old_conn, new_conn, old_schema, new_schema, results_dir):
+def schema_validation(old_conn, new_conn, old_schema, new_schema, results_dir, table_diff=None):
     schema_validation_csv = os.path.join(results_dir, "schema_validation.csv")
-    discrepancies = []
-    detailed_comparison = []
-
-    old_tables = get_table_list(old_conn, old_schema)
-    new_tables = get_table_list(new_conn, new_schema)
-    common_tables = set(old_tables).intersection(new_tables)
-
-    for table in common_tables:
-        old_schema_def = get_table_schema(old_conn, old_schema, table)
-        new_schema_def = get_table_schema(new_conn, new_schema, table)
-
-        old_cols = set(old_schema_def.keys())
-        new_cols = set(new_schema_def.keys())
-
-        missing_cols = old_cols - new_cols
-        extra_cols = new_cols - old_cols
-
-        # Missing
-        for col in missing_cols:
-            dt, ln = old_schema_def.get(col, ("Unknown", ""))
-            discrepancies.append({
-                "Type": "Missing Column",
-                "Table": table,
-                "Column": col,
-                "Old Data Type": dt,
-                "Old Length": ln,
-                "New Data Type": "",
-                "New Length": "",
-                "Details": f"Column '{col}' is missing in new DB."
-            })
-
-        # Extra
-        for col in extra_cols:
-            dt, ln = new_schema_def.get(col, ("Unknown", ""))
-            discrepancies.append({
-                "Type": "Extra Column",
-                "Table": table,
-                "Column": col,
-                "Old Data Type": "",
-                "Old Length": "",
-                "New Data Type": dt,
-                "New Length": ln,
-                "Details": f"Column '{col}' is extra in new DB."
-            })
-
-        # Intersection: Check data type mismatch
-        intersect_cols = old_cols.intersection(new_cols)
-        for col in intersect_cols:
-            if old_schema_def[col] != new_schema_def[col]:
-                discrepancies.append({
-                    "Type": "Data Type Mismatch",
-                    "Table": table,
-                    "Column": col,
-                    "Old Data Type": old_schema_def[col][0],
-                    "Old Length": old_schema_def[col][1],
-                    "New Data Type": new_schema_def[col][0],
-                    "New Length": new_schema_def[col][1],
-                    "Details": f"Column '{col}' type differs."
-                })
-
-        # Detailed
-        union_cols = old_cols.union(new_cols)
-        for col in union_cols:
-            old_dt, old_ln = old_schema_def.get(col, ("Missing", "N/A"))
-            new_dt, new_ln = new_schema_def.get(col, ("Missing", "N/A"))
-            status = "Match"
-            if (col in missing_cols or col in extra_cols or
-                (old_dt, old_ln) != (new_dt, new_ln)):
-                status = "Discrepancy"
-
-            detailed_comparison.append({
-                "Type": "Detailed Comparison",
-                "Table": table,
-                "Column": col,
-                "Old Data Type": old_dt,
-                "Old Length": old_ln,
-                "New Data Type": new_dt,
-                "New Length": new_ln,
-                "Details": status
-            })
-
-    with open(schema_validation_csv, "w", newline="") as f:
-        fieldnames = [
-            "Type", "Table", "Column",
-            "Old Data Type", "Old Length",
-            "New Data Type", "New Length",
-            "Details"
-        ]
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-
-        if discrepancies:
-            writer.writerows(discrepancies)
-        else:
-            writer.writerow({
-                "Type": "No discrepancies noted",
-                "Table": "",
-                "Column": "",
-                "Old Data Type": "",
-                "Old Length": "",
-                "New Data Type": "",
-                "New Length": "",
-                "Details": ""
-            })
-
-        writer.writerow({})
-        writer.writerow({})
-
-        writer.writerow({
-            "Type": "Detailed Comparison Below",
-            "Table": "",
-            "Column": "",
-            "Old Data Type": "",
-            "Old Length": "",
-            "New Data Type": "",
-            "New Length": "",
-            "Details": ""
-        })
-        writer.writerow({})
-        writer.writerows(detailed_comparison)
+    fieldnames = [
+        "Type", "Table", "Column",
+        "Old Data Type", "Old Length",
+        "New Data Type", "New Length",
+        "Details"
+    ]
+
+    with ValidationReport(schema_validation_csv, fieldnames) as report:
+        if table_diff is None:
+            table_diff = diff_table_lists(get_table_list(old_conn, old_schema), get_table_list(new_conn, new_schema))
+        _, _, common_tables = table_diff
+
+        for table in common_tables:
+            old_schema_def = get_table_schema(old_conn, old_schema, table)
+            new_schema_def = get_table_schema(new_conn, new_schema, table)
+
+            old_cols = set(old_schema_def.keys())
+            new_cols = set(new_schema_def.keys())
+
+            missing_cols = old_cols - new_cols
+            extra_cols = new_cols - old_cols
+
+            # Missing
+            for col in missing_cols:
+                dt, ln = old_schema_def.get(col, ("Unknown", ""))
+                report.add_discrepancy((
+                    "Missing Column", table, col, dt, ln, "", "",
+                    f"Column '{col}' is missing in new DB."
+                ))
+
+            # Extra
+            for col in extra_cols:
+                dt, ln = new_schema_def.get(col, ("Unknown", ""))
+                report.add_discrepancy((
+                    "Extra Column", table, col, "", "", dt, ln,
+                    f"Column '{col}' is extra in new DB."
+                ))
+
+            # Intersection: Check data type mismatch
+            intersect_cols = old_cols.intersection(new_cols)
+            for col in intersect_cols:
+                if old_schema_def[col] != new_schema_def[col]:
+                    report.add_discrepancy((
+                        "Data Type Mismatch",
+                        table,
+                        col,
+                        old_schema_def[col][0],
+                        old_schema_def[col][1],
+                        new_schema_def[col][0],
+                        new_schema_def[col][1],
+                        f"Column '{col}' type differs."
+                    ))
+
+            # Detailed
+            union_cols = old_cols.union(new_cols)
+            for col in union_cols:
+                old_dt, old_ln = old_schema_def.get(col, ("Missing", "N/A"))
+                new_dt, new_ln = new_schema_def.get(col, ("Missing", "N/A"))
+                status = "Match"
+                if (col in missing_cols or col in extra_cols or
+                    (old_dt, old_ln) != (new_dt, new_ln)):
+                    status = "Discrepancy"
+
+                report.add_detail((
+                    "Detailed Comparison", table, col, old_dt, old_ln, new_dt, new_ln,
+                    status
+                ))
 
     print(f"[INFO] Schema validation saved to {schema_validation_csv}")
 
@@ -474,201 +785,773 @@ def schema_validation(old_conn, new_conn, old_schema, new_schema, results_dir):
 # Aggregate Function Validation
 ###############################################################################
 
-def aggregate_function_validation(old_conn, new_conn, old_schema, new_schema, tables, results_dir):
+def aggregate_function_validation(old_pool, new_pool, old_schema, new_schema, tables, results_dir,
+                                  skipped_tables=None):
+    """
+    Compares SUM and AVG of every numeric column of each table.
+    `skipped_tables` maps tables that were not scanned to the reason, which is
+    listed in the detailed comparison.
+    """
     aggregate_csv = os.path.join(results_dir, "aggregate_function_validation.csv")
-    discrepancies = []
-    detailed_comparison = []
-
-    for table in tables:
-        print(f"[INFO] Performing aggregate function validation for table '{table}'...")
+    fieldnames = [
+        "Type", "Table", "Column", "Old SUM",
+        "New SUM", "Old AVG", "New AVG", "Details"
+    ]
+
+    with ValidationReport(aggregate_csv, fieldnames) as report:
+        def process_table(table):
+            table_discrepancies = []
+            table_details = []
+            print(f"[INFO] Performing aggregate function validation for table '{table}'...")
+
+            with old_pool.acquire() as old_conn, new_pool.acquire() as new_conn:
+                old_table_schema = get_table_schema(old_conn, old_schema, table)
+                new_table_schema = get_table_schema(new_conn, new_schema, table)
+
+                numerical_columns = [
+                    c for c, (dt, _) in old_table_schema.items()
+                    if dt in ("NUMBER", "FLOAT", "DECIMAL")
+                       and c in new_table_schema
+                       and new_table_schema[c][0] in ("NUMBER", "FLOAT", "DECIMAL")
+                ]
 
-        old_table_schema = get_table_schema(old_conn, old_schema, table)
-        new_table_schema = get_table_schema(new_conn, new_schema, table)
+                if not numerical_columns:
+                    return table_discrepancies, table_details
 
-        numerical_columns = [
-            c for c, (dt, _) in old_table_schema.items()
-            if dt in ("NUMBER", "FLOAT", "DECIMAL")
-               and c in new_table_schema
-               and new_table_schema[c][0] in ("NUMBER", "FLOAT", "DECIMAL")
-        ]
+                # One scan per side: SUM/AVG of every numeric column in a single SELECT
+                select_list = ", ".join(f"SUM({c}), AVG({c})" for c in numerical_columns)
 
-        for col in numerical_columns:
-            try:
-                old_cursor = old_conn.cursor()
-                old_cursor.execute(f"SELECT SUM({col}), AVG({col}) FROM {old_schema}.{table}")
-                old_sum, old_avg = old_cursor.fetchone()
-                old_cursor.close()
-
-                new_cursor = new_conn.cursor()
-                new_cursor.execute(f"SELECT SUM({col}), AVG({col}) FROM {new_schema}.{table}")
-                new_sum, new_avg = new_cursor.fetchone()
-                new_cursor.close()
-
-                if old_sum != new_sum or old_avg != new_avg:
-                    discrepancies.append({
-                        "Type": "Aggregate Mismatch",
-                        "Table": table,
-                        "Column": col,
-                        "Old SUM": old_sum,
-                        "New SUM": new_sum,
-                        "Old AVG": old_avg,
-                        "New AVG": new_avg,
-                        "Details": (
-                            f"Mismatch: Old SUM={old_sum}, New SUM={new_sum}, "
-                            f"Old AVG={old_avg}, New AVG={new_avg}"
+                try:
+                    # Both databases scan at the same time
+                    old_row, new_row = query_both_sides(
+                        lambda: fetch_one(old_conn, f"SELECT {select_list} FROM {old_schema}.{table}"),
+                        lambda: fetch_one(new_conn, f"SELECT {select_list} FROM {new_schema}.{table}")
+                    )
+                except Exception as e:
+                    for col in numerical_columns:
+                        table_discrepancies.append((
+                            "Error", table, col, "", "", "", "",
+                            str(e)
+                        ))
+                    return table_discrepancies, table_details
+
+                for i, col in enumerate(numerical_columns):
+                    old_sum, old_avg = old_row[2 * i], old_row[2 * i + 1]
+                    new_sum, new_avg = new_row[2 * i], new_row[2 * i + 1]
+
+                    if old_sum != new_sum or old_avg != new_avg:
+                        table_discrepancies.append((
+                            "Aggregate Mismatch", table, col, old_sum, new_sum, old_avg, new_avg,
+                            (
+                                f"Mismatch: Old SUM={old_sum}, New SUM={new_sum}, "
+                                f"Old AVG={old_avg}, New AVG={new_avg}"
+                            )
+                        ))
+
+                    table_details.append((
+                        "Detailed Comparison", table, col, old_sum, new_sum, old_avg, new_avg,
+                        (
+                            "Match" if (old_sum == new_sum and old_avg == new_avg)
+                            else "Mismatch"
                         )
-                    })
-
-                detailed_comparison.append({
-                    "Type": "Detailed Comparison",
-                    "Table": table,
-                    "Column": col,
-                    "Old SUM": old_sum,
-                    "New SUM": new_sum,
-                    "Old AVG": old_avg,
-                    "New AVG": new_avg,
-                    "Details": "Match" if (old_sum == new_sum and old_avg == new_avg)
-                               else "Mismatch"
-                })
-
-            except Exception as e:
-                discrepancies.append({
-                    "Type": "Error",
-                    "Table": table,
-                    "Column": col,
-                    "Old SUM": "",
-                    "New SUM": "",
-                    "Old AVG": "",
-                    "New AVG": "",
-                    "Details": str(e)
-                })
-
-    with open(aggregate_csv, "w", newline="") as f:
-        fieldnames = [
-            "Type", "Table", "Column", "Old SUM",
-            "New SUM", "Old AVG", "New AVG", "Details"
-        ]
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-
-        if discrepancies:
-            writer.writerows(discrepancies)
-        else:
-            writer.writerow({
-                "Type": "No discrepancies noted",
-                "Table": "",
-                "Column": "",
-                "Old SUM": "",
-                "New SUM": "",
-                "Old AVG": "",
-                "New AVG": "",
-                "Details": ""
-            })
-
-        writer.writerow({})
-        writer.writerow({})
-
-        writer.writerow({
-            "Type": "Detailed Comparison Below",
-            "Table": "",
-            "Column": "",
-            "Old SUM": "",
-            "New SUM": "",
-            "Old AVG": "",
-            "New AVG": "",
-            "Details": ""
-        })
-        writer.writerow({})
-        writer.writerows(detailed_comparison)
+                    ))
+
+            return table_discrepancies, table_details
+
+        for table_discrepancies, table_details in run_per_table(tables, process_table):
+            for row in table_discrepancies:
+                report.add_discrepancy(row)
+            for row in table_details:
+                report.add_detail(row)
+
+        for table, reason in sorted((skipped_tables or {}).items()):
+            report.add_detail(("Skipped", table, "", "", "", "", "", reason))
 
     print(f"[INFO] Aggregate function validation saved to {aggregate_csv}")
 
 ###############################################################################
-# The ORIGINAL Value-by-Value Comparison (UNMODIFIED)
+# Keyed Row Fetch Helpers
 ###############################################################################
 
-def value_by_value_comparison(old_conn, new_conn, old_schema, new_schema, tables, results_dir):
+def fetch_key_set(connection, schema_name, table_name, key_cols, arraysize=50000):
     """
-    Performs a value-by-value comparison between old and new databases.
-    Only discrepancies are included in the CSV file. No detailed comparison.
-    Results are saved to a CSV file.
+    Returns the set of key tuples of a table, fetching only the key columns.
     """
-    value_comparison_csv = os.path.join(results_dir, "value_comparison.csv")
-    discrepancies = []
+    cursor = make_bulk_cursor(connection, arraysize)
+    try:
+        cursor.execute(f"SELECT {', '.join(key_cols)} FROM {schema_name}.{table_name}")
+        keys = set()
+        for rows in stream_batches(cursor, arraysize):
+            keys.update(rows)
+        return keys
+    finally:
+        cursor.close()
 
-    for table in tables:
-        print(f"[INFO] Performing value-by-value comparison for table '{table}'...")
+def fetch_rows_by_key(connection, schema_name, table_name, columns, key_cols, keys, batch_size=1000):
+    """
+    Yields the rows (in `columns` order) whose key is in `keys`; `columns` may
+    also hold SQL expressions.
+    Keys are looked up at most 1000 at a time with bind variables, which keeps
+    each IN list within Oracle's limit of 1000 expressions. An IN list never
+    matches NULL, so keys holding a NULL are looked up one at a time with
+    IS NULL for those columns.
+    """
+    keys = list(keys)
+    null_keys = [key for key in keys if None in key]
+    if null_keys:
+        keys = [key for key in keys if None not in key]
+    batch_size = min(batch_size, 1000)
+    width = len(key_cols)
+    key_expr = key_cols[0] if width == 1 else f"({', '.join(key_cols)})"
+    cursor = make_bulk_cursor(connection, batch_size)
+    try:
+        for key in null_keys:
+            conditions = []
+            binds = []
+            for col, value in zip(key_cols, key):
+                if value is None:
+                    conditions.append(f"{col} IS NULL")
+                else:
+                    binds.append(value)
+                    conditions.append(f"{col} = :{len(binds)}")
+            cursor.execute(
+                f"SELECT {', '.join(columns)} FROM {schema_name}.{table_name} "
+                f"WHERE {' AND '.join(conditions)}",
+                binds
+            )
+            yield from stream_rows(cursor, batch_size)
+
+        for i in range(0, len(keys), batch_size):
+            batch = keys[i:i + batch_size]
+            if width == 1:
+                placeholders = ", ".join(f":{j + 1}" for j in range(len(batch)))
+            else:
+                placeholders = ", ".join(
+                    "(" + ", ".join(f":{j * width + k + 1}" for k in range(width)) + ")"
+                    for j in range(len(batch))
+                )
+            cursor.execute(
+                f"SELECT {', '.join(columns)} FROM {schema_name}.{table_name} "
+                f"WHERE {key_expr} IN ({placeholders})",
+                [value for key in batch for value in key]
+            )
+            yield from stream_rows(cursor, batch_size)
+    finally:
+        cursor.close()
+
+###############################################################################
+# Value-by-Value Comparison (Streaming)
+###############################################################################
 
-        # Original approach: fetch all data, store in dicts, compare
-        old_columns, old_data = get_table_data(old_conn, old_schema, table)
-        new_columns, new_data = get_table_data(new_conn, new_schema, table)
+# Column order of value_comparison.csv; comparison rows are written as tuples in this order
+VALUE_COMPARISON_FIELDS = ("Type", "Table", "Column", "Row Key", "Old Value", "New Value", "Details")
+
+def remote_table(schema_name, table_name, db_link=""):
+    """
+    Returns the name of a NEW-database table as seen from the OLD connection.
+    """
+    table_ref = f"{schema_name}.{table_name}"
+    return f"{table_ref}@{db_link}" if db_link else table_ref
+
+def row_key_getter(indexes):
+    """
+    Returns a function that extracts the key tuple at `indexes` from a row.
+    operator.itemgetter does the extraction in C instead of building a tuple
+    from a generator for every fetched row.
+    """
+    indexes = list(indexes)
+    if len(indexes) == 1:
+        getter = itemgetter(indexes[0])
+        return lambda row: (getter(row),)
+    return itemgetter(*indexes)
+
+# Entries a primary key index holds in memory before it moves to disk
+INDEX_SPILL_ROWS = 5000000
+
+class KeyHashIndex:
+    """
+    Primary key -> row digest map used by the row comparisons.
+    Entries are kept in a dict until there are more than `spill_rows` of them;
+    the index then moves to a SQLite file in the temp directory, so a very large
+    table pages to disk instead of exhausting memory.
+    """
+    def __init__(self, spill_rows=INDEX_SPILL_ROWS):
+        self.spill_rows = spill_rows
+        self._entries = {}
+        self._db = None
+        self._path = None
+
+    def _spill(self):
+        fd, self._path = tempfile.mkstemp(suffix=".sqlite")
+        os.close(fd)
+        self._db = sqlite3.connect(self._path)
+        # Scratch data: no journal and no fsync
+        self._db.execute("PRAGMA journal_mode = OFF")
+        self._db.execute("PRAGMA synchronous = OFF")
+        self._db.execute("CREATE TABLE h (pk BLOB PRIMARY KEY, h INTEGER) WITHOUT ROWID")
+        self.update(self._entries.items())
+        self._entries = {}
+
+    def update(self, pairs):
+        if self._db is None:
+            self._entries.update(pairs)
+            if len(self._entries) > self.spill_rows:
+                self._spill()
+        else:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO h VALUES (?, ?)",
+                ((pickle.dumps(key), value) for key, value in pairs)
+            )
+
+    def pop(self, key, default=None):
+        if self._db is None:
+            return self._entries.pop(key, default)
+        pk = pickle.dumps(key)
+        row = self._db.execute("SELECT h FROM h WHERE pk = ?", (pk,)).fetchone()
+        if row is None:
+            return default
+        self._db.execute("DELETE FROM h WHERE pk = ?", (pk,))
+        return row[0]
+
+    def __contains__(self, key):
+        if self._db is None:
+            return key in self._entries
+        return self._db.execute("SELECT 1 FROM h WHERE pk = ?", (pickle.dumps(key),)).fetchone() is not None
+
+    def __len__(self):
+        if self._db is None:
+            return len(self._entries)
+        return self._db.execute("SELECT COUNT(*) FROM h").fetchone()[0]
+
+    def __iter__(self):
+        if self._db is None:
+            return iter(list(self._entries))
+        return (pickle.loads(pk) for (pk,) in self._db.execute("SELECT pk FROM h"))
+
+    def close(self):
+        self._entries = {}
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+            os.remove(self._path)
+
+def row_digest(row):
+    """
+    Returns a fixed-size fingerprint of a fetched row, so the comparison
+    index holds one integer per row instead of the row itself.
+    """
+    return hash(row)
+
+def compare_table_values(old_conn, new_conn, old_schema, new_schema, table, writer, chunk_size=10000):
+    """
+    Streams one table from both databases and writes its discrepancies.
+    The old side is indexed by primary key -> row digest (or row digest -> count
+    when the table has no primary key); the new side is probed against it.
+    Old rows are re-streamed only when something is missing or changed.
+    Returns the number of discrepancy rows written.
+    """
+    written = 0
+    old_index = None
+    old_query = f"SELECT * FROM {old_schema}.{table}"
+    new_query = f"SELECT * FROM {new_schema}.{table}"
+    old_cursor = make_bulk_cursor(old_conn, chunk_size)
+    new_cursor = make_bulk_cursor(new_conn, chunk_size)
+
+    try:
+        old_cursor.execute(old_query)
+        new_cursor.execute(new_query)
+        old_columns = [desc[0] for desc in old_cursor.description]
+        new_columns = [desc[0] for desc in new_cursor.description]
 
         # Check if column structures match
         if old_columns != new_columns:
-            discrepancies.append({
-                "Type": "Column Structure Mismatch",
-                "Table": table,
-                "Details": f"Column structure differs: Old({old_columns}) vs New({new_columns})"
-            })
-            continue
+            writer.writerow((
+                "Column Structure Mismatch", table, "", "", "", "",
+                f"Column structure differs: Old({old_columns}) vs New({new_columns})"
+            ))
+            return 1
+
+        # Key rows by primary key when every PK column is present
+        pk_cols = get_primary_key_columns(old_conn, old_schema, table)
+        pk_idx = [old_columns.index(col) for col in pk_cols if col in old_columns]
+
+        if pk_cols and len(pk_idx) == len(pk_cols):
+            row_key = row_key_getter(pk_idx)
+
+            # Pass 1: index the old table as PK -> row digest, a fetched batch at a time
+            old_index = KeyHashIndex()
+            for rows in stream_batches(old_cursor, chunk_size):
+                old_index.update(zip(map(row_key, rows), map(row_digest, rows)))
+
+            # Pass 2: probe with the new table; keep only the changed new rows
+            changed_rows = {}
+            for row in stream_rows(new_cursor, chunk_size):
+                key = row_key(row)
+                old_digest = old_index.pop(key, None)
+                if old_digest is None:
+                    writer.writerow((
+                        "Extra Row in New", table, "", "", "", "",
+                        f"Row extra in the new database: {row}"
+                    ))
+                    written += 1
+                elif old_digest != row_digest(row):
+                    changed_rows[key] = row
+
+            # Pass 3: re-stream the old table to report missing and changed rows
+            # (old_index now only holds keys that never appeared in the new table)
+            if old_index or changed_rows:
+                old_cursor.execute(old_query)
+                for old_row in stream_rows(old_cursor, chunk_size):
+                    key = row_key(old_row)
+                    if key in old_index:
+                        writer.writerow((
+                            "Missing Row in New", table, "", "", "", "",
+                            f"Row missing in the new database: {old_row}"
+                        ))
+                        written += 1
+                        continue
+
+                    new_row = changed_rows.get(key)
+                    if new_row is None:
+                        continue
+                    for col_idx, column in enumerate(old_columns):
+                        if old_row[col_idx] != new_row[col_idx]:
+                            writer.writerow((
+                                "Cell Value Mismatch", table, column, key, old_row[col_idx], new_row[col_idx],
+                                f"Mismatch in column '{column}' for key {key}: "
+                                f"Old({old_row[col_idx]}) vs New({new_row[col_idx]})"
+                            ))
+                            written += 1
+        else:
+            # No usable primary key: compare rows as a multiset of digests
+            old_counts = Counter()
+            for rows in stream_batches(old_cursor, chunk_size):
+                old_counts.update(map(row_digest, rows))
+
+            for row in stream_rows(new_cursor, chunk_size):
+                digest = row_digest(row)
+                count = old_counts.get(digest, 0)
+                if count > 1:
+                    old_counts[digest] = count - 1
+                elif count == 1:
+                    del old_counts[digest]
+                else:
+                    writer.writerow((
+                        "Extra Row in New", table, "", "", "", "",
+                        f"Row extra in the new database: {row}"
+                    ))
+                    written += 1
+
+            # Whatever is left in old_counts never appeared in the new table
+            if old_counts:
+                old_cursor.execute(old_query)
+                for row in stream_rows(old_cursor, chunk_size):
+                    digest = row_digest(row)
+                    count = old_counts.get(digest, 0)
+                    if not count:
+                        continue
+                    if count > 1:
+                        old_counts[digest] = count - 1
+                    else:
+                        del old_counts[digest]
+                    writer.writerow((
+                        "Missing Row in New", table, "", "", "", "",
+                        f"Row missing in the new database: {row}"
+                    ))
+                    written += 1
+
+    except oracledb.DatabaseError as e:
+        print(f"[ERROR] Unable to compare data for {table}: {e}")
+    finally:
+        old_cursor.close()
+        new_cursor.close()
+        if old_index is not None:
+            old_index.close()
+
+    return written
+
+def compare_table_values_server_side(old_conn, new_conn, old_schema, new_schema, table, writer,
+                                     chunk_size=10000, db_link=""):
+    """
+    Lets the OLD database compute the row differences with MINUS, so only
+    rows that differ are sent to Python. Needs the new table to be visible from
+    the old connection (same database, or through `db_link`).
+    A row present in both MINUS results under the same primary key is a
+    changed row and is reported cell by cell.
+    Returns the number of discrepancy rows written.
+    """
+    old_columns = list(get_table_schema(old_conn, old_schema, table).keys())
+    new_columns = list(get_table_schema(new_conn, new_schema, table).keys())
+
+    # Check if column structures match
+    if old_columns != new_columns:
+        writer.writerow((
+            "Column Structure Mismatch", table, "", "", "", "",
+            f"Column structure differs: Old({old_columns}) vs New({new_columns})"
+        ))
+        return 1
+
+    col_str = ", ".join(old_columns)
+    old_ref = f"{old_schema}.{table}"
+    new_ref = remote_table(new_schema, table, db_link)
+    missing_query = f"SELECT {col_str} FROM {old_ref} MINUS SELECT {col_str} FROM {new_ref}"
+    extra_query = f"SELECT {col_str} FROM {new_ref} MINUS SELECT {col_str} FROM {old_ref}"
+
+    pk_cols = get_primary_key_columns(old_conn, old_schema, table)
+    pk_idx = [old_columns.index(col) for col in pk_cols if col in old_columns]
+    use_pk = bool(pk_cols) and len(pk_idx) == len(pk_cols)
+    row_key = row_key_getter(pk_idx) if use_pk else None
+
+    written = 0
+    cursor = make_bulk_cursor(old_conn, chunk_size)
+    try:
+        # Rows of the old table with no identical row in the new table
+        cursor.execute(missing_query)
+        missing_rows = {}
+        for row in stream_rows(cursor, chunk_size):
+            if use_pk:
+                missing_rows[row_key(row)] = row
+            else:
+                writer.writerow((
+                    "Missing Row in New", table, "", "", "", "",
+                    f"Row missing in the new database: {row}"
+                ))
+                written += 1
+
+        # Rows of the new table with no identical row in the old table
+        cursor.execute(extra_query)
+        for new_row in stream_rows(cursor, chunk_size):
+            key = row_key(new_row) if use_pk else None
+            old_row = missing_rows.pop(key, None) if use_pk else None
+            if old_row is None:
+                writer.writerow((
+                    "Extra Row in New", table, "", "", "", "",
+                    f"Row extra in the new database: {new_row}"
+                ))
+                written += 1
+                continue
 
-        # Convert data to dictionaries for comparison
-        old_data_dict = {tuple(row): row for row in old_data}
-        new_data_dict = {tuple(row): row for row in new_data}
-
-        # Find missing rows in the new database
-        missing_in_new = set(old_data_dict.keys()) - set(new_data_dict.keys())
-        for missing_row in missing_in_new:
-            discrepancies.append({
-                "Type": "Missing Row in New",
-                "Table": table,
-                "Details": f"Row missing in the new database: {old_data_dict[missing_row]}"
-            })
-
-        # Find extra rows in the new database
-        extra_in_new = set(new_data_dict.keys()) - set(old_data_dict.keys())
-        for extra_row in extra_in_new:
-            discrepancies.append({
-                "Type": "Extra Row in New",
-                "Table": table,
-                "Details": f"Row extra in the new database: {new_data_dict[extra_row]}"
-            })
-
-        # Check for mismatched values in rows with the same keys
-        common_keys = set(old_data_dict.keys()).intersection(new_data_dict.keys())
-        for key in common_keys:
-            old_row = old_data_dict[key]
-            new_row = new_data_dict[key]
             for col_idx, column in enumerate(old_columns):
                 if old_row[col_idx] != new_row[col_idx]:
-                    discrepancies.append({
-                        "Type": "Cell Value Mismatch",
-                        "Table": table,
-                        "Column": column,
-                        "Row Key": key,
-                        "Old Value": old_row[col_idx],
-                        "New Value": new_row[col_idx],
-                        "Details": f"Mismatch in column '{column}' for key {key}: "
-                                   f"Old({old_row[col_idx]}) vs New({new_row[col_idx]})"
-                    })
-
-    # Save only discrepancies to CSV
-    with open(value_comparison_csv, "w", newline="") as f:
-        writer = csv.DictWriter(f,
-                                fieldnames=["Type", "Table", "Column", "Row Key", "Old Value", "New Value", "Details"])
-        writer.writeheader()
-        if discrepancies:
-            writer.writerows(discrepancies)
+                    writer.writerow((
+                        "Cell Value Mismatch", table, column, key, old_row[col_idx], new_row[col_idx],
+                        f"Mismatch in column '{column}' for key {key}: "
+                        f"Old({old_row[col_idx]}) vs New({new_row[col_idx]})"
+                    ))
+                    written += 1
+
+        # PKs left over exist only in the old table
+        for old_row in missing_rows.values():
+            writer.writerow((
+                "Missing Row in New", table, "", "", "", "",
+                f"Row missing in the new database: {old_row}"
+            ))
+            written += 1
+    finally:
+        cursor.close()
+
+    return written
+
+# Column types whose text form is exact and short enough to concatenate for ORA_HASH
+# (DATE and TIMESTAMP columns are formatted separately in column_text_expressions)
+HASHABLE_TYPES = ("VARCHAR2", "NVARCHAR2", "CHAR", "NCHAR", "NUMBER", "FLOAT",
+                  "BINARY_FLOAT", "BINARY_DOUBLE", "RAW")
+
+def column_text_expressions(table_schema):
+    """
+    Returns the text form of every column of a table, or None when a column
+    type (e.g. LOBs, LONG, XMLTYPE) cannot be concatenated.
+    Dates and timestamps are formatted explicitly so the session NLS settings
+    cannot hide a difference in the time part. Numbers and RAW are converted
+    explicitly too, so a column fetched on its own reads exactly as it does
+    inside a concatenation.
+    """
+    parts = []
+    for col, (data_type, _) in table_schema.items():
+        if data_type == "DATE":
+            parts.append(f"TO_CHAR({col}, 'YYYY-MM-DD HH24:MI:SS')")
+        elif data_type.startswith("TIMESTAMP"):
+            tz = " TZR" if "TIME ZONE" in data_type else ""
+            parts.append(f"TO_CHAR({col}, 'YYYY-MM-DD HH24:MI:SS.FF9{tz}')")
+        elif data_type == "RAW":
+            parts.append(f"RAWTOHEX({col})")
+        elif data_type in HASHABLE_TYPES:
+            parts.append(col if "CHAR" in data_type else f"TO_CHAR({col})")
+        else:
+            return None
+    return parts
+
+def row_text_expression(table_schema):
+    """
+    Builds a concatenation of every column of a table that no two different
+    rows share: each value is prefixed with its length and NULL is written as
+    N, so neither a "|" inside a value nor an empty string can shift columns.
+    Returns None when a column cannot be concatenated.
+    """
+    parts = column_text_expressions(table_schema)
+    if parts is None:
+        return None
+    return " || ".join(f"NVL2({part}, LENGTH({part}) || ':' || {part}, 'N')" for part in parts)
+
+def row_hash_expression(table_schema):
+    """
+    Builds a 64-bit hash of every column of a table from two 32-bit ORA_HASH
+    values with different seeds, or returns None when a column type cannot be
+    hashed this way (see row_text_expression).
+    """
+    text = row_text_expression(table_schema)
+    if text is None:
+        return None
+    return f"(ORA_HASH({text}, 4294967295, 0) * 4294967296 + ORA_HASH({text}, 4294967295, 1))"
+
+def compare_table_values_by_hash(old_conn, new_conn, old_schema, new_schema, table, writer, chunk_size=10000):
+    """
+    Lets each database hash its own rows, so only (primary key, hash) pairs
+    cross the network. Full rows are fetched only for keys whose hashes differ
+    or that exist on one side, and are then compared cell by cell.
+    Returns the number of discrepancy rows written, or None when the table has
+    no primary key or a column that cannot be hashed.
+    """
+    old_table_schema = get_table_schema(old_conn, old_schema, table)
+    new_table_schema = get_table_schema(new_conn, new_schema, table)
+    old_columns = list(old_table_schema.keys())
+    new_columns = list(new_table_schema.keys())
+
+    # Check if column structures match
+    if old_columns != new_columns:
+        writer.writerow((
+            "Column Structure Mismatch", table, "", "", "", "",
+            f"Column structure differs: Old({old_columns}) vs New({new_columns})"
+        ))
+        return 1
+
+    pk_cols = get_primary_key_columns(old_conn, old_schema, table)
+    old_hash = row_hash_expression(old_table_schema)
+    new_hash = row_hash_expression(new_table_schema)
+    if not pk_cols or any(col not in old_columns for col in pk_cols) or not old_hash or not new_hash:
+        return None
+
+    key_str = ", ".join(pk_cols)
+    width = len(pk_cols)
+
+    hash_key = row_key_getter(range(width))
+    row_hash = itemgetter(width)
+    old_hashes = KeyHashIndex()
+    # Each cursor is closed even when the other side's query fails
+    try:
+        with make_bulk_cursor(old_conn, chunk_size) as old_cursor, make_bulk_cursor(new_conn, chunk_size) as new_cursor:
+            def index_old_hashes():
+                # Old side: primary key -> row hash
+                old_cursor.execute(f"SELECT {key_str}, {old_hash} FROM {old_schema}.{table}")
+                for rows in stream_batches(old_cursor, chunk_size):
+                    old_hashes.update(zip(map(hash_key, rows), map(row_hash, rows)))
+
+            # The new database starts its scan (and first prefetch) while the old
+            # side is being indexed
+            query_both_sides(
+                index_old_hashes,
+                lambda: new_cursor.execute(f"SELECT {key_str}, {new_hash} FROM {new_schema}.{table}")
+            )
+
+            # New side: probe against the old hashes
+            extra_keys = []
+            changed_keys = []
+            for row in stream_rows(new_cursor, chunk_size):
+                key = hash_key(row)
+                old_value = old_hashes.pop(key, None)
+                if old_value is None:
+                    extra_keys.append(key)
+                elif old_value != row[width]:
+                    changed_keys.append(key)
+
+            # Keys left over exist only in the old table
+            missing_keys = list(old_hashes)
+    finally:
+        old_hashes.close()
+
+    return report_keyed_differences(
+        old_conn, new_conn, old_schema, new_schema, table, old_columns, pk_cols,
+        missing_keys, extra_keys, changed_keys, writer
+    )
+
+def compare_table_values_by_hash_server_side(old_conn, new_conn, old_schema, new_schema, table, writer,
+                                             chunk_size=10000, db_link=""):
+    """
+    Lets the OLD database diff (primary key, row hash) pairs of both tables
+    with MINUS, so only the keys of differing rows reach Python, and through
+    `db_link` only keys and hashes cross the link instead of whole rows.
+    Returns the number of discrepancy rows written, or None when the table has
+    no primary key or a column that cannot be hashed.
+    """
+    old_table_schema = get_table_schema(old_conn, old_schema, table)
+    new_table_schema = get_table_schema(new_conn, new_schema, table)
+    old_columns = list(old_table_schema.keys())
+    new_columns = list(new_table_schema.keys())
+
+    # Check if column structures match
+    if old_columns != new_columns:
+        writer.writerow((
+            "Column Structure Mismatch", table, "", "", "", "",
+            f"Column structure differs: Old({old_columns}) vs New({new_columns})"
+        ))
+        return 1
+
+    pk_cols = get_primary_key_columns(old_conn, old_schema, table)
+    old_hash = row_hash_expression(old_table_schema)
+    new_hash = row_hash_expression(new_table_schema)
+    if not pk_cols or any(col not in old_columns for col in pk_cols) or not old_hash or not new_hash:
+        return None
+
+    key_str = ", ".join(pk_cols)
+    old_pairs = f"SELECT {key_str}, {old_hash} FROM {old_schema}.{table}"
+    new_pairs = f"SELECT {key_str}, {new_hash} FROM {remote_table(new_schema, table, db_link)}"
+    hash_key = row_key_getter(range(len(pk_cols)))
+
+    with make_bulk_cursor(old_conn, chunk_size) as cursor:
+        # Old keys that are missing in the new table or whose row differs
+        cursor.execute(f"{old_pairs} MINUS {new_pairs}")
+        old_diff = {hash_key(row) for row in stream_rows(cursor, chunk_size)}
+
+        # New keys that are extra or whose row differs
+        cursor.execute(f"{new_pairs} MINUS {old_pairs}")
+        new_diff = {hash_key(row) for row in stream_rows(cursor, chunk_size)}
+
+    changed = old_diff & new_diff
+    return report_keyed_differences(
+        old_conn, new_conn, old_schema, new_schema, table, old_columns, pk_cols,
+        list(old_diff - changed), list(new_diff - changed), list(changed), writer
+    )
+
+def report_keyed_differences(old_conn, new_conn, old_schema, new_schema, table, columns, pk_cols,
+                             missing_keys, extra_keys, changed_keys, writer):
+    """
+    Fetches full rows only for the keys that need reporting and writes them:
+    rows missing in the new table, extra rows, and changed rows cell by cell.
+    Returns the number of discrepancy rows written.
+    """
+    written = 0
+    row_key = row_key_getter(columns.index(col) for col in pk_cols)
+    changed = set(changed_keys)
+
+    # Full rows only for the keys that need reporting
+    changed_old_rows = {}
+    for row in fetch_rows_by_key(old_conn, old_schema, table, columns, pk_cols, missing_keys + changed_keys):
+        key = row_key(row)
+        if key in changed:
+            changed_old_rows[key] = row
         else:
-            writer.writerow({
-                "Type": "No discrepancies noted",
-                "Table": "",
-                "Column": "",
-                "Row Key": "",
-                "Old Value": "",
-                "New Value": "",
-                "Details": ""
-            })
+            writer.writerow((
+                "Missing Row in New", table, "", "", "", "",
+                f"Row missing in the new database: {row}"
+            ))
+            written += 1
+
+    for new_row in fetch_rows_by_key(new_conn, new_schema, table, columns, pk_cols, extra_keys + changed_keys):
+        key = row_key(new_row)
+        old_row = changed_old_rows.pop(key, None) if key in changed else None
+        if old_row is None:
+            if key not in changed:
+                writer.writerow((
+                    "Extra Row in New", table, "", "", "", "",
+                    f"Row extra in the new database: {new_row}"
+                ))
+                written += 1
+            continue
+
+        for col_idx, column in enumerate(columns):
+            if old_row[col_idx] != new_row[col_idx]:
+                writer.writerow((
+                    "Cell Value Mismatch", table, column, key, old_row[col_idx], new_row[col_idx],
+                    f"Mismatch in column '{column}' for key {key}: "
+                    f"Old({old_row[col_idx]}) vs New({new_row[col_idx]})"
+                ))
+                written += 1
+
+    return written
+
+def value_by_value_comparison(old_pool, new_pool, old_schema, new_schema, tables, results_dir, chunk_size=10000,
+                              server_side=False, db_link="", skipped_tables=None):
+    """
+    Performs a value-by-value comparison between old and new databases.
+    Only discrepancies are included in the CSV file. No detailed comparison.
+    Rows are streamed `chunk_size` at a time and discrepancies are written
+    to the CSV as they are found, so no table is held in memory in full.
+    With `server_side`, differences are computed by the database with MINUS,
+    over (primary key, row hash) pairs where possible and whole rows otherwise;
+    without it, tables with a primary key are compared by server-side row hashes.
+    The streaming comparison is only used as a fallback.
+    Tables are compared concurrently; each table's rows are spooled and
+    written in table order once it is done.
+    Tables in `skipped_tables` (table -> reason) are listed as skipped.
+    """
+    value_comparison_csv = os.path.join(results_dir, "value_comparison.csv")
+    discrepancy_count = 0
+
+    with open(value_comparison_csv, "w", newline="", buffering=1 << 20) as f:
+        # Plain csv.writer: rows are tuples in VALUE_COMPARISON_FIELDS order,
+        # which skips DictWriter's per-field lookups on large outputs
+        writer = csv.writer(f)
+        writer.writerow(VALUE_COMPARISON_FIELDS)
+
+        def attempt(compare):
+            # Each attempt writes to its own spool, so a comparison that fails
+            # midway leaves no rows behind for the fallback to repeat
+            spool = SpooledRows()
+            try:
+                written = compare(spool)
+            except BaseException:
+                spool.close()
+                raise
+            if written is None:
+                spool.close()
+                return None
+            return written, spool
+
+        def process_table(table):
+            print(f"[INFO] Performing value-by-value comparison for table '{table}'...")
+
+            with old_pool.acquire() as old_conn, new_pool.acquire() as new_conn:
+                if server_side:
+                    try:
+                        result = attempt(lambda table_writer: compare_table_values_by_hash_server_side(
+                            old_conn, new_conn, old_schema, new_schema, table, table_writer, chunk_size, db_link
+                        ))
+                        if result is not None:
+                            return result
+                        return attempt(lambda table_writer: compare_table_values_server_side(
+                            old_conn, new_conn, old_schema, new_schema, table, table_writer, chunk_size, db_link
+                        ))
+                    except oracledb.DatabaseError as e:
+                        # e.g. LOB columns cannot be used with MINUS, or no access to the new schema
+                        print(f"[WARN] Server-side comparison failed for '{table}', streaming instead: {e}")
+
+                else:
+                    try:
+                        result = attempt(lambda table_writer: compare_table_values_by_hash(
+                            old_conn, new_conn, old_schema, new_schema, table, table_writer, chunk_size
+                        ))
+                        if result is not None:
+                            return result
+                    except oracledb.DatabaseError as e:
+                        # e.g. the concatenated row exceeds the VARCHAR2 limit
+                        print(f"[WARN] Row-hash comparison failed for '{table}', streaming instead: {e}")
+
+                return attempt(lambda table_writer: compare_table_values(
+                    old_conn, new_conn, old_schema, new_schema, table, table_writer, chunk_size
+                ))
+
+        for written, spool in run_per_table(tables, process_table):
+            try:
+                spool.copy_to(f)
+            finally:
+                spool.close()
+            discrepancy_count += written
+
+        if not discrepancy_count:
+            writer.writerow(("No discrepancies noted", "", "", "", "", "", ""))
+
+        for table, reason in sorted((skipped_tables or {}).items()):
+            writer.writerow(("Skipped", table, "", "", "", "", reason))
 
     print(f"[INFO] Value-by-value comparison saved to {value_comparison_csv}")
 
@@ -676,337 +1559,317 @@ def value_by_value_comparison(old_conn, new_conn, old_schema, new_schema, tables
 # Null Value Verification (Added Back)
 ###############################################################################
 
-def null_value_verification(old_conn, new_conn, old_schema, new_schema, tables, results_dir):
+def null_value_verification(old_pool, new_pool, old_schema, new_schema, tables, results_dir,
+                            skipped_tables=None):
     """
     Verifies if null values are exactly the same in the old and new databases.
     Discrepancies are noted first, followed by a detailed comparison.
+    Tables in `skipped_tables` (table -> reason) are listed as skipped.
     Results are saved to a CSV file.
     """
     null_csv = os.path.join(results_dir, "null_value_verification.csv")
-    discrepancies = []
-    detailed_comparison = []
+    fieldnames = ["Type", "Table", "Column", "Old Null Count", "New Null Count", "Details"]
+
+    with ValidationReport(null_csv, fieldnames) as report:
+        def process_table(table):
+            table_discrepancies = []
+            table_details = []
+            print(f"[INFO] Performing null value verification for table '{table}'...")
+
+            with old_pool.acquire() as old_conn, new_pool.acquire() as new_conn:
+                # Fetch columns for the table
+                old_table_schema = get_table_schema(old_conn, old_schema, table)
+                new_table_schema = get_table_schema(new_conn, new_schema, table)
+
+                # Identify common columns (in old-schema order, so results align positionally)
+                common_columns = [c for c in old_table_schema if c in new_table_schema]
+                if not common_columns:
+                    return table_discrepancies, table_details
+
+                # One scan per side: COUNT(*) - COUNT(col) is the null count of col
+                # (COUNT(col) skips NULLs, and both are 0 on an empty table)
+                select_list = ", ".join(f"COUNT(*) - COUNT({c})" for c in common_columns)
+
+                try:
+                    # Null count queries for the old and new databases, run concurrently
+                    old_null_counts, new_null_counts = query_both_sides(
+                        lambda: fetch_one(old_conn, f"SELECT {select_list} FROM {old_schema}.{table}"),
+                        lambda: fetch_one(new_conn, f"SELECT {select_list} FROM {new_schema}.{table}")
+                    )
+                except Exception as e:
+                    print(f"[ERROR] Failed to verify null values for table '{table}': {e}")
+                    return table_discrepancies, table_details
+
+                for column, old_null_count, new_null_count in zip(common_columns, old_null_counts, new_null_counts):
+                    # Compare results
+                    if old_null_count != new_null_count:
+                        table_discrepancies.append((
+                            "Null Count Mismatch", table, column, old_null_count, new_null_count,
+                            f"Mismatch in null count for column '{column}' in table '{table}'."
+                        ))
+
+                    # Add detailed comparison
+                    table_details.append((
+                        "Detailed Comparison", table, column, old_null_count, new_null_count,
+                        ""
+                    ))
+
+            return table_discrepancies, table_details
+
+        for table_discrepancies, table_details in run_per_table(tables, process_table):
+            for row in table_discrepancies:
+                report.add_discrepancy(row)
+            for row in table_details:
+                report.add_detail(row)
+
+        for table, reason in sorted((skipped_tables or {}).items()):
+            report.add_detail(("Skipped", table, "", "", "", reason))
 
-    for table in tables:
-        print(f"[INFO] Performing null value verification for table '{table}'...")
+    print(f"[INFO] Null value verification saved to {null_csv}")
 
-        # Fetch columns for the table
-        old_table_schema = get_table_schema(old_conn, old_schema, table)
-        new_table_schema = get_table_schema(new_conn, new_schema, table)
+###############################################################################
+# SQL Join Validation (Primary Key)
+###############################################################################
 
-        # Identify common columns
-        common_columns = set(old_table_schema.keys()).intersection(new_table_schema.keys())
+def format_join_row(values):
+    """
+    Formats one side of a joined row as "|"-separated values, NULL as empty.
+    Cheaper than repr() of the row and keeps the CSV small.
+    """
+    return "|".join("" if v is None else str(v) for v in values)
 
-        for column in common_columns:
-            try:
-                # Null count query for old database
-                old_query = f"SELECT COUNT(*) FROM {old_schema}.{table} WHERE {column} IS NULL"
-                old_cursor = old_conn.cursor()
-                old_cursor.execute(old_query)
-                old_null_count = old_cursor.fetchone()[0]
-                old_cursor.close()
-
-                # Null count query for new database
-                new_query = f"SELECT COUNT(*) FROM {new_schema}.{table} WHERE {column} IS NULL"
-                new_cursor = new_conn.cursor()
-                new_cursor.execute(new_query)
-                new_null_count = new_cursor.fetchone()[0]
-                new_cursor.close()
-
-                # Compare results
-                if old_null_count != new_null_count:
-                    discrepancies.append({
-                        "Type": "Null Count Mismatch",
-                        "Table": table,
-                        "Column": column,
-                        "Old Null Count": old_null_count,
-                        "New Null Count": new_null_count,
-                        "Details": f"Mismatch in null count for column '{column}' in table '{table}'."
-                    })
-
-                # Add detailed comparison
-                detailed_comparison.append({
-                    "Table": table,
-                    "Column": column,
-                    "Old Null Count": old_null_count,
-                    "New Null Count": new_null_count
-                })
-
-            except Exception as e:
-                print(f"[ERROR] Failed to verify null values for table '{table}', column '{column}': {e}")
-
-    # Save to CSV
-    with open(null_csv, "w", newline="") as f:
-        fieldnames = ["Type", "Table", "Column", "Old Null Count", "New Null Count", "Details"]
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-
-        writer.writeheader()
-        if discrepancies:
-            writer.writerows(discrepancies)
+# Longest string the database can build with || (VARCHAR2 limit without
+# extended data types)
+ROW_TEXT_MAX_LENGTH = 4000
+
+def join_row_text(table_schema):
+    """
+    Returns the database-side concatenation of one side of a joined row when
+    every value is sure to fit in a VARCHAR2, or None to fetch plain columns
+    and format them with format_join_row.
+    """
+    parts = column_text_expressions(table_schema)
+    if parts is None:
+        return None
+    width = len(table_schema) - 1
+    for data_type, data_length in table_schema.values():
+        if data_type == "RAW":
+            width += 2 * data_length
+        elif data_type in ("VARCHAR2", "NVARCHAR2", "CHAR", "NCHAR"):
+            width += data_length
+        elif "TIME ZONE" in data_type:
+            # FF9 plus a region name (TZR), e.g. America/Argentina/ComodRivadavia
+            width += 100
         else:
-            writer.writerow({
-                "Type": "No discrepancies noted",
-                "Table": "",
-                "Column": "",
-                "Old Null Count": "",
-                "New Null Count": "",
-                "Details": ""
-            })
-
-        # Add blank lines for separation
-        writer.writerow({})
-        writer.writerow({})
-
-        # Detailed comparison
-        writer.writerow({
-            "Type": "Detailed Comparison Below",
-            "Table": "",
-            "Column": "",
-            "Old Null Count": "",
-            "New Null Count": "",
-            "Details": ""
-        })
-        writer.writerow({})
-        for row in detailed_comparison:
-            writer.writerow({
-                "Type": "Detailed Comparison",
-                "Table": row["Table"],
-                "Column": row["Column"],
-                "Old Null Count": row["Old Null Count"],
-                "New Null Count": row["New Null Count"],
-                "Details": ""
-            })
+            # Formatted numbers, dates and timestamps
+            width += 40
+    return " || '|' || ".join(parts) if width <= ROW_TEXT_MAX_LENGTH else None
 
-    print(f"[INFO] Null value verification saved to {null_csv}")
+def fetch_join_rows(connection, schema_name, table_name, table_schema, key_cols, keys, chunk_size=10000):
+    """
+    Yields one side of the joined row, "|"-formatted, for every key in `keys`.
+    The database builds the string when it fits (see join_row_text); if the
+    concatenation still overflows (ORA-01489), the keys not yet fetched are
+    finished with the same column text fetched one column at a time, so both
+    paths format values alike. Tables with columns that have no text form
+    fall back to the plain columns.
+    """
+    text = join_row_text(table_schema)
+    if text is not None:
+        width = len(key_cols)
+        fetched = set()
+        try:
+            for row in fetch_rows_by_key(connection, schema_name, table_name, list(key_cols) + [text],
+                                         key_cols, keys, chunk_size):
+                fetched.add(row[:width])
+                yield row[width] or ""
+            return
+        except oracledb.DatabaseError as e:
+            print(f"[WARN] Row concatenation failed for '{table_name}', fetching plain columns: {e}")
+            keys = [key for key in keys if key not in fetched]
 
-###############################################################################
-# SQL Join Validation (Primary Key)
-###############################################################################
+    columns = column_text_expressions(table_schema) or list(table_schema.keys())
+    for row in fetch_rows_by_key(connection, schema_name, table_name, columns,
+                                 key_cols, keys, chunk_size):
+        yield format_join_row(row)
+
+def diff_join_keys_server_side(old_conn, old_schema, new_schema, table, key_cols, db_link="", chunk_size=10000):
+    """
+    Lets the OLD database diff the join keys of both tables with MINUS, so only
+    keys present on one side are sent to Python. Needs the new table to be
+    visible from the old connection (same database, or through `db_link`).
+    Keys holding a NULL never match in a join, so they are one-sided even
+    when both tables have them.
+    Returns (old_key_count, new_key_count, old_only_keys, new_only_keys).
+    """
+    key_str = ", ".join(key_cols)
+    old_ref = f"{old_schema}.{table}"
+    new_ref = remote_table(new_schema, table, db_link)
+    has_null = " OR ".join(f"{col} IS NULL" for col in key_cols)
+
+    with make_bulk_cursor(old_conn, chunk_size) as cursor:
+        cursor.execute(
+            f"SELECT (SELECT COUNT(*) FROM (SELECT DISTINCT {key_str} FROM {old_ref})), "
+            f"(SELECT COUNT(*) FROM (SELECT DISTINCT {key_str} FROM {new_ref})) FROM dual"
+        )
+        old_key_count, new_key_count = cursor.fetchone()
+
+        # MINUS treats NULLs as equal, so NULL keys are added back with UNION
+        cursor.execute(
+            f"SELECT {key_str} FROM {old_ref} MINUS SELECT {key_str} FROM {new_ref} "
+            f"UNION SELECT {key_str} FROM {old_ref} WHERE {has_null}"
+        )
+        old_only = [tuple(row) for row in stream_rows(cursor, chunk_size)]
+
+        cursor.execute(
+            f"SELECT {key_str} FROM {new_ref} MINUS SELECT {key_str} FROM {old_ref} "
+            f"UNION SELECT {key_str} FROM {new_ref} WHERE {has_null}"
+        )
+        new_only = [tuple(row) for row in stream_rows(cursor, chunk_size)]
+
+    return old_key_count, new_key_count, old_only, new_only
 
 def sql_join_operation_validation_with_details(
-        old_conn, new_conn, old_schema, new_schema, tables, results_dir
+        old_pool, new_pool, old_schema, new_schema, tables, results_dir, chunk_size=10000,
+        server_side=False, db_link="", skipped_tables=None
 ):
     """
     Performs LEFT, RIGHT, and FULL OUTER JOIN comparisons of each table
-    from old_schema vs new_schema, checking for missing rows and data mismatches.
+    from old_schema vs new_schema, checking for rows missing on either side.
+    Only the join key columns are compared: with `server_side` the old database
+    diffs them with MINUS, otherwise they are fetched from each side and diffed
+    in Python. Full rows are fetched just for keys present on one side and are
+    streamed to the CSV as they are fetched. The "Row" column holds the joined
+    row as "|"-separated old columns then new columns, the missing side empty.
+    Tables in `skipped_tables` (table -> reason) are listed as skipped.
     """
 
     join_validation_csv = os.path.join(results_dir, "sql_join_validation.csv")
-    discrepancies = []
-    detailed_comparison = []
+    fieldnames = ["Type", "Table", "Row", "Join Key", "Details"]
+    detail_fieldnames = [
+        "Type", "Table", "Join Key",
+        "Left Join Rows", "Right Join Rows",
+        "Full Outer Join Rows", "Details"
+    ]
 
     # Make sure results directory exists
     os.makedirs(results_dir, exist_ok=True)
 
-    for table in tables:
-        print(f"[INFO] Performing SQL join operation validation for table '{table}'...")
-
-        try:
-            # Get schema details
-            old_table_schema = get_table_schema(old_conn, old_schema, table)
-            new_table_schema = get_table_schema(new_conn, new_schema, table)
-
-            # Skip if table not found or no columns
-            if not old_table_schema or not new_table_schema:
-                continue
-
-            # Get PK columns, fallback if none
-            pk_cols = get_primary_key_columns(old_conn, old_schema, table)
-            if not pk_cols:
-                pk_cols = [list(old_table_schema.keys())[0]]
-
-            # Build the join condition using PK columns (unquoted)
-            # If your columns might have special chars or mixed case, you'll need quotes.
-            join_condition = " AND ".join([
-                f"o.{col} = n.{col}" for col in pk_cols
-            ])
-            if not join_condition:
-                continue
-
-            # Collect columns
-            old_columns = list(old_table_schema.keys())
-            new_columns = list(new_table_schema.keys())
-
-            # Create SELECT aliases (unquoted)
-            old_col_str = ", ".join([
-                f"o.{col} AS old_{col}" for col in old_columns
-            ])
-            new_col_str = ", ".join([
-                f"n.{col} AS new_{col}" for col in new_columns
-            ])
-
-            # 1) LEFT JOIN
-            left_join_query = f"""
-                SELECT {old_col_str}, {new_col_str}
-                FROM {old_schema}.{table} o
-                LEFT JOIN {new_schema}.{table} n
-                ON {join_condition}
-            """
-            cursor = old_conn.cursor()
-            cursor.execute(left_join_query)
-            left_join_rows = cursor.fetchall()
-            left_join_cols = [desc[0] for desc in cursor.description]
-            cursor.close()
-
-            # 2) RIGHT JOIN
-            right_join_query = f"""
-                SELECT {old_col_str}, {new_col_str}
-                FROM {old_schema}.{table} o
-                RIGHT JOIN {new_schema}.{table} n
-                ON {join_condition}
-            """
-            cursor = new_conn.cursor()
-            cursor.execute(right_join_query)
-            right_join_rows = cursor.fetchall()
-            right_join_cols = [desc[0] for desc in cursor.description]
-            cursor.close()
-
-            # 3) FULL OUTER JOIN
-            full_outer_query = f"""
-                SELECT {old_col_str}, {new_col_str}
-                FROM {old_schema}.{table} o
-                FULL OUTER JOIN {new_schema}.{table} n
-                ON {join_condition}
-            """
-            cursor = new_conn.cursor()
-            cursor.execute(full_outer_query)
-            full_outer_rows = cursor.fetchall()
-            full_outer_cols = [desc[0] for desc in cursor.description]
-            cursor.close()
-
-            # Check for missing rows (Left, Right) & data mismatches (Full)
-            # -- Left Join --
-            for row in left_join_rows:
-                row_dict = dict(zip(left_join_cols, row))
-                null_new_cols = [
-                    col for col in new_columns
-                    if row_dict.get(f"NEW_{col}") is None
-                ]
-                if null_new_cols:
-                    discrepancies.append({
-                        "Type": "Left Join Discrepancy",
-                        "Table": table,
-                        "Row": str(row_dict),
-                        "Join Key": ", ".join(pk_cols),
-                        "Details": f"Row in OLD DB but missing in NEW DB (NULL in {null_new_cols})"
-                    })
-
-            # -- Right Join --
-            for row in right_join_rows:
-                row_dict = dict(zip(right_join_cols, row))
-                null_old_cols = [
-                    col for col in old_columns
-                    if row_dict.get(f"OLD_{col}") is None
-                ]
-                if null_old_cols:
-                    discrepancies.append({
-                        "Type": "Right Join Discrepancy",
-                        "Table": table,
-                        "Row": str(row_dict),
-                        "Join Key": ", ".join(pk_cols),
-                        "Details": f"Row in NEW DB but missing in OLD DB (NULL in {null_old_cols})"
-                    })
-
-            # -- Full Outer Join --
-            for row in full_outer_rows:
-                row_dict = dict(zip(full_outer_cols, row))
-                null_old_cols = [
-                    col for col in old_columns
-                    if row_dict.get(f"OLD_{col}") is None
-                ]
-                null_new_cols = [
-                    col for col in new_columns
-                    if row_dict.get(f"NEW_{col}") is None
-                ]
-
-                if null_old_cols or null_new_cols:
-                    # Entire row is missing on one side
-                    discrepancies.append({
-                        "Type": "Full Outer Join Discrepancy",
-                        "Table": table,
-                        "Row": str(row_dict),
-                        "Join Key": ", ".join(pk_cols),
-                        "Details": (
-                            f"Row missing on one side. "
-                            f"NULL old cols: {null_old_cols}, NULL new cols: {null_new_cols}"
+    with ValidationReport(join_validation_csv, fieldnames, detail_fieldnames) as report:
+        def process_table(table):
+            # One-sided rows are spooled per table so the report keeps table order
+            spool = SpooledRows()
+            discrepancies = 0
+            table_details = []
+            print(f"[INFO] Performing SQL join operation validation for table '{table}'...")
+
+            with old_pool.acquire() as old_conn, new_pool.acquire() as new_conn:
+                try:
+                    # Get schema details
+                    old_table_schema = get_table_schema(old_conn, old_schema, table)
+                    new_table_schema = get_table_schema(new_conn, new_schema, table)
+
+                    # Skip if table not found or no columns
+                    if not old_table_schema or not new_table_schema:
+                        return spool, discrepancies, table_details
+
+                    # Get PK columns, fallback if none
+                    pk_cols = get_primary_key_columns(old_conn, old_schema, table)
+                    if not pk_cols:
+                        pk_cols = [list(old_table_schema.keys())[0]]
+
+                    # Collect columns
+                    old_columns = list(old_table_schema.keys())
+                    new_columns = list(new_table_schema.keys())
+
+                    # Join keys present on one side only are the rows the
+                    # LEFT / RIGHT / FULL OUTER JOINs would have reported
+                    key_diff = None
+                    if server_side:
+                        try:
+                            key_diff = diff_join_keys_server_side(
+                                old_conn, old_schema, new_schema, table, pk_cols, db_link, chunk_size
+                            )
+                        except oracledb.DatabaseError as e:
+                            print(f"[WARN] Server-side key diff failed for '{table}', fetching keys instead: {e}")
+                    if key_diff is None:
+                        old_keys, new_keys = query_both_sides(
+                            lambda: fetch_key_set(old_conn, old_schema, table, pk_cols),
+                            lambda: fetch_key_set(new_conn, new_schema, table, pk_cols)
                         )
-                    })
-                else:
-                    # If both sides exist, compare columns
-                    for col in old_columns:
-                        if col in new_columns:
-                            old_val = row_dict.get(f"OLD_{col}")
-                            new_val = row_dict.get(f"NEW_{col}")
-                            if old_val != new_val:
-                                discrepancies.append({
-                                    "Type": "Data Mismatch",
-                                    "Table": table,
-                                    "Row": str(row_dict),
-                                    "Join Key": ", ".join(pk_cols),
-                                    "Details": (
-                                        f"Column '{col}' mismatch: "
-                                        f"old_value={old_val} vs new_value={new_val}"
-                                    )
-                                })
-
-            # Summaries
-            detailed_comparison.append({
-                "Type": "Detailed Comparison",
-                "Table": table,
-                "Join Key": ", ".join(pk_cols),
-                "Left Join Rows": len(left_join_rows),
-                "Right Join Rows": len(right_join_rows),
-                "Full Outer Join Rows": len(full_outer_rows),
-                "Details": "Join analysis complete"
-            })
-
-        except Exception as e:
-            discrepancies.append({
-                "Type": "Join Error",
-                "Table": table,
-                "Row": "",
-                "Join Key": "",
-                "Details": str(e)
-            })
-
-    # Write CSV
-    with open(join_validation_csv, "w", newline="") as f:
-        fieldnames = ["Type", "Table", "Row", "Join Key", "Details"]
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-
-        if discrepancies:
-            writer.writerows(discrepancies)
-        else:
-            writer.writerow({
-                "Type": "No discrepancies noted",
-                "Table": "",
-                "Row": "",
-                "Join Key": "",
-                "Details": ""
-            })
-
-        # Blank lines
-        writer.writerow({})
-        writer.writerow({})
-
-        # Summaries
-        writer.writerow({
-            "Type": "Detailed Comparison Below",
-            "Table": "",
-            "Row": "",
-            "Join Key": "",
-            "Details": ""
-        })
-        writer.writerow({})
-
-        fieldnames2 = [
-            "Type", "Table", "Join Key",
-            "Left Join Rows", "Right Join Rows",
-            "Full Outer Join Rows", "Details"
-        ]
-        writer2 = csv.DictWriter(f, fieldnames=fieldnames2)
-        writer2.writeheader()
-        writer2.writerows(detailed_comparison)
+                        # Keys holding a NULL never match in a join, like the
+                        # outer joins this replaces: they count as one-sided
+                        key_diff = (
+                            len(old_keys), len(new_keys),
+                            (old_keys - new_keys) | {key for key in old_keys if None in key},
+                            (new_keys - old_keys) | {key for key in new_keys if None in key}
+                        )
+                        del old_keys, new_keys
+                    old_key_count, new_key_count, left_only, right_only = key_diff
+
+                    join_key = ", ".join(pk_cols)
+                    # NULL halves of the joined row, for the side with no match
+                    old_nulls = "|" * len(old_columns)
+                    new_nulls = "|" * len(new_columns)
+
+                    # -- Left Join: row in OLD, no match in NEW --
+                    left_joins = (
+                        ("Left Join Discrepancy",
+                         f"Row in OLD DB but missing in NEW DB (NULL in {new_columns})"),
+                        ("Full Outer Join Discrepancy",
+                         f"Row missing on one side. NULL old cols: [], NULL new cols: {new_columns}"),
+                    )
+                    for old_row in fetch_join_rows(old_conn, old_schema, table, old_table_schema, pk_cols,
+                                                   left_only, chunk_size):
+                        joined_row = old_row + new_nulls
+                        for join_type, details in left_joins:
+                            spool.writerow((join_type, table, joined_row, join_key, details))
+                            discrepancies += 1
+
+                    # -- Right Join: row in NEW, no match in OLD --
+                    right_joins = (
+                        ("Right Join Discrepancy",
+                         f"Row in NEW DB but missing in OLD DB (NULL in {old_columns})"),
+                        ("Full Outer Join Discrepancy",
+                         f"Row missing on one side. NULL old cols: {old_columns}, NULL new cols: []"),
+                    )
+                    for new_row in fetch_join_rows(new_conn, new_schema, table, new_table_schema, pk_cols,
+                                                   right_only, chunk_size):
+                        joined_row = old_nulls + new_row
+                        for join_type, details in right_joins:
+                            spool.writerow((join_type, table, joined_row, join_key, details))
+                            discrepancies += 1
+
+                    # Summaries (row counts the three joins would have returned)
+                    table_details.append((
+                        "Detailed Comparison",
+                        table,
+                        ", ".join(pk_cols),
+                        old_key_count,
+                        new_key_count,
+                        old_key_count + len(right_only),
+                        "Join analysis complete"
+                    ))
+
+                except Exception as e:
+                    spool.writerow((
+                        "Join Error", table, "", "",
+                        str(e)
+                    ))
+                    discrepancies += 1
+
+            return spool, discrepancies, table_details
+
+        for spool, discrepancies, table_details in run_per_table(tables, process_table):
+            try:
+                report.add_spooled_discrepancies(spool, discrepancies)
+            finally:
+                spool.close()
+            for row in table_details:
+                report.add_detail(row)
+
+        for table, reason in sorted((skipped_tables or {}).items()):
+            report.add_detail(("Skipped", table, "", "", "", "", reason))
 
     print(f"[INFO] SQL join operation validation saved to {join_validation_csv}")
 
@@ -1015,30 +1878,37 @@ def sql_join_operation_validation_with_details(
 # Miscellaneous Discrepancies
 ###############################################################################
 
-def get_indexes(connection, schema_name, table_name):
+def get_all_indexes(connection, schema_name):
+    """
+    Returns table -> set of index names for the whole schema in one query.
+    """
     query = """
-      SELECT index_name
+      SELECT table_name, index_name
       FROM all_indexes
       WHERE owner = UPPER(:schema_param)
-        AND table_name = UPPER(:table_param)
     """
-    cursor = connection.cursor()
-    cursor.execute(query, schema_param=schema_name, table_param=table_name)
-    indexes = {row[0] for row in cursor.fetchall()}
-    cursor.close()
+    indexes = {}
+    with make_bulk_cursor(connection) as cursor:
+        cursor.execute(query, schema_param=schema_name)
+        for table_name, index_name in cursor:
+            indexes.setdefault(table_name, set()).add(index_name)
     return indexes
 
-def get_triggers(connection, schema_name, table_name):
+def get_all_triggers(connection, schema_name):
+    """
+    Returns table -> set of trigger names for the whole schema in one query.
+    """
     query = """
-      SELECT trigger_name
+      SELECT table_name, trigger_name
       FROM all_triggers
       WHERE table_owner = UPPER(:schema_param)
-        AND table_name = UPPER(:table_param)
+        AND table_name IS NOT NULL
     """
-    cursor = connection.cursor()
-    cursor.execute(query, schema_param=schema_name, table_param=table_name)
-    triggers = {row[0] for row in cursor.fetchall()}
-    cursor.close()
+    triggers = {}
+    with make_bulk_cursor(connection) as cursor:
+        cursor.execute(query, schema_param=schema_name)
+        for table_name, trigger_name in cursor:
+            triggers.setdefault(table_name, set()).add(trigger_name)
     return triggers
 
 def get_sequences(connection, schema_name):
@@ -1047,10 +1917,9 @@ def get_sequences(connection, schema_name):
       FROM all_sequences
       WHERE sequence_owner = UPPER(:schema_param)
     """
-    cursor = connection.cursor()
-    cursor.execute(query, schema_param=schema_name)
-    sequences = {row[0] for row in cursor.fetchall()}
-    cursor.close()
+    with make_bulk_cursor(connection) as cursor:
+        cursor.execute(query, schema_param=schema_name)
+        sequences = {row[0] for row in cursor.fetchall()}
     return sequences
 
 def get_views(connection, schema_name):
@@ -1059,172 +1928,138 @@ def get_views(connection, schema_name):
       FROM all_views
       WHERE owner = UPPER(:schema_param)
     """
-    cursor = connection.cursor()
-    cursor.execute(query, schema_param=schema_name)
-    views = {row[0] for row in cursor.fetchall()}
-    cursor.close()
+    with make_bulk_cursor(connection) as cursor:
+        cursor.execute(query, schema_param=schema_name)
+        views = {row[0] for row in cursor.fetchall()}
     return views
 
-def miscellaneous_discrepancies(old_conn, new_conn, old_schema, new_schema, results_dir):
+def format_name_set(names, cap=20):
+    """
+    Summarises a set of object names for a Details cell: the count and the
+    first `cap` names in sorted order, so large schemas keep the cell short.
+    """
+    shown = sorted(names)[:cap]
+    more = f", ... +{len(names) - cap} more" if len(names) > cap else ""
+    return f"{len(names)} [" + ", ".join(shown) + more + "]"
+
+def miscellaneous_discrepancies(old_conn, new_conn, old_schema, new_schema, results_dir, table_diff=None):
     misc_csv = os.path.join(results_dir, "table_hygiene_check.csv")
-    discrepancies = []
-    detailed_comparison = []
-
-    old_tables = get_table_list(old_conn, old_schema)
-    new_tables = get_table_list(new_conn, new_schema)
-    missing_tables = set(old_tables) - set(new_tables)
-    extra_tables = set(new_tables) - set(old_tables)
-    common_tables = set(old_tables).intersection(new_tables)
-
-    # Missing/extra tables
-    for t in missing_tables:
-        discrepancies.append({
-            "Type": "Missing Table",
-            "Table": t,
-            "Object": "",
-            "Details": "Table exists in old DB but not in new DB."
-        })
-    for t in extra_tables:
-        discrepancies.append({
-            "Type": "Extra Table",
-            "Table": t,
-            "Object": "",
-            "Details": "Table exists in new DB but not in old DB."
-        })
-
-    # Compare indexes, triggers in common tables
-    for t in common_tables:
-        old_idx = get_indexes(old_conn, old_schema, t)
-        new_idx = get_indexes(new_conn, new_schema, t)
-        missing_idx = old_idx - new_idx
-        extra_idx = new_idx - old_idx
-
-        for i in missing_idx:
-            discrepancies.append({
-                "Type": "Missing Index",
-                "Table": t,
-                "Object": i,
-                "Details": f"Index '{i}' is missing in new DB."
-            })
-        for i in extra_idx:
-            discrepancies.append({
-                "Type": "Extra Index",
-                "Table": t,
-                "Object": i,
-                "Details": f"Index '{i}' is extra in new DB."
-            })
-
-        old_trg = get_triggers(old_conn, old_schema, t)
-        new_trg = get_triggers(new_conn, new_schema, t)
-        missing_trg = old_trg - new_trg
-        extra_trg = new_trg - old_trg
-
-        for trg in missing_trg:
-            discrepancies.append({
-                "Type": "Missing Trigger",
-                "Table": t,
-                "Object": trg,
-                "Details": f"Trigger '{trg}' is missing in new DB."
-            })
-        for trg in extra_trg:
-            discrepancies.append({
-                "Type": "Extra Trigger",
-                "Table": t,
-                "Object": trg,
-                "Details": f"Trigger '{trg}' is extra in new DB."
-            })
-
-        detailed_comparison.append({
-            "Type": "Detailed Comparison",
-            "Table": t,
-            "Object": "Indexes/Triggers",
-            "Details": (
-                f"Old indexes={old_idx}, New indexes={new_idx}; "
-                f"Old triggers={old_trg}, New triggers={new_trg}"
-            )
-        })
-
-    # Compare sequences
-    old_seq = get_sequences(old_conn, old_schema)
-    new_seq = get_sequences(new_conn, new_schema)
-    missing_seq = old_seq - new_seq
-    extra_seq = new_seq - old_seq
-
-    for s in missing_seq:
-        discrepancies.append({
-            "Type": "Missing Sequence",
-            "Table": "",
-            "Object": s,
-            "Details": f"Sequence '{s}' is missing in new DB."
-        })
-    for s in extra_seq:
-        discrepancies.append({
-            "Type": "Extra Sequence",
-            "Table": "",
-            "Object": s,
-            "Details": f"Sequence '{s}' is extra in new DB."
-        })
-
-    # Compare views
-    old_vw = get_views(old_conn, old_schema)
-    new_vw = get_views(new_conn, new_schema)
-    missing_vw = old_vw - new_vw
-    extra_vw = new_vw - old_vw
-
-    for v in missing_vw:
-        discrepancies.append({
-            "Type": "Missing View",
-            "Table": "",
-            "Object": v,
-            "Details": f"View '{v}' is missing in new DB."
-        })
-    for v in extra_vw:
-        discrepancies.append({
-            "Type": "Extra View",
-            "Table": "",
-            "Object": v,
-            "Details": f"View '{v}' is extra in new DB."
-        })
-
-    detailed_comparison.append({
-        "Type": "Detailed Comparison",
-        "Table": "",
-        "Object": "Sequences",
-        "Details": f"Old sequences={old_seq}, New sequences={new_seq}"
-    })
-    detailed_comparison.append({
-        "Type": "Detailed Comparison",
-        "Table": "",
-        "Object": "Views",
-        "Details": f"Old views={old_vw}, New views={new_vw}"
-    })
-
-    with open(misc_csv, "w", newline="") as f:
-        fieldnames = ["Type", "Table", "Object", "Details"]
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-
-        if discrepancies:
-            writer.writerows(discrepancies)
-        else:
-            writer.writerow({
-                "Type": "No discrepancies noted",
-                "Table": "",
-                "Object": "",
-                "Details": ""
-            })
-
-        writer.writerow({})
-        writer.writerow({})
-
-        writer.writerow({
-            "Type": "Detailed Comparison Below",
-            "Table": "",
-            "Object": "",
-            "Details": ""
-        })
-        writer.writerow({})
-        writer.writerows(detailed_comparison)
+    fieldnames = ["Type", "Table", "Object", "Details"]
+
+    with ValidationReport(misc_csv, fieldnames) as report:
+        if table_diff is None:
+            table_diff = diff_table_lists(get_table_list(old_conn, old_schema), get_table_list(new_conn, new_schema))
+        missing_tables, extra_tables, common_tables = table_diff
+
+        # Missing/extra tables
+        for t in missing_tables:
+            report.add_discrepancy((
+                "Missing Table", t, "",
+                "Table exists in old DB but not in new DB."
+            ))
+        for t in extra_tables:
+            report.add_discrepancy((
+                "Extra Table", t, "",
+                "Table exists in new DB but not in old DB."
+            ))
+
+        # Compare indexes, triggers in common tables
+        # (each fetched for the whole schema in one query per database)
+        old_indexes, new_indexes = query_both_sides(
+            lambda: get_all_indexes(old_conn, old_schema),
+            lambda: get_all_indexes(new_conn, new_schema)
+        )
+        old_triggers, new_triggers = query_both_sides(
+            lambda: get_all_triggers(old_conn, old_schema),
+            lambda: get_all_triggers(new_conn, new_schema)
+        )
+        for t in common_tables:
+            old_idx = old_indexes.get(t, set())
+            new_idx = new_indexes.get(t, set())
+            missing_idx = old_idx - new_idx
+            extra_idx = new_idx - old_idx
+
+            for i in missing_idx:
+                report.add_discrepancy((
+                    "Missing Index", t, i,
+                    f"Index '{i}' is missing in new DB."
+                ))
+            for i in extra_idx:
+                report.add_discrepancy((
+                    "Extra Index", t, i,
+                    f"Index '{i}' is extra in new DB."
+                ))
+
+            old_trg = old_triggers.get(t, set())
+            new_trg = new_triggers.get(t, set())
+            missing_trg = old_trg - new_trg
+            extra_trg = new_trg - old_trg
+
+            for trg in missing_trg:
+                report.add_discrepancy((
+                    "Missing Trigger", t, trg,
+                    f"Trigger '{trg}' is missing in new DB."
+                ))
+            for trg in extra_trg:
+                report.add_discrepancy((
+                    "Extra Trigger", t, trg,
+                    f"Trigger '{trg}' is extra in new DB."
+                ))
+
+            report.add_detail((
+                "Detailed Comparison", t, "Indexes/Triggers",
+                (
+                    f"Old indexes={format_name_set(old_idx)}, New indexes={format_name_set(new_idx)}; "
+                    f"Old triggers={format_name_set(old_trg)}, New triggers={format_name_set(new_trg)}"
+                )
+            ))
+
+        # Compare sequences
+        old_seq, new_seq = query_both_sides(
+            lambda: get_sequences(old_conn, old_schema),
+            lambda: get_sequences(new_conn, new_schema)
+        )
+        missing_seq = old_seq - new_seq
+        extra_seq = new_seq - old_seq
+
+        for s in missing_seq:
+            report.add_discrepancy((
+                "Missing Sequence", "", s,
+                f"Sequence '{s}' is missing in new DB."
+            ))
+        for s in extra_seq:
+            report.add_discrepancy((
+                "Extra Sequence", "", s,
+                f"Sequence '{s}' is extra in new DB."
+            ))
+
+        # Compare views
+        old_vw, new_vw = query_both_sides(
+            lambda: get_views(old_conn, old_schema),
+            lambda: get_views(new_conn, new_schema)
+        )
+        missing_vw = old_vw - new_vw
+        extra_vw = new_vw - old_vw
+
+        for v in missing_vw:
+            report.add_discrepancy((
+                "Missing View", "", v,
+                f"View '{v}' is missing in new DB."
+            ))
+        for v in extra_vw:
+            report.add_discrepancy((
+                "Extra View", "", v,
+                f"View '{v}' is extra in new DB."
+            ))
+
+        report.add_detail((
+            "Detailed Comparison", "", "Sequences",
+            f"Old sequences={format_name_set(old_seq)}, New sequences={format_name_set(new_seq)}"
+        ))
+        report.add_detail((
+            "Detailed Comparison", "", "Views",
+            f"Old views={format_name_set(old_vw)}, New views={format_name_set(new_vw)}"
+        ))
 
     print(f"[INFO] Miscellaneous discrepancies saved to {misc_csv}")
 
@@ -1245,6 +2080,14 @@ def main():
 
     old_schema = old_db_config["schema"]
     new_schema = new_db_config["schema"]
+    chunk_size = params["chunk_size"]
+    db_link = params["db_link"]
+    max_scan_rows = params["max_scan_rows"]
+    workers = params["workers"]
+    set_fetch_size(chunk_size)
+    set_parallelism(workers)
+    # MINUS needs both schemas visible from the old connection
+    server_side = bool(db_link) or old_db_config["dsn"] == new_db_config["dsn"]
 
     timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
     results_dir = os.path.join("audit_results", f"{old_schema}_{new_schema}", timestamp)
@@ -1252,73 +2095,104 @@ def main():
 
     total_steps = 7
     step = 0
+    old_pool = new_pool = old_conn = new_conn = None
 
     try:
         print("\n[INFO] Establishing database connections...")
-        old_conn = get_oracle_connection(old_db_config)
-        new_conn = get_oracle_connection(new_db_config)
+        # One session per worker, plus a few for the steps that run on main
+        old_pool = get_oracle_pool(old_db_config, workers, workers + 3)
+        new_pool = get_oracle_pool(new_db_config, workers, workers + 3)
+        # Sessions for the steps that run on a single connection
+        old_conn = old_pool.acquire()
+        new_conn = new_pool.acquire()
 
         print("Connection Established Successfully!!")
 
-        # Table lists
-        old_tables = get_table_list(old_conn, old_schema)
-        new_tables = get_table_list(new_conn, new_schema)
-        common_tables = set(old_tables).intersection(new_tables)
+        # Column and primary key metadata for both schemas, fetched in bulk once
+        query_both_sides(
+            lambda: load_schema_metadata(old_conn, old_schema),
+            lambda: load_schema_metadata(new_conn, new_schema)
+        )
+
+        # Table lists, fetched and diffed once and shared by every step below
+        table_diff = diff_table_lists(*query_both_sides(
+            lambda: get_table_list(old_conn, old_schema),
+            lambda: get_table_list(new_conn, new_schema)
+        ))
+        _, _, common_tables = table_diff
 
         # Perform validations:
 
         # Step 1: Table Sanity Check
         progress = int((step / total_steps) * 100)
-        send_telegram_notification(BOT_TOKEN, CHAT_IDS, f"📊 Progress: {progress}% - Validating Table Sanity...")
-        miscellaneous_discrepancies(old_conn, new_conn, old_schema, new_schema, results_dir)
+        queue_telegram_notification(BOT_TOKEN, CHAT_IDS, f"📊 Progress: {progress}% - Validating Table Sanity...")
+        miscellaneous_discrepancies(old_conn, new_conn, old_schema, new_schema, results_dir, table_diff)
         step += 1
 
         # Step 2: Schema Validation
         progress = int((step / total_steps) * 100)
-        send_telegram_notification(BOT_TOKEN, CHAT_IDS, f"📊 Progress: {progress}% - Validating Schema...")
-        schema_validation(old_conn, new_conn, old_schema, new_schema, results_dir)
+        queue_telegram_notification(BOT_TOKEN, CHAT_IDS, f"📊 Progress: {progress}% - Validating Schema...")
+        schema_validation(old_conn, new_conn, old_schema, new_schema, results_dir, table_diff)
         step += 1
 
         # step 3: Count Validation
         progress = int((step / total_steps) * 100)
-        send_telegram_notification(BOT_TOKEN, CHAT_IDS, f"📊 Progress: {progress}% - Checking Row Counts...")
-        count_validation(old_conn, new_conn, old_schema, new_schema, results_dir)
+        queue_telegram_notification(BOT_TOKEN, CHAT_IDS, f"📊 Progress: {progress}% - Checking Row Counts...")
+        empty_tables = count_validation(old_pool, new_pool, old_schema, new_schema, results_dir, table_diff)
         step += 1
 
+        # Tables not worth a full scan: empty on both sides (exact counts), and
+        # in fast mode anything the statistics estimate above the row limit
+        skipped_tables = {table: "Both tables are empty" for table in empty_tables}
+        if max_scan_rows is not None:
+            old_estimates = get_row_estimates(old_conn, old_schema)
+            new_estimates = get_row_estimates(new_conn, new_schema)
+            for table in common_tables:
+                estimate = max(old_estimates.get(table, 0), new_estimates.get(table, 0))
+                if table not in skipped_tables and estimate > max_scan_rows:
+                    print(f"[WARN] Fast mode: skipping full-scan checks for '{table}' (~{estimate} rows)")
+                    skipped_tables[table] = f"Skipped in fast mode (~{estimate} rows estimated)"
+        scan_tables = [table for table in common_tables if table not in skipped_tables]
+
         # Step 4: Aggregate Function Validation
         progress = int((step / total_steps) * 100)
-        send_telegram_notification(BOT_TOKEN, CHAT_IDS, f"📊 Progress: {progress}% - Performing Aggregate Checks...")
-        aggregate_function_validation(old_conn, new_conn, old_schema, new_schema, common_tables, results_dir)
+        queue_telegram_notification(BOT_TOKEN, CHAT_IDS, f"📊 Progress: {progress}% - Performing Aggregate Checks...")
+        aggregate_function_validation(old_pool, new_pool, old_schema, new_schema, scan_tables, results_dir,
+                                      skipped_tables)
         step += 1
 
         # Step 5: SQL Join Validation
         progress = int((step / total_steps) * 100)
-        send_telegram_notification(BOT_TOKEN, CHAT_IDS, f"📊 Progress: {progress}% - Running SQL Join Validations...")
-        sql_join_operation_validation_with_details(old_conn, new_conn, old_schema, new_schema, common_tables, results_dir)
+        queue_telegram_notification(BOT_TOKEN, CHAT_IDS, f"📊 Progress: {progress}% - Running SQL Join Validations...")
+        sql_join_operation_validation_with_details(old_pool, new_pool, old_schema, new_schema, scan_tables, results_dir,
+                                                   chunk_size, server_side, db_link, skipped_tables)
         step += 1
 
         # Step 6: Value-by-Value Comparison
         progress = int((step / total_steps) * 100)
-        send_telegram_notification(BOT_TOKEN, CHAT_IDS, f"📊 Progress: {progress}% - Comparing Data...")
-        value_by_value_comparison(old_conn, new_conn, old_schema, new_schema, common_tables, results_dir)
+        queue_telegram_notification(BOT_TOKEN, CHAT_IDS, f"📊 Progress: {progress}% - Comparing Data...")
+        value_by_value_comparison(old_pool, new_pool, old_schema, new_schema, scan_tables, results_dir, chunk_size,
+                                  server_side, db_link, skipped_tables)
         step += 1
 
         # Step 6: Null Value Validation
         progress = int((step / total_steps) * 100)
-        send_telegram_notification(BOT_TOKEN, CHAT_IDS, f"📊 Progress: {progress}% - Checking for NULL Values...")
-        null_value_verification(old_conn, new_conn, old_schema, new_schema, common_tables, results_dir)
+        queue_telegram_notification(BOT_TOKEN, CHAT_IDS, f"📊 Progress: {progress}% - Checking for NULL Values...")
+        null_value_verification(old_pool, new_pool, old_schema, new_schema, scan_tables, results_dir, skipped_tables)
         step += 1
 
         progress = 100
-        send_telegram_notification(BOT_TOKEN, CHAT_IDS, "✅ Data Migration Audit Completed Successfully!")
+        queue_telegram_notification(BOT_TOKEN, CHAT_IDS, "✅ Data Migration Audit Completed Successfully!")
 
     except Exception as e:
-        send_telegram_notification(BOT_TOKEN, CHAT_IDS, f"⚠️ Error: {str(e)}")
+        queue_telegram_notification(BOT_TOKEN, CHAT_IDS, f"⚠️ Error: {str(e)}")
         print(f"[ERROR] Migration failed: {e}")
 
     finally:
         close_connection(old_conn)
         close_connection(new_conn)
+        close_connection(old_pool)
+        close_connection(new_pool)
         print("Connection Closed!!")
 
 if __name__ == "__main__":
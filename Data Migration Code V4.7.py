@@ -5,7 +5,10 @@ import datetime
 import subprocess
 import time
 import itertools
-from notify_on_completion import send_telegram_notification, BOT_TOKEN, CHAT_IDS
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, wait
+from notify_on_completion import queue_telegram_notification, BOT_TOKEN, CHAT_IDS
 
 
 # oracle_client_path = r'D:\Users\T000670\Downloads\instantclient-basic-windows.x64-23.6.0.24.10\instantclient_23_6'
@@ -14,6 +17,20 @@ from notify_on_completion import send_telegram_notification, BOT_TOKEN, CHAT_IDS
 # os.environ['PATH'] = oracle_client_path + ";" + os.environ['PATH']
 # oracledb.init_oracle_client()
 
+# Tables validated concurrently (one pooled session per side per worker)
+MAX_WORKERS = 8
+
+# Rows per round trip for bulk fetches (the driver default is 100)
+FETCH_ARRAYSIZE = 10000
+
+# Write buffer for the CSV reports: one write() syscall per MiB instead of per few rows
+CSV_BUFFER_SIZE = 1 << 20
+
+# Client-side statement cache per session: the dictionary lookups use bind
+# variables, and the per-table statements are identical on every pooled
+# session, so repeats skip the parse round trip
+STATEMENT_CACHE_SIZE = 200
+
 ###############################################################################
 # Prompt for User Inputs
 ###############################################################################
@@ -36,10 +53,17 @@ def prompt_user_for_info():
     new_db_dsn = input("  New DB DSN (e.g. host:port/service_name): ").strip()
     new_schema_name = input("  New Schema Name: ").strip()
 
+    print("\nOptional: a database link from the OLD database to the NEW database.")
+    print("  With a link (or when both schemas are on the same database) row differences are computed server-side.")
+    db_link = input("  DB Link Name (leave blank if none): ").strip()
+
     print("\nSpecify a chunk size for any full data comparisons (number of rows per chunk).")
     chunk_size_str = input("  Chunk Size (e.g. 10000): ").strip()
     chunk_size = int(chunk_size_str) if chunk_size_str.isdigit() else 10000
 
+    print("\nThe table sanity report can list every table's indexes and triggers in its detailed section.")
+    hygiene_details = input("  Include per-table index/trigger details? (y/n, default y): ").strip().lower() != "n"
+
     return {
         "old_db_config": {
             "user": old_db_user,
@@ -53,7 +77,9 @@ def prompt_user_for_info():
             "dsn": new_db_dsn,
             "schema": new_schema_name
         },
-        "chunk_size": chunk_size
+        "db_link": db_link,
+        "chunk_size": chunk_size,
+        "hygiene_details": hygiene_details
     }
 
 ###############################################################################
@@ -65,20 +91,86 @@ def get_oracle_connection(db_config):
         connection = oracledb.connect(
             user=db_config["user"],
             password=db_config["password"],
-            dsn=db_config["dsn"]
+            dsn=db_config["dsn"],
+            stmtcachesize=STATEMENT_CACHE_SIZE
         )
         return connection
     except oracledb.DatabaseError as e:
         print(f"[ERROR] Connection failed: {e}")
         raise
 
+def get_oracle_pool(db_config, min_sessions=MAX_WORKERS, max_sessions=MAX_WORKERS + 2):
+    """
+    Creates a session pool so each worker thread can use its own connection.
+    acquire() waits for a free session once all of them are in use.
+    """
+    try:
+        pool = oracledb.create_pool(
+            user=db_config["user"],
+            password=db_config["password"],
+            dsn=db_config["dsn"],
+            min=min_sessions,
+            max=max_sessions,
+            increment=1,
+            getmode=oracledb.POOL_GETMODE_WAIT,
+            stmtcachesize=STATEMENT_CACHE_SIZE
+        )
+        return pool
+    except oracledb.DatabaseError as e:
+        print(f"[ERROR] Connection pool creation failed: {e}")
+        raise
+
 def close_connection(connection):
+    """
+    Closes a connection or a session pool.
+    """
     try:
         if connection:
             connection.close()
     except Exception as e:
         print(f"[ERROR] Closing connection: {e}")
 
+###############################################################################
+# Parallel Execution Helpers
+###############################################################################
+
+def run_per_table(tables, process_table, max_workers=MAX_WORKERS):
+    """
+    Runs process_table(table) for every table on a bounded thread pool.
+    The driver releases the GIL while waiting on the database, so tables are
+    validated concurrently. Results are yielded in the order of `tables`.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        yield from executor.map(process_table, tables)
+
+# Runs the new-database half of a two-sided query while the calling thread
+# runs the old-database half. Side tasks never submit work themselves, so
+# workers waiting on them cannot deadlock.
+_SIDE_EXECUTOR = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+
+def query_both_sides(old_call, new_call):
+    """
+    Runs old_call() and new_call() concurrently, since they wait on different
+    databases. Returns (old_result, new_result); an error on either side is raised.
+    """
+    future = _SIDE_EXECUTOR.submit(new_call)
+    try:
+        old_result = old_call()
+    finally:
+        # The new-side session must not go back to the pool while still in use
+        wait([future])
+    return old_result, future.result()
+
+def make_bulk_cursor(connection, arraysize=FETCH_ARRAYSIZE):
+    """
+    Returns a cursor tuned for multi-row fetches. prefetchrows is arraysize + 1
+    so a result that fits in one batch needs no extra round trip to detect the end.
+    """
+    cursor = connection.cursor()
+    cursor.arraysize = arraysize
+    cursor.prefetchrows = arraysize + 1
+    return cursor
+
 ###############################################################################
 # Helper Functions for Tables, Schemas, PK
 ###############################################################################
@@ -87,36 +179,123 @@ def get_table_list(connection, schema_name):
     query = """
         SELECT table_name 
         FROM all_tables 
-        WHERE owner = UPPER(:schema_param)
+        WHERE owner = :schema_param
         ORDER BY table_name
     """
-    cursor = connection.cursor()
-    cursor.execute(query, schema_param=schema_name)
+    cursor = make_bulk_cursor(connection)
+    cursor.execute(query, schema_param=schema_name.upper())
     tables = [row[0] for row in cursor.fetchall()]
     cursor.close()
     return tables
 
+# Column metadata cache: (dsn, SCHEMA, TABLE) -> {column: (data_type, data_length)}.
+# Every validation step asks for the same tables, so each is looked up once and
+# kept across runs until DDL changes the schema (see refresh_schema_metadata).
+_schema_cache = {}
+
+# Schema-wide object lists: (dsn, SCHEMA, fetcher name) -> result of the fetcher
+_schema_objects_cache = {}
+
+# DDL generation last seen per schema: (dsn, SCHEMA) -> (MAX(last_ddl_time), object count)
+_schema_generations = {}
+
+def _metadata_key(connection, schema_name, table_name):
+    return (connection.dsn, schema_name.upper(), table_name.upper())
+
+def load_schema_metadata(connection, schema_name):
+    """
+    Fetches the columns of every table in the schema in one query and fills
+    the metadata cache, so later per-table lookups need no round trip.
+    """
+    query = """
+        SELECT table_name, column_name, data_type, data_length
+        FROM all_tab_columns
+        WHERE owner = :schema_param
+        ORDER BY table_name, column_id
+    """
+    schemas = {}
+    cursor = make_bulk_cursor(connection)
+    try:
+        cursor.execute(query, schema_param=schema_name.upper())
+        for table_name, col_name, data_type, data_length in cursor:
+            schemas.setdefault(table_name, {})[col_name] = (data_type, data_length)
+    finally:
+        cursor.close()
+
+    for table_name, schema in schemas.items():
+        _schema_cache[_metadata_key(connection, schema_name, table_name)] = schema
+
+def get_schema_generation(connection, schema_name):
+    """
+    Returns a token that changes whenever DDL creates, alters or drops an
+    object in the schema: the latest DDL time and the number of objects.
+    """
+    query = """
+        SELECT MAX(last_ddl_time), COUNT(*)
+        FROM all_objects
+        WHERE owner = :schema_param
+    """
+    cursor = connection.cursor()
+    try:
+        cursor.execute(query, schema_param=schema_name.upper())
+        return cursor.fetchone()
+    finally:
+        cursor.close()
+
+def refresh_schema_metadata(connection, schema_name):
+    """
+    Keeps the cached metadata of a schema from an earlier run when no DDL
+    has happened in it since; otherwise drops it and reloads the columns of
+    every table with load_schema_metadata.
+    """
+    schema_key = (connection.dsn, schema_name.upper())
+    generation = get_schema_generation(connection, schema_name)
+    if _schema_generations.get(schema_key) == generation:
+        return
+
+    for cache in (_schema_cache, _schema_objects_cache):
+        for key in [key for key in cache if key[:2] == schema_key]:
+            del cache[key]
+    load_schema_metadata(connection, schema_name)
+    _schema_generations[schema_key] = generation
+
+def get_cached_schema_objects(connection, schema_name, fetcher):
+    """
+    Returns fetcher(connection, schema_name) for a schema-wide lookup such as
+    get_table_list or get_all_indexes, cached like the column metadata.
+    Callers must not modify the returned objects.
+    """
+    key = (connection.dsn, schema_name.upper(), fetcher.__name__)
+    if key not in _schema_objects_cache:
+        _schema_objects_cache[key] = fetcher(connection, schema_name)
+    return _schema_objects_cache[key]
+
 def get_table_schema(connection, schema_name, table_name):
     """
     Retrieves a dictionary of column_name -> (data_type, data_length) for the given table.
-    Uses Oracle's ALL_TAB_COLUMNS view.
+    Uses Oracle's ALL_TAB_COLUMNS view; results are cached per table.
     """
+    key = _metadata_key(connection, schema_name, table_name)
+    if key in _schema_cache:
+        return dict(_schema_cache[key])
+
     query = """
         SELECT column_name, data_type, data_length
         FROM all_tab_columns
-        WHERE owner = UPPER(:schema_param)
-          AND table_name = UPPER(:table_param)
+        WHERE owner = :schema_param
+          AND table_name = :table_param
         ORDER BY column_id
     """
-    cursor = connection.cursor()
-    cursor.execute(query, schema_param=schema_name, table_param=table_name)
+    cursor = make_bulk_cursor(connection)
+    cursor.execute(query, schema_param=schema_name.upper(), table_param=table_name.upper())
     schema = {}
     for row in cursor.fetchall():
         col_name, data_type, data_length = row
         # Store (data_type, data_length) if needed, e.g., {"CUSTOMER_ID": ("NUMBER", 22)}
         schema[col_name] = (data_type, data_length)
     cursor.close()
-    return schema
+    _schema_cache[key] = schema
+    return dict(schema)
 
 def get_primary_key_columns(connection, schema_name, table_name):
     """
@@ -129,13 +308,13 @@ def get_primary_key_columns(connection, schema_name, table_name):
         JOIN all_cons_columns acc 
              ON ac.owner = acc.owner
             AND ac.constraint_name = acc.constraint_name
-        WHERE ac.owner = UPPER(:schema_param)
-          AND ac.table_name = UPPER(:table_param)
+        WHERE ac.owner = :schema_param
+          AND ac.table_name = :table_param
           AND ac.constraint_type = 'P'
         ORDER BY acc.position
     """
-    cursor = connection.cursor()
-    cursor.execute(query, schema_param=schema_name, table_param=table_name)
+    cursor = make_bulk_cursor(connection)
+    cursor.execute(query, schema_param=schema_name.upper(), table_param=table_name.upper())
     columns = [row[0] for row in cursor.fetchall()]
     cursor.close()
     return columns
@@ -146,11 +325,11 @@ def get_primary_key_columns(connection, schema_name, table_name):
 
 def get_table_data(connection, schema_name, table_name):
     """
-    Original helper function (unchanged).
+    Original helper function.
     Fetches all rows (SELECT *), returns (columns, rows).
     """
     query = f"SELECT * FROM {schema_name}.{table_name}"
-    cursor = connection.cursor()
+    cursor = make_bulk_cursor(connection)
     try:
         cursor.execute(query)
         columns = [desc[0] for desc in cursor.description]
@@ -163,9 +342,11 @@ def get_table_data(connection, schema_name, table_name):
         cursor.close()
 
 
-def save_results_in_batches(results, output_dir, prefix, batch_size=100):
+def save_results_in_batches(results, output_dir, prefix, batch_size=100,
+                            fieldnames=("Table", "Type", "Details")):
     """
     Saves results in multiple CSV files, each containing a batch of up to `batch_size` tables.
+    Results are (Table, Type, Details) tuples in the order of `fieldnames`.
     """
     if not os.path.exists(output_dir):
         os.makedirs(output_dir)
@@ -176,13 +357,60 @@ def save_results_in_batches(results, output_dir, prefix, batch_size=100):
         batch_results = results[i * batch_size: (i + 1) * batch_size]
         output_file = os.path.join(output_dir, f"{prefix}_batch_{i + 1}.csv")
 
-        with open(output_file, "w", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=batch_results[0].keys())
-            writer.writeheader()
+        with open(output_file, "w", newline="", buffering=CSV_BUFFER_SIZE) as f:
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
             writer.writerows(batch_results)
 
         print(f"[INFO] Results saved to {output_file}")
 
+def write_report_in_batches(output_file, fieldnames, table_results, batch_size=100):
+    """
+    Writes a report (discrepancies first, followed by the detailed comparison)
+    from an iterable of (table_discrepancies, table_details) per table.
+    Rows are tuples in `fieldnames` order, written every `batch_size` tables;
+    details are spooled to a temporary file and appended at the end, so memory
+    stays bounded by one batch.
+    """
+    def banner(text=""):
+        # Marker and blank rows keep the full width of the report columns
+        return (text,) + ("",) * (len(fieldnames) - 1)
+
+    with open(output_file, "w", newline="", buffering=CSV_BUFFER_SIZE) as f, \
+            tempfile.TemporaryFile("w+", newline="", buffering=CSV_BUFFER_SIZE) as details_file:
+        # Plain csv.writer: positional rows skip DictWriter's per-field lookups
+        writer = csv.writer(f)
+        details_writer = csv.writer(details_file)
+        writer.writerow(fieldnames)
+
+        discrepancies = []
+        detailed_comparison = []
+        discrepancies_found = False
+        for table_count, (table_discrepancies, table_details) in enumerate(table_results, start=1):
+            discrepancies.extend(table_discrepancies)
+            detailed_comparison.extend(table_details)
+            if table_count % batch_size == 0:
+                discrepancies_found = discrepancies_found or bool(discrepancies)
+                writer.writerows(discrepancies)
+                details_writer.writerows(detailed_comparison)
+                discrepancies.clear()
+                detailed_comparison.clear()
+        discrepancies_found = discrepancies_found or bool(discrepancies)
+        writer.writerows(discrepancies)
+        details_writer.writerows(detailed_comparison)
+
+        if not discrepancies_found:
+            writer.writerow(banner("No discrepancies noted"))
+
+        # Add blank lines for separation
+        writer.writerow(banner())
+        writer.writerow(banner())
+
+        writer.writerow(banner("Detailed Comparison Below"))
+        writer.writerow(banner())
+        details_file.seek(0)
+        shutil.copyfileobj(details_file, f)
+
 ###############################################################################
 # Count Validation (SELECT COUNT(*))
 ###############################################################################
@@ -315,7 +543,7 @@ def count_validation(old_conn, new_conn, old_schema, new_schema, results_dir):
             })
 
     # Write CSV
-    with open(count_validation_csv, "w", newline="") as f:
+    with open(count_validation_csv, "w", newline="", buffering=CSV_BUFFER_SIZE) as f:
         fieldnames = [
             "Type", "Table",
             "Old Row Count", "New Row Count",
@@ -462,7 +690,7 @@ def schema_validation(old_conn, new_conn, old_schema, new_schema, results_dir):
                 "Details": status
             })
 
-    with open(schema_validation_csv, "w", newline="") as f:
+    with open(schema_validation_csv, "w", newline="", buffering=CSV_BUFFER_SIZE) as f:
         fieldnames = [
             "Type", "Table", "Column",
             "Old Data Type", "Old Length",
@@ -508,174 +736,326 @@ def schema_validation(old_conn, new_conn, old_schema, new_schema, results_dir):
 # Aggregate Function Validation
 ###############################################################################
 
-def aggregate_function_validation(old_conn, new_conn, old_schema, new_schema, tables, results_dir):
+def aggregate_function_validation(old_pool, new_pool, old_schema, new_schema, tables, results_dir, db_link=""):
+    """
+    Compares SUM and AVG of every numeric column common to both databases.
+    With `db_link` (OLD -> NEW), each table is aggregated on both sides by one
+    statement on the old database; otherwise one query is run per side.
+    Tables are validated concurrently, one pooled session per side per worker.
+    """
     aggregate_csv = os.path.join(results_dir, "aggregate_function_validation.csv")
-    discrepancies = []
-    detailed_comparison = []
 
-    for table in tables:
+    def process_table(table):
+        # Each worker uses its own pooled session on both sides
+        table_discrepancies = []
+        table_details = []
         print(f"[INFO] Performing aggregate function validation for table '{table}'...")
 
-        old_table_schema = get_table_schema(old_conn, old_schema, table)
-        new_table_schema = get_table_schema(new_conn, new_schema, table)
-
-        numerical_columns = [
-            c for c, (dt, _) in old_table_schema.items()
-            if dt in ("NUMBER", "FLOAT", "DECIMAL")
-               and c in new_table_schema
-               and new_table_schema[c][0] in ("NUMBER", "FLOAT", "DECIMAL")
-        ]
-
-        for col in numerical_columns:
+        with old_pool.acquire() as old_conn, new_pool.acquire() as new_conn:
+            old_cursor = old_conn.cursor()
+            new_cursor = new_conn.cursor()
             try:
-                old_cursor = old_conn.cursor()
-                old_cursor.execute(f"SELECT SUM({col}), AVG({col}) FROM {old_schema}.{table}")
-                old_sum, old_avg = old_cursor.fetchone()
+                old_table_schema = get_table_schema(old_conn, old_schema, table)
+                new_table_schema = get_table_schema(new_conn, new_schema, table)
+
+                numerical_columns = [
+                    c for c, (dt, _) in old_table_schema.items()
+                    if dt in ("NUMBER", "FLOAT", "DECIMAL")
+                       and c in new_table_schema
+                       and new_table_schema[c][0] in ("NUMBER", "FLOAT", "DECIMAL")
+                ]
+                if not numerical_columns:
+                    return table_discrepancies, table_details
+
+                # SUM and AVG of every numeric column in a single query per side
+                cols_expr = ", ".join(
+                    f"SUM({col}) S{i}, AVG({col}) A{i}" for i, col in enumerate(numerical_columns)
+                )
+                try:
+                    if db_link:
+                        old_cursor.execute(
+                            f"SELECT o.*, n.* "
+                            f"FROM (SELECT {cols_expr} FROM {old_schema}.{table}) o "
+                            f"CROSS JOIN (SELECT {cols_expr} FROM {new_schema}.{table}@{db_link}) n"
+                        )
+                        row = old_cursor.fetchone()
+                        old_row = row[:2 * len(numerical_columns)]
+                        new_row = row[2 * len(numerical_columns):]
+                    else:
+                        old_cursor.execute(f"SELECT {cols_expr} FROM {old_schema}.{table}")
+                        old_row = old_cursor.fetchone()
+
+                        new_cursor.execute(f"SELECT {cols_expr} FROM {new_schema}.{table}")
+                        new_row = new_cursor.fetchone()
+                except Exception as e:
+                    for col in numerical_columns:
+                        table_discrepancies.append(("Error", table, col, "", "", "", "", str(e)))
+                    return table_discrepancies, table_details
+
+                old_it = iter(old_row)
+                new_it = iter(new_row)
+                for col, (old_sum, old_avg), (new_sum, new_avg) in zip(
+                        numerical_columns, zip(old_it, old_it), zip(new_it, new_it)):
+                    is_match = old_sum == new_sum and old_avg == new_avg
+                    if not is_match:
+                        table_discrepancies.append((
+                            "Aggregate Mismatch", table, col, old_sum, new_sum, old_avg, new_avg,
+                            (
+                                f"Mismatch: Old SUM={old_sum}, New SUM={new_sum}, "
+                                f"Old AVG={old_avg}, New AVG={new_avg}"
+                            )
+                        ))
+
+                    table_details.append((
+                        "Detailed Comparison", table, col, old_sum, new_sum, old_avg, new_avg,
+                        "Match" if is_match else "Mismatch"
+                    ))
+            finally:
                 old_cursor.close()
-
-                new_cursor = new_conn.cursor()
-                new_cursor.execute(f"SELECT SUM({col}), AVG({col}) FROM {new_schema}.{table}")
-                new_sum, new_avg = new_cursor.fetchone()
                 new_cursor.close()
 
-                if old_sum != new_sum or old_avg != new_avg:
-                    discrepancies.append({
-                        "Type": "Aggregate Mismatch",
-                        "Table": table,
-                        "Column": col,
-                        "Old SUM": old_sum,
-                        "New SUM": new_sum,
-                        "Old AVG": old_avg,
-                        "New AVG": new_avg,
-                        "Details": (
-                            f"Mismatch: Old SUM={old_sum}, New SUM={new_sum}, "
-                            f"Old AVG={old_avg}, New AVG={new_avg}"
-                        )
-                    })
+        return table_discrepancies, table_details
 
-                detailed_comparison.append({
-                    "Type": "Detailed Comparison",
-                    "Table": table,
-                    "Column": col,
-                    "Old SUM": old_sum,
-                    "New SUM": new_sum,
-                    "Old AVG": old_avg,
-                    "New AVG": new_avg,
-                    "Details": "Match" if (old_sum == new_sum and old_avg == new_avg)
-                               else "Mismatch"
-                })
+    fieldnames = [
+        "Type", "Table", "Column", "Old SUM",
+        "New SUM", "Old AVG", "New AVG", "Details"
+    ]
+    write_report_in_batches(aggregate_csv, fieldnames, run_per_table(tables, process_table))
 
-            except Exception as e:
-                discrepancies.append({
-                    "Type": "Error",
-                    "Table": table,
-                    "Column": col,
-                    "Old SUM": "",
-                    "New SUM": "",
-                    "Old AVG": "",
-                    "New AVG": "",
-                    "Details": str(e)
-                })
+    print(f"[INFO] Aggregate function validation saved to {aggregate_csv}")
 
-    with open(aggregate_csv, "w", newline="") as f:
-        fieldnames = [
-            "Type", "Table", "Column", "Old SUM",
-            "New SUM", "Old AVG", "New AVG", "Details"
-        ]
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
+###############################################################################
+# Row Difference Helpers
+###############################################################################
 
-        if discrepancies:
-            writer.writerows(discrepancies)
+# Column types whose text form is exact and short enough to concatenate for ORA_HASH
+# (DATE and TIMESTAMP columns are formatted separately in row_text_expression)
+HASHABLE_TYPES = ("VARCHAR2", "NVARCHAR2", "CHAR", "NCHAR", "NUMBER", "FLOAT",
+                  "BINARY_FLOAT", "BINARY_DOUBLE", "RAW")
+
+def row_text_expression(table_schema):
+    """
+    Builds a concatenation of every column of a table that no two different
+    rows share, or returns None when a column type (e.g. LOBs, LONG, XMLTYPE)
+    cannot be concatenated. Each value is prefixed with its length and NULL is
+    written as N, so neither a "|" inside a value nor an empty string can shift
+    columns. Dates and timestamps are formatted explicitly so the session NLS
+    settings cannot hide a difference in the time part.
+    """
+    parts = []
+    for col, (data_type, _) in table_schema.items():
+        if data_type == "DATE":
+            parts.append(f"TO_CHAR({col}, 'YYYY-MM-DD HH24:MI:SS')")
+        elif data_type.startswith("TIMESTAMP"):
+            tz = " TZR" if "TIME ZONE" in data_type else ""
+            parts.append(f"TO_CHAR({col}, 'YYYY-MM-DD HH24:MI:SS.FF9{tz}')")
+        elif data_type in HASHABLE_TYPES:
+            parts.append(col)
         else:
-            writer.writerow({
-                "Type": "No discrepancies noted",
-                "Table": "",
-                "Column": "",
-                "Old SUM": "",
-                "New SUM": "",
-                "Old AVG": "",
-                "New AVG": "",
-                "Details": ""
-            })
+            return None
+    return " || ".join(f"NVL2({part}, LENGTH({part}) || ':' || {part}, 'N')" for part in parts)
 
-        writer.writerow({})
-        writer.writerow({})
+def row_hash_expression(table_schema):
+    """
+    Builds a 64-bit hash of every column of a table from two 32-bit ORA_HASH
+    values with different seeds, or returns None when a column cannot be hashed.
+    """
+    text = row_text_expression(table_schema)
+    if text is None:
+        return None
+    return f"(ORA_HASH({text}, 4294967295, 0) * 4294967296 + ORA_HASH({text}, 4294967295, 1))"
 
-        writer.writerow({
-            "Type": "Detailed Comparison Below",
-            "Table": "",
-            "Column": "",
-            "Old SUM": "",
-            "New SUM": "",
-            "Old AVG": "",
-            "New AVG": "",
-            "Details": ""
-        })
-        writer.writerow({})
-        writer.writerows(detailed_comparison)
+def get_table_fingerprint(connection, schema_name, table_name, hash_expr):
+    """
+    Returns (row count, sum of row hashes) of a table in one aggregate query.
+    The sum does not depend on row order, so equal fingerprints on both sides
+    mean the tables hold the same rows (barring a hash collision).
+    """
+    cursor = connection.cursor()
+    try:
+        cursor.execute(f"SELECT COUNT(*), SUM({hash_expr}) FROM {schema_name}.{table_name}")
+        return cursor.fetchone()
+    finally:
+        cursor.close()
 
-    print(f"[INFO] Aggregate function validation saved to {aggregate_csv}")
+def diff_rows_server_side(old_conn, old_schema, new_schema, table, db_link=""):
+    """
+    Lets the OLD database diff whole rows with MINUS in both directions, so
+    only differing rows are sent to Python. Needs the new table to be visible
+    from the old connection (same database, or through `db_link`).
+    Returns (rows missing in new, rows extra in new).
+    """
+    old_ref = f"{old_schema}.{table}"
+    new_ref = f"{new_schema}.{table}@{db_link}" if db_link else f"{new_schema}.{table}"
+    cursor = make_bulk_cursor(old_conn)
+    try:
+        cursor.execute(f"SELECT * FROM {old_ref} MINUS SELECT * FROM {new_ref}")
+        missing_rows = cursor.fetchall()
+        cursor.execute(f"SELECT * FROM {new_ref} MINUS SELECT * FROM {old_ref}")
+        extra_rows = cursor.fetchall()
+    finally:
+        cursor.close()
+    return missing_rows, extra_rows
+
+def fetch_row_hashes(connection, schema_name, table_name, hash_expr):
+    """
+    Returns the set of row hashes of a table; only 8 bytes per row cross the network.
+    """
+    cursor = make_bulk_cursor(connection)
+    try:
+        cursor.execute(f"SELECT {hash_expr} FROM {schema_name}.{table_name}")
+        return {row[0] for row in cursor}
+    finally:
+        cursor.close()
+
+def fetch_rows_by_hash(connection, schema_name, table_name, hash_expr, hashes):
+    """
+    Returns the distinct rows whose hash is in `hashes`. The hash predicate
+    cannot use an index, so the table is rescanned once with each row's hash
+    alongside it and only matching rows are kept, instead of one full scan
+    per IN-list batch.
+    """
+    if not hashes:
+        return []
+    rows = []
+    cursor = make_bulk_cursor(connection)
+    try:
+        cursor.execute(f"SELECT {hash_expr}, t.* FROM {schema_name}.{table_name} t")
+        for row in cursor:
+            if row[0] in hashes:
+                rows.append(row[1:])
+    finally:
+        cursor.close()
+    # Identical rows share a hash; report each distinct row once, like a set difference
+    return list(dict.fromkeys(rows))
+
+def diff_rows_by_hash(old_conn, new_conn, old_schema, new_schema, table, table_schema):
+    """
+    Lets each database hash its own rows and diffs the hash sets, for when the
+    new table is not reachable from the old connection. Full rows are fetched
+    only for hashes present on one side.
+    Returns (rows missing in new, rows extra in new), or None when a column
+    type cannot be hashed.
+    """
+    hash_expr = row_hash_expression(table_schema)
+    if hash_expr is None:
+        return None
+
+    old_hashes, new_hashes = query_both_sides(
+        lambda: fetch_row_hashes(old_conn, old_schema, table, hash_expr),
+        lambda: fetch_row_hashes(new_conn, new_schema, table, hash_expr)
+    )
+    return query_both_sides(
+        lambda: fetch_rows_by_hash(old_conn, old_schema, table, hash_expr, old_hashes - new_hashes),
+        lambda: fetch_rows_by_hash(new_conn, new_schema, table, hash_expr, new_hashes - old_hashes)
+    )
+
+def fetch_row_set(connection, schema_name, table_name):
+    """
+    Streams all rows of a table straight into a set, so no intermediate row
+    list is held next to it.
+    """
+    cursor = make_bulk_cursor(connection)
+    try:
+        cursor.execute(f"SELECT * FROM {schema_name}.{table_name}")
+        return set(cursor)
+    except oracledb.DatabaseError as e:
+        print(f"[ERROR] Unable to fetch data for {schema_name}.{table_name}: {e}")
+        return set()
+    finally:
+        cursor.close()
+
+def diff_rows_client_side(old_conn, new_conn, old_schema, new_schema, table):
+    """
+    Fetches both tables in full and diffs them as sets of row tuples.
+    Returns (rows missing in new, rows extra in new).
+    """
+    old_rows, new_rows = query_both_sides(
+        lambda: fetch_row_set(old_conn, old_schema, table),
+        lambda: fetch_row_set(new_conn, new_schema, table)
+    )
+    return list(old_rows - new_rows), list(new_rows - old_rows)
+
+def get_row_differences(old_conn, new_conn, old_schema, new_schema, table, table_schema,
+                        server_side=False, db_link=""):
+    """
+    Returns (rows missing in new, rows extra in new) for a table, computed as
+    close to the data as possible: MINUS on the old database when the new
+    table is reachable from it, else row hashes, else a full client-side fetch.
+    Tables whose fingerprints match are skipped without fetching any rows.
+    """
+    hash_expr = row_hash_expression(table_schema)
+    if hash_expr is not None:
+        try:
+            old_fingerprint, new_fingerprint = query_both_sides(
+                lambda: get_table_fingerprint(old_conn, old_schema, table, hash_expr),
+                lambda: get_table_fingerprint(new_conn, new_schema, table, hash_expr)
+            )
+            if old_fingerprint == new_fingerprint:
+                return [], []
+        except oracledb.DatabaseError as e:
+            print(f"[WARN] Fingerprint check failed for '{table}', comparing rows: {e}")
+
+    if server_side:
+        try:
+            return diff_rows_server_side(old_conn, old_schema, new_schema, table, db_link)
+        except oracledb.DatabaseError as e:
+            # e.g. LOB columns cannot be used with MINUS, or no access to the new schema
+            print(f"[WARN] Server-side diff failed for '{table}', comparing row hashes instead: {e}")
+    try:
+        diff = diff_rows_by_hash(old_conn, new_conn, old_schema, new_schema, table, table_schema)
+        if diff is not None:
+            return diff
+    except oracledb.DatabaseError as e:
+        # e.g. the concatenated row exceeds the VARCHAR2 limit
+        print(f"[WARN] Row-hash diff failed for '{table}', fetching full tables instead: {e}")
+    return diff_rows_client_side(old_conn, new_conn, old_schema, new_schema, table)
 
 ###############################################################################
 # The ORIGINAL Value-by-Value Comparison (UNMODIFIED)
 ###############################################################################
 
-def value_by_value_check(old_conn, new_conn, old_schema, new_schema, tables, results_dir):
+def value_by_value_check(old_pool, new_pool, old_schema, new_schema, tables, results_dir,
+                         server_side=False, db_link=""):
     """
     Performs a value-by-value comparison and saves results in separate CSV files every 100 tables.
+    Only rows that differ are fetched (see get_row_differences); with
+    `server_side` the old database computes the differences with MINUS.
     """
     value_mismatch_results = []
 
-    for table in tables:
+    def process_table(table):
+        table_results = []
         print(f"[INFO] Performing value-by-value comparison for table '{table}'...")
 
-        old_columns, old_data = get_table_data(old_conn, old_schema, table)
-        new_columns, new_data = get_table_data(new_conn, new_schema, table)
+        with old_pool.acquire() as old_conn, new_pool.acquire() as new_conn:
+            old_table_schema = get_table_schema(old_conn, old_schema, table)
+            old_columns = list(old_table_schema.keys())
+            new_columns = list(get_table_schema(new_conn, new_schema, table).keys())
 
-        if old_columns != new_columns:
-            value_mismatch_results.append({
-                "Table": table,
-                "Type": "Column Structure Mismatch",
-                "Details": f"Old({old_columns}) vs New({new_columns})"
-            })
-            continue
+            if old_columns != new_columns:
+                table_results.append(
+                    (table, "Column Structure Mismatch", f"Old({old_columns}) vs New({new_columns})")
+                )
+                return table_results
 
-        old_data_dict = {tuple(row): row for row in old_data}
-        new_data_dict = {tuple(row): row for row in new_data}
+            missing_in_new, extra_in_new = get_row_differences(
+                old_conn, new_conn, old_schema, new_schema, table, old_table_schema, server_side, db_link
+            )
 
-        missing_in_new = set(old_data_dict.keys()) - set(new_data_dict.keys())
-        for missing_row in missing_in_new:
-            value_mismatch_results.append({
-                "Table": table,
-                "Type": "Missing Row in New",
-                "Details": f"Row missing in the new database: {old_data_dict[missing_row]}"
-            })
+            table_results.extend(
+                (table, "Missing Row in New", f"Row missing in the new database: {missing_row}")
+                for missing_row in missing_in_new
+            )
+            table_results.extend(
+                (table, "Extra Row in New", f"Row extra in the new database: {extra_row}")
+                for extra_row in extra_in_new
+            )
 
-        extra_in_new = set(new_data_dict.keys()) - set(old_data_dict.keys())
-        for extra_row in extra_in_new:
-            value_mismatch_results.append({
-                "Table": table,
-                "Type": "Extra Row in New",
-                "Details": f"Row extra in the new database: {new_data_dict[extra_row]}"
-            })
+        return table_results
 
-        common_keys = set(old_data_dict.keys()).intersection(new_data_dict.keys())
-        for key in common_keys:
-            old_row = old_data_dict[key]
-            new_row = new_data_dict[key]
-            for col_idx, column in enumerate(old_columns):
-                if old_row[col_idx] != new_row[col_idx]:
-                    value_mismatch_results.append({
-                        "Table": table,
-                        "Type": "Cell Value Mismatch",
-                        "Column": column,
-                        "Row Key": key,
-                        "Old Value": old_row[col_idx],
-                        "New Value": new_row[col_idx],
-                        "Details": f"Mismatch in column '{column}' for key {key}: "
-                                   f"Old({old_row[col_idx]}) vs New({new_row[col_idx]})"
-                    })
+    for table_results in run_per_table(tables, process_table):
+        value_mismatch_results.extend(table_results)
 
     save_results_in_batches(value_mismatch_results, results_dir, "value_by_value_check")
 
@@ -684,105 +1064,62 @@ def value_by_value_check(old_conn, new_conn, old_schema, new_schema, tables, res
 # Null Value Verification (Added Back)
 ###############################################################################
 
-def null_value_verification(old_conn, new_conn, old_schema, new_schema, tables, results_dir):
+def null_value_verification(old_pool, new_pool, old_schema, new_schema, tables, results_dir):
     """
     Verifies if null values are exactly the same in the old and new databases.
     Discrepancies are noted first, followed by a detailed comparison.
     Results are saved to a CSV file.
     """
     null_csv = os.path.join(results_dir, "null_value_verification.csv")
-    discrepancies = []
-    detailed_comparison = []
 
-    for table in tables:
+    def process_table(table):
+        table_discrepancies = []
+        table_details = []
         print(f"[INFO] Performing null value verification for table '{table}'...")
 
-        # Fetch columns for the table
-        old_table_schema = get_table_schema(old_conn, old_schema, table)
-        new_table_schema = get_table_schema(new_conn, new_schema, table)
+        with old_pool.acquire() as old_conn, new_pool.acquire() as new_conn:
+            # Fetch columns for the table
+            old_table_schema = get_table_schema(old_conn, old_schema, table)
+            new_table_schema = get_table_schema(new_conn, new_schema, table)
 
-        # Identify common columns
-        common_columns = set(old_table_schema.keys()).intersection(new_table_schema.keys())
+            # Identify common columns
+            common_columns = sorted(set(old_table_schema.keys()).intersection(new_table_schema.keys()))
+            if not common_columns:
+                return table_discrepancies, table_details
 
-        for column in common_columns:
+            # One scan per side: null count = COUNT(*) - COUNT(column)
+            counts_expr = ", ".join(f"COUNT({column})" for column in common_columns)
             try:
-                # Null count query for old database
-                old_query = f"SELECT COUNT(*) FROM {old_schema}.{table} WHERE {column} IS NULL"
-                old_cursor = old_conn.cursor()
-                old_cursor.execute(old_query)
-                old_null_count = old_cursor.fetchone()[0]
-                old_cursor.close()
+                with old_conn.cursor() as old_cursor, new_conn.cursor() as new_cursor:
+                    old_cursor.execute(f"SELECT COUNT(*), {counts_expr} FROM {old_schema}.{table}")
+                    old_total, *old_counts = old_cursor.fetchone()
 
-                # Null count query for new database
-                new_query = f"SELECT COUNT(*) FROM {new_schema}.{table} WHERE {column} IS NULL"
-                new_cursor = new_conn.cursor()
-                new_cursor.execute(new_query)
-                new_null_count = new_cursor.fetchone()[0]
-                new_cursor.close()
+                    new_cursor.execute(f"SELECT COUNT(*), {counts_expr} FROM {new_schema}.{table}")
+                    new_total, *new_counts = new_cursor.fetchone()
+            except Exception as e:
+                print(f"[ERROR] Failed to verify null values for table '{table}': {e}")
+                return table_discrepancies, table_details
+
+            for column, old_count, new_count in zip(common_columns, old_counts, new_counts):
+                old_null_count = old_total - old_count
+                new_null_count = new_total - new_count
 
                 # Compare results
                 if old_null_count != new_null_count:
-                    discrepancies.append({
-                        "Type": "Null Count Mismatch",
-                        "Table": table,
-                        "Column": column,
-                        "Old Null Count": old_null_count,
-                        "New Null Count": new_null_count,
-                        "Details": f"Mismatch in null count for column '{column}' in table '{table}'."
-                    })
+                    table_discrepancies.append((
+                        "Null Count Mismatch", table, column, old_null_count, new_null_count,
+                        f"Mismatch in null count for column '{column}' in table '{table}'."
+                    ))
 
                 # Add detailed comparison
-                detailed_comparison.append({
-                    "Table": table,
-                    "Column": column,
-                    "Old Null Count": old_null_count,
-                    "New Null Count": new_null_count
-                })
-
-            except Exception as e:
-                print(f"[ERROR] Failed to verify null values for table '{table}', column '{column}': {e}")
+                table_details.append((
+                    "Detailed Comparison", table, column, old_null_count, new_null_count, ""
+                ))
 
-    # Save to CSV
-    with open(null_csv, "w", newline="") as f:
-        fieldnames = ["Type", "Table", "Column", "Old Null Count", "New Null Count", "Details"]
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-
-        writer.writeheader()
-        if discrepancies:
-            writer.writerows(discrepancies)
-        else:
-            writer.writerow({
-                "Type": "No discrepancies noted",
-                "Table": "",
-                "Column": "",
-                "Old Null Count": "",
-                "New Null Count": "",
-                "Details": ""
-            })
+        return table_discrepancies, table_details
 
-        # Add blank lines for separation
-        writer.writerow({})
-        writer.writerow({})
-
-        # Detailed comparison
-        writer.writerow({
-            "Type": "Detailed Comparison Below",
-            "Table": "",
-            "Column": "",
-            "Old Null Count": "",
-            "New Null Count": "",
-            "Details": ""
-        })
-        writer.writerow({})
-        for row in detailed_comparison:
-            writer.writerow({
-                "Type": "Detailed Comparison",
-                "Table": row["Table"],
-                "Column": row["Column"],
-                "Old Null Count": row["Old Null Count"],
-                "New Null Count": row["New Null Count"],
-                "Details": ""
-            })
+    fieldnames = ["Type", "Table", "Column", "Old Null Count", "New Null Count", "Details"]
+    write_report_in_batches(null_csv, fieldnames, run_per_table(tables, process_table))
 
     print(f"[INFO] Null value verification saved to {null_csv}")
 
@@ -790,61 +1127,58 @@ def null_value_verification(old_conn, new_conn, old_schema, new_schema, tables,
 # SQL Join Validation (Primary Key)
 ###############################################################################
 
-def sql_join_operation(old_conn, new_conn, old_schema, new_schema, tables, results_dir):
+def sql_join_operation(old_pool, new_pool, old_schema, new_schema, tables, results_dir,
+                       server_side=False, db_link=""):
     """
     Performs SQL JOIN-based validation, ensuring INNER JOIN, LEFT JOIN, RIGHT JOIN, and FULL OUTER JOIN are covered.
     Saves results in separate CSV files every 100 tables.
+    Rows are joined on all their columns, so only rows present on one side
+    are reported; they are found with get_row_differences.
+    The FULL OUTER JOIN result is summarised as one row count per table.
     """
     join_mismatch_results = []
 
-    for table in tables:
+    def process_table(table):
+        table_results = []
         print(f"[INFO] Performing SQL JOIN operation check for table '{table}'...")
 
-        old_columns, old_data = get_table_data(old_conn, old_schema, table)
-        new_columns, new_data = get_table_data(new_conn, new_schema, table)
+        with old_pool.acquire() as old_conn, new_pool.acquire() as new_conn:
+            old_table_schema = get_table_schema(old_conn, old_schema, table)
+            old_columns = list(old_table_schema.keys())
+            new_columns = list(get_table_schema(new_conn, new_schema, table).keys())
 
-        if old_columns != new_columns:
-            join_mismatch_results.append({
-                "Table": table,
-                "Type": "Column Structure Mismatch",
-                "Details": f"Column structure differs: Old({old_columns}) vs New({new_columns})"
-            })
-            continue
+            if old_columns != new_columns:
+                table_results.append((
+                    table, "Column Structure Mismatch",
+                    f"Column structure differs: Old({old_columns}) vs New({new_columns})"
+                ))
+                return table_results
 
-        old_data_dict = {tuple(row): row for row in old_data}
-        new_data_dict = {tuple(row): row for row in new_data}
+            missing_in_new, missing_in_old = get_row_differences(
+                old_conn, new_conn, old_schema, new_schema, table, old_table_schema, server_side, db_link
+            )
 
-        common_rows = set(old_data_dict.keys()).intersection(new_data_dict.keys())
-        for row_key in common_rows:
-            if old_data_dict[row_key] != new_data_dict[row_key]:
-                join_mismatch_results.append({
-                    "Table": table,
-                    "Type": "Data Mismatch (INNER JOIN)",
-                    "Details": f"Values differ for row {row_key}: Old({old_data_dict[row_key]}) vs New({new_data_dict[row_key]})"
-                })
+            table_results.extend(
+                (table, "Missing in New DB (LEFT JOIN)", f"Row {row} exists in Old DB but not in New DB")
+                for row in missing_in_new
+            )
+            table_results.extend(
+                (table, "Extra in New DB (RIGHT JOIN)", f"Row {row} exists in New DB but not in Old DB")
+                for row in missing_in_old
+            )
 
-        missing_in_new = set(old_data_dict.keys()) - set(new_data_dict.keys())
-        for row in missing_in_new:
-            join_mismatch_results.append({
-                "Table": table,
-                "Type": "Missing in New DB (LEFT JOIN)",
-                "Details": f"Row {row} exists in Old DB but not in New DB"
-            })
+            # The FULL OUTER JOIN difference is exactly the rows listed above,
+            # so it is reported as a count rather than repeating every row
+            if missing_in_new or missing_in_old:
+                table_results.append((
+                    table, "Full Outer Join Discrepancy",
+                    f"{len(missing_in_new) + len(missing_in_old)} rows exist in one DB but not in the other"
+                ))
 
-        missing_in_old = set(new_data_dict.keys()) - set(old_data_dict.keys())
-        for row in missing_in_old:
-            join_mismatch_results.append({
-                "Table": table,
-                "Type": "Extra in New DB (RIGHT JOIN)",
-                "Details": f"Row {row} exists in New DB but not in Old DB"
-            })
+        return table_results
 
-        for row in missing_in_old | missing_in_new:
-            join_mismatch_results.append({
-                "Table": table,
-                "Type": "Full Outer Join Discrepancy",
-                "Details": f"Row {row} exists in one DB but not in the other"
-            })
+    for table_results in run_per_table(tables, process_table):
+        join_mismatch_results.extend(table_results)
 
     save_results_in_batches(join_mismatch_results, results_dir, "sql_join_comparison")
 
@@ -852,40 +1186,47 @@ def sql_join_operation(old_conn, new_conn, old_schema, new_schema, tables, resul
 # Miscellaneous Discrepancies
 ###############################################################################
 
-def get_indexes(connection, schema_name, table_name):
+def get_all_indexes(connection, schema_name):
+    """
+    Returns table -> set of index names for the whole schema in one query.
+    """
     query = """
-      SELECT index_name
+      SELECT table_name, index_name
       FROM all_indexes
-      WHERE owner = UPPER(:schema_param)
-        AND table_name = UPPER(:table_param)
+      WHERE owner = :schema_param
     """
-    cursor = connection.cursor()
-    cursor.execute(query, schema_param=schema_name, table_param=table_name)
-    indexes = {row[0] for row in cursor.fetchall()}
-    cursor.close()
+    indexes = {}
+    with make_bulk_cursor(connection) as cursor:
+        cursor.execute(query, schema_param=schema_name.upper())
+        for table_name, index_name in cursor:
+            indexes.setdefault(table_name, set()).add(index_name)
     return indexes
 
-def get_triggers(connection, schema_name, table_name):
+def get_all_triggers(connection, schema_name):
+    """
+    Returns table -> set of trigger names for the whole schema in one query.
+    """
     query = """
-      SELECT trigger_name
+      SELECT table_name, trigger_name
       FROM all_triggers
-      WHERE table_owner = UPPER(:schema_param)
-        AND table_name = UPPER(:table_param)
+      WHERE table_owner = :schema_param
+        AND table_name IS NOT NULL
     """
-    cursor = connection.cursor()
-    cursor.execute(query, schema_param=schema_name, table_param=table_name)
-    triggers = {row[0] for row in cursor.fetchall()}
-    cursor.close()
+    triggers = {}
+    with make_bulk_cursor(connection) as cursor:
+        cursor.execute(query, schema_param=schema_name.upper())
+        for table_name, trigger_name in cursor:
+            triggers.setdefault(table_name, set()).add(trigger_name)
     return triggers
 
 def get_sequences(connection, schema_name):
     query = """
       SELECT sequence_name
       FROM all_sequences
-      WHERE sequence_owner = UPPER(:schema_param)
+      WHERE sequence_owner = :schema_param
     """
-    cursor = connection.cursor()
-    cursor.execute(query, schema_param=schema_name)
+    cursor = make_bulk_cursor(connection)
+    cursor.execute(query, schema_param=schema_name.upper())
     sequences = {row[0] for row in cursor.fetchall()}
     cursor.close()
     return sequences
@@ -894,174 +1235,229 @@ def get_views(connection, schema_name):
     query = """
       SELECT view_name
       FROM all_views
-      WHERE owner = UPPER(:schema_param)
+      WHERE owner = :schema_param
     """
-    cursor = connection.cursor()
-    cursor.execute(query, schema_param=schema_name)
+    cursor = make_bulk_cursor(connection)
+    cursor.execute(query, schema_param=schema_name.upper())
     views = {row[0] for row in cursor.fetchall()}
     cursor.close()
     return views
 
-def miscellaneous_discrepancies(old_conn, new_conn, old_schema, new_schema, results_dir):
-    misc_csv = os.path.join(results_dir, "table_hygiene_check.csv")
-    discrepancies = []
-    detailed_comparison = []
-
-    old_tables = get_table_list(old_conn, old_schema)
-    new_tables = get_table_list(new_conn, new_schema)
-    missing_tables = set(old_tables) - set(new_tables)
-    extra_tables = set(new_tables) - set(old_tables)
-    common_tables = set(old_tables).intersection(new_tables)
-
-    # Missing/extra tables
-    for t in missing_tables:
-        discrepancies.append({
-            "Type": "Missing Table",
-            "Table": t,
-            "Object": "",
-            "Details": "Table exists in old DB but not in new DB."
-        })
-    for t in extra_tables:
-        discrepancies.append({
-            "Type": "Extra Table",
-            "Table": t,
-            "Object": "",
-            "Details": "Table exists in new DB but not in old DB."
-        })
-
-    # Compare indexes, triggers in common tables
-    for t in common_tables:
-        old_idx = get_indexes(old_conn, old_schema, t)
-        new_idx = get_indexes(new_conn, new_schema, t)
-        missing_idx = old_idx - new_idx
-        extra_idx = new_idx - old_idx
-
-        for i in missing_idx:
-            discrepancies.append({
-                "Type": "Missing Index",
-                "Table": t,
-                "Object": i,
-                "Details": f"Index '{i}' is missing in new DB."
-            })
-        for i in extra_idx:
-            discrepancies.append({
-                "Type": "Extra Index",
-                "Table": t,
-                "Object": i,
-                "Details": f"Index '{i}' is extra in new DB."
-            })
-
-        old_trg = get_triggers(old_conn, old_schema, t)
-        new_trg = get_triggers(new_conn, new_schema, t)
-        missing_trg = old_trg - new_trg
-        extra_trg = new_trg - old_trg
+def query_link_differences(old_conn, old_schema, new_schema, db_link, select_list, view, owner_column,
+                           condition=""):
+    """
+    Lets the OLD database diff the `select_list` rows of a dictionary view
+    (e.g. ALL_INDEXES) against the NEW schema through `db_link` with MINUS in
+    both directions, so only the differences are transferred.
+    Returns (rows only in old, rows only in new).
+    """
+    condition = f" {condition}" if condition else ""
+    old_query = f"SELECT {select_list} FROM {view} WHERE {owner_column} = :old_owner{condition}"
+    new_query = f"SELECT {select_list} FROM {view}@{db_link} WHERE {owner_column} = :new_owner{condition}"
+    differences = []
+    with make_bulk_cursor(old_conn) as cursor:
+        for query in (f"{old_query} MINUS {new_query}", f"{new_query} MINUS {old_query}"):
+            cursor.execute(query, old_owner=old_schema.upper(), new_owner=new_schema.upper())
+            differences.append(cursor.fetchall())
+    return tuple(differences)
+
+def get_table_object_differences(old_conn, old_schema, new_schema, db_link, view, owner_column, name_column):
+    """
+    Returns (table -> names only in old, table -> names only in new) for the
+    table-level objects (indexes, triggers) of a dictionary view, diffed over `db_link`.
+    """
+    differences = query_link_differences(
+        old_conn, old_schema, new_schema, db_link, f"table_name, {name_column}", view, owner_column,
+        "AND table_name IS NOT NULL"
+    )
+    maps = []
+    for rows in differences:
+        objects = {}
+        for table_name, object_name in rows:
+            objects.setdefault(table_name, set()).add(object_name)
+        maps.append(objects)
+    return tuple(maps)
+
+def get_schema_object_differences(old_conn, old_schema, new_schema, db_link, view, owner_column, name_column):
+    """
+    Returns (names only in old, names only in new) for the schema-level
+    objects (sequences, views) of a dictionary view, diffed over `db_link`.
+    """
+    differences = query_link_differences(
+        old_conn, old_schema, new_schema, db_link, name_column, view, owner_column
+    )
+    return tuple({row[0] for row in rows} for rows in differences)
 
-        for trg in missing_trg:
-            discrepancies.append({
-                "Type": "Missing Trigger",
-                "Table": t,
-                "Object": trg,
-                "Details": f"Trigger '{trg}' is missing in new DB."
-            })
-        for trg in extra_trg:
-            discrepancies.append({
-                "Type": "Extra Trigger",
-                "Table": t,
-                "Object": trg,
-                "Details": f"Trigger '{trg}' is extra in new DB."
-            })
+def get_schema_objects(old_pool, new_pool, old_schema, new_schema, tables_only=False):
+    """
+    Returns (tables, table -> indexes, table -> triggers, sequences, views) for
+    the old and the new schema. All dictionary queries of both databases run
+    at the same time, each on its own pooled session. With `tables_only`
+    the other objects are left empty.
+    """
+    fetchers = [get_table_list, get_all_indexes, get_all_triggers, get_sequences, get_views]
+
+    def fetch(pool, fetcher, schema_name):
+        if tables_only and fetcher is not get_table_list:
+            return {} if fetcher in (get_all_indexes, get_all_triggers) else set()
+        with pool.acquire() as connection:
+            return get_cached_schema_objects(connection, schema_name, fetcher)
+
+    futures = [
+        [_SIDE_EXECUTOR.submit(fetch, pool, fetcher, schema_name) for fetcher in fetchers]
+        for pool, schema_name in ((old_pool, old_schema), (new_pool, new_schema))
+    ]
+    # Let every query finish before raising, so no session is still in use
+    wait([future for side in futures for future in side])
+    old_objects, new_objects = (tuple(future.result() for future in side) for side in futures)
+    return old_objects, new_objects
+
+def miscellaneous_discrepancies(old_pool, new_pool, old_schema, new_schema, results_dir, db_link="",
+                                detailed=True):
+    """
+    Compares tables, indexes, triggers, sequences and views of both schemas.
+    With `db_link` (OLD -> NEW), index, trigger, sequence and view differences
+    are computed by the old database and only the differing objects are fetched.
+    Without `detailed`, the per-table index/trigger rows of the detailed
+    comparison (one formatted set per side and kind) are skipped.
+    """
+    misc_csv = os.path.join(results_dir, "table_hygiene_check.csv")
 
-        detailed_comparison.append({
-            "Type": "Detailed Comparison",
-            "Table": t,
-            "Object": "Indexes/Triggers",
-            "Details": (
-                f"Old indexes={old_idx}, New indexes={new_idx}; "
-                f"Old triggers={old_trg}, New triggers={new_trg}"
+    old_objects, new_objects = get_schema_objects(old_pool, new_pool, old_schema, new_schema, bool(db_link))
+    old_tables, old_idx_map, old_trg_map, old_seq, old_vw = old_objects
+    new_tables, new_idx_map, new_trg_map, new_seq, new_vw = new_objects
+    if db_link:
+        # The maps and sets hold only the objects missing on the other side;
+        # the comparisons below then report exactly those
+        with old_pool.acquire() as old_conn:
+            old_idx_map, new_idx_map = get_table_object_differences(
+                old_conn, old_schema, new_schema, db_link, "all_indexes", "owner", "index_name"
             )
-        })
-
-    # Compare sequences
-    old_seq = get_sequences(old_conn, old_schema)
-    new_seq = get_sequences(new_conn, new_schema)
-    missing_seq = old_seq - new_seq
-    extra_seq = new_seq - old_seq
-
-    for s in missing_seq:
-        discrepancies.append({
-            "Type": "Missing Sequence",
-            "Table": "",
-            "Object": s,
-            "Details": f"Sequence '{s}' is missing in new DB."
-        })
-    for s in extra_seq:
-        discrepancies.append({
-            "Type": "Extra Sequence",
-            "Table": "",
-            "Object": s,
-            "Details": f"Sequence '{s}' is extra in new DB."
-        })
-
-    # Compare views
-    old_vw = get_views(old_conn, old_schema)
-    new_vw = get_views(new_conn, new_schema)
-    missing_vw = old_vw - new_vw
-    extra_vw = new_vw - old_vw
-
-    for v in missing_vw:
-        discrepancies.append({
-            "Type": "Missing View",
-            "Table": "",
-            "Object": v,
-            "Details": f"View '{v}' is missing in new DB."
-        })
-    for v in extra_vw:
-        discrepancies.append({
-            "Type": "Extra View",
-            "Table": "",
-            "Object": v,
-            "Details": f"View '{v}' is extra in new DB."
-        })
-
-    detailed_comparison.append({
-        "Type": "Detailed Comparison",
-        "Table": "",
-        "Object": "Sequences",
-        "Details": f"Old sequences={old_seq}, New sequences={new_seq}"
-    })
-    detailed_comparison.append({
-        "Type": "Detailed Comparison",
-        "Table": "",
-        "Object": "Views",
-        "Details": f"Old views={old_vw}, New views={new_vw}"
-    })
-
-    with open(misc_csv, "w", newline="") as f:
-        fieldnames = ["Type", "Table", "Object", "Details"]
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-
-        if discrepancies:
-            writer.writerows(discrepancies)
+            old_trg_map, new_trg_map = get_table_object_differences(
+                old_conn, old_schema, new_schema, db_link, "all_triggers", "table_owner", "trigger_name"
+            )
+            old_seq, new_seq = get_schema_object_differences(
+                old_conn, old_schema, new_schema, db_link, "all_sequences", "sequence_owner", "sequence_name"
+            )
+            old_vw, new_vw = get_schema_object_differences(
+                old_conn, old_schema, new_schema, db_link, "all_views", "owner", "view_name"
+            )
+    old_table_set = set(old_tables)
+    new_table_set = set(new_tables)
+    missing_tables = old_table_set - new_table_set
+    extra_tables = new_table_set - old_table_set
+    common_tables = old_table_set & new_table_set
+    # Only tables with an index or trigger on either side (with a link: with
+    # a difference) can differ here
+    tables_with_objects = (
+        set(old_idx_map) | set(new_idx_map) | set(old_trg_map) | set(new_trg_map)
+    ) & common_tables
+
+    def hygiene_results():
+        """
+        Yields (discrepancies, details) for the table lists, then for each
+        common table, then for sequences and views, so the report is written
+        as it is produced.
+        """
+        # Missing/extra tables
+        discrepancies = []
+        discrepancies.extend((
+            "Missing Table", t, "", "Table exists in old DB but not in new DB."
+        ) for t in missing_tables)
+        discrepancies.extend((
+            "Extra Table", t, "", "Table exists in new DB but not in old DB."
+        ) for t in extra_tables)
+        yield discrepancies, []
+
+        # Compare indexes, triggers in common tables
+        for t in tables_with_objects:
+            discrepancies = []
+            detailed_comparison = []
+            old_idx = old_idx_map.get(t, set())
+            new_idx = new_idx_map.get(t, set())
+            missing_idx = old_idx - new_idx
+            extra_idx = new_idx - old_idx
+
+            discrepancies.extend((
+                "Missing Index", t, i, f"Index '{i}' is missing in new DB."
+            ) for i in missing_idx)
+            discrepancies.extend((
+                "Extra Index", t, i, f"Index '{i}' is extra in new DB."
+            ) for i in extra_idx)
+
+            old_trg = old_trg_map.get(t, set())
+            new_trg = new_trg_map.get(t, set())
+            missing_trg = old_trg - new_trg
+            extra_trg = new_trg - old_trg
+
+            discrepancies.extend((
+                "Missing Trigger", t, trg, f"Trigger '{trg}' is missing in new DB."
+            ) for trg in missing_trg)
+            discrepancies.extend((
+                "Extra Trigger", t, trg, f"Trigger '{trg}' is extra in new DB."
+            ) for trg in extra_trg)
+
+            if not detailed:
+                yield discrepancies, detailed_comparison
+                continue
+            if db_link:
+                details = (
+                    f"Indexes only in old={old_idx}, only in new={new_idx}; "
+                    f"Triggers only in old={old_trg}, only in new={new_trg}"
+                )
+            else:
+                details = (
+                    f"Old indexes={old_idx}, New indexes={new_idx}; "
+                    f"Old triggers={old_trg}, New triggers={new_trg}"
+                )
+            detailed_comparison.append(("Detailed Comparison", t, "Indexes/Triggers", details))
+            yield discrepancies, detailed_comparison
+
+        # Compare sequences
+        discrepancies = []
+        detailed_comparison = []
+        if detailed and len(common_tables) > len(tables_with_objects):
+            if db_link:
+                summary = "have identical indexes and triggers"
+            else:
+                summary = "have no indexes or triggers in either DB"
+            detailed_comparison.append((
+                "Detailed Comparison", "", "Indexes/Triggers",
+                f"{len(common_tables) - len(tables_with_objects)} common tables {summary}"
+            ))
+        missing_seq = old_seq - new_seq
+        extra_seq = new_seq - old_seq
+
+        discrepancies.extend((
+            "Missing Sequence", "", s, f"Sequence '{s}' is missing in new DB."
+        ) for s in missing_seq)
+        discrepancies.extend((
+            "Extra Sequence", "", s, f"Sequence '{s}' is extra in new DB."
+        ) for s in extra_seq)
+
+        # Compare views
+        missing_vw = old_vw - new_vw
+        extra_vw = new_vw - old_vw
+
+        discrepancies.extend((
+            "Missing View", "", v, f"View '{v}' is missing in new DB."
+        ) for v in missing_vw)
+        discrepancies.extend((
+            "Extra View", "", v, f"View '{v}' is extra in new DB."
+        ) for v in extra_vw)
+
+        if db_link:
+            sequence_details = f"Sequences only in old={old_seq}, only in new={new_seq}"
+            view_details = f"Views only in old={old_vw}, only in new={new_vw}"
         else:
-            writer.writerow({
-                "Type": "No discrepancies noted",
-                "Table": "",
-                "Object": "",
-                "Details": ""
-            })
+            sequence_details = f"Old sequences={old_seq}, New sequences={new_seq}"
+            view_details = f"Old views={old_vw}, New views={new_vw}"
+        detailed_comparison.append(("Detailed Comparison", "", "Sequences", sequence_details))
+        detailed_comparison.append(("Detailed Comparison", "", "Views", view_details))
+        yield discrepancies, detailed_comparison
 
-        writer.writerow({})
-        writer.writerow({})
-
-        writer.writerow({
-            "Type": "Detailed Comparison Below",
-            "Table": "",
-            "Object": "",
-            "Details": ""
-        })
-        writer.writerow({})
-        writer.writerows(detailed_comparison)
+    fieldnames = ["Type", "Table", "Object", "Details"]
+    write_report_in_batches(misc_csv, fieldnames, hygiene_results())
 
     print(f"[INFO] Miscellaneous discrepancies saved to {misc_csv}")
 
@@ -1084,7 +1480,7 @@ def main():
         old_schema = old_db_config["schema"]
         new_schema = new_db_config["schema"]
 
-        send_telegram_notification(BOT_TOKEN, CHAT_IDS,f"🔍 Starting Migration Run {run_num} of {num_iterations} for Database: {old_schema} -> {new_schema}...")
+        queue_telegram_notification(BOT_TOKEN, CHAT_IDS,f"🔍 Starting Migration Run {run_num} of {num_iterations} for Database: {old_schema} -> {new_schema}...")
 
         print(f"\n[INFO] Starting Migration Run {run_num} of {num_iterations} for Database: {old_schema} -> {new_schema}...")
 
@@ -1098,48 +1494,70 @@ def main():
         total_steps = 7
         step = 0
 
+        old_pool = new_pool = old_conn = new_conn = None
         try:
             print("\n[INFO] Establishing database connections...")
-            old_conn = get_oracle_connection(old_db_config)
-            new_conn = get_oracle_connection(new_db_config)
+            # Pools for the per-table steps, plus one session each for the rest
+            old_pool = get_oracle_pool(old_db_config)
+            new_pool = get_oracle_pool(new_db_config)
+            old_conn = old_pool.acquire()
+            new_conn = new_pool.acquire()
             print("Connection Established Successfully!!")
-            send_telegram_notification(BOT_TOKEN, CHAT_IDS,f"✅ Database Connection Established Successfully for {old_schema} -> {new_schema}!")
+            queue_telegram_notification(BOT_TOKEN, CHAT_IDS,f"✅ Database Connection Established Successfully for {old_schema} -> {new_schema}!")
+
+            # Column metadata for all tables in one query per side, reused from
+            # an earlier run when no DDL has happened in the schema since
+            query_both_sides(
+                lambda: refresh_schema_metadata(old_conn, old_schema),
+                lambda: refresh_schema_metadata(new_conn, new_schema)
+            )
+
+            old_tables, new_tables = query_both_sides(
+                lambda: get_cached_schema_objects(old_conn, old_schema, get_table_list),
+                lambda: get_cached_schema_objects(new_conn, new_schema, get_table_list)
+            )
+            # Immutable and in table_name order, so every per-table report
+            # lists tables in the same order from run to run
+            common_tables = tuple(sorted(set(old_tables).intersection(new_tables)))
 
-            old_tables = get_table_list(old_conn, old_schema)
-            new_tables = get_table_list(new_conn, new_schema)
-            common_tables = set(old_tables).intersection(new_tables)
+            # Row differences can be computed by the old database when it can
+            # see the new schema: through the DB link, or on the same database
+            db_link = params["db_link"]
+            server_side = bool(db_link) or old_db_config["dsn"] == new_db_config["dsn"]
 
             steps = [
-                ("Validating Table Sanity", miscellaneous_discrepancies,[old_conn, new_conn, old_schema, new_schema, results_dir]),
+                ("Validating Table Sanity", miscellaneous_discrepancies,[old_pool, new_pool, old_schema, new_schema, results_dir, db_link, params["hygiene_details"]]),
                 ("Validating Schema", schema_validation, [old_conn, new_conn, old_schema, new_schema, results_dir]),
                 ("Checking Row Counts", count_validation, [old_conn, new_conn, old_schema, new_schema, results_dir]),
-                ("Performing Aggregate Checks", aggregate_function_validation,[old_conn, new_conn, old_schema, new_schema, common_tables, results_dir]),
-                ("Running SQL Join Validations", sql_join_operation,[old_conn, new_conn, old_schema, new_schema, common_tables, results_dir]),
-                ("Comparing Data", value_by_value_check,[old_conn, new_conn, old_schema, new_schema, common_tables, results_dir]),
-                ("Checking for NULL Values", null_value_verification,[old_conn, new_conn, old_schema, new_schema, common_tables, results_dir])
+                ("Performing Aggregate Checks", aggregate_function_validation,[old_pool, new_pool, old_schema, new_schema, common_tables, results_dir, db_link]),
+                ("Running SQL Join Validations", sql_join_operation,[old_pool, new_pool, old_schema, new_schema, common_tables, results_dir, server_side, db_link]),
+                ("Comparing Data", value_by_value_check,[old_pool, new_pool, old_schema, new_schema, common_tables, results_dir, server_side, db_link]),
+                ("Checking for NULL Values", null_value_verification,[old_pool, new_pool, old_schema, new_schema, common_tables, results_dir])
             ]
 
             for task_name, function, args in steps:
                 progress = int((step / total_steps) * 100)
-                send_telegram_notification(BOT_TOKEN, CHAT_IDS,f"📊 Progress: {progress}% - {task_name} for {old_schema} -> {new_schema}...")
+                queue_telegram_notification(BOT_TOKEN, CHAT_IDS,f"📊 Progress: {progress}% - {task_name} for {old_schema} -> {new_schema}...")
                 function(*args)
                 step += 1
 
-            send_telegram_notification(BOT_TOKEN, CHAT_IDS,f"✅ Data Migration Audit Run {run_num} Completed Successfully for {old_schema} -> {new_schema}!")
+            queue_telegram_notification(BOT_TOKEN, CHAT_IDS,f"✅ Data Migration Audit Run {run_num} Completed Successfully for {old_schema} -> {new_schema}!")
             print(f"\n[INFO] Data Migration Audit Run {run_num} Completed Successfully for {old_schema} -> {new_schema}!")
 
         except Exception as e:
-            send_telegram_notification(BOT_TOKEN, CHAT_IDS,f"⚠️ Error in Run {run_num} for {old_schema} -> {new_schema}: {str(e)}")
+            queue_telegram_notification(BOT_TOKEN, CHAT_IDS,f"⚠️ Error in Run {run_num} for {old_schema} -> {new_schema}: {str(e)}")
             print(f"[ERROR] Migration Run {run_num} failed for {old_schema} -> {new_schema}: {e}")
 
         finally:
             close_connection(old_conn)
             close_connection(new_conn)
+            close_connection(old_pool)
+            close_connection(new_pool)
             print("Connection Closed!!")
-            send_telegram_notification(BOT_TOKEN, CHAT_IDS,f"❎ Database Connection Closed for Run {run_num} ({old_schema} -> {new_schema})!")
+            queue_telegram_notification(BOT_TOKEN, CHAT_IDS,f"❎ Database Connection Closed for Run {run_num} ({old_schema} -> {new_schema})!")
 
     print("\n[INFO] All Migration Runs Completed Successfully!")
-    send_telegram_notification(BOT_TOKEN, CHAT_IDS, "🎉 All Migration Runs Completed Successfully!")
+    queue_telegram_notification(BOT_TOKEN, CHAT_IDS, "🎉 All Migration Runs Completed Successfully!")
 
 
 if __name__ == "__main__":
@@ -1,17 +1,82 @@
 import oracledb
 import csv
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-def get_oracle_connection(user, password, dsn):
+# Print a line for every compared row (slow on large tables; per-table and
+# mismatch lines are always printed)
+VERBOSE = False
+
+# Tables compared concurrently, each with its own pair of pooled sessions
+MAX_WORKERS = 8
+
+# Tables with at least this many rows (per optimizer statistics) and a single
+# integer primary key are split into RANGE_PARTITIONS key ranges, compared by
+# RANGE_WORKERS threads
+PARTITION_MIN_ROWS = 1000000
+RANGE_PARTITIONS = 4
+RANGE_WORKERS = 4
+
+# Rows per round trip for bulk fetches (the driver default is 100)
+FETCH_ARRAYSIZE = 10000
+# Rows per round trip when streaming (pk, hash) pairs, which are much narrower
+HASH_ARRAYSIZE = 50000
+# Oracle accepts at most 1000 expressions in an IN-list
+IN_LIST_CHUNK = 1000
+
+# Write buffer for the CSV reports: one write() syscall per MiB instead of per row
+CSV_BUFFER_SIZE = 1 << 20
+
+# Mismatches are plain tuples in this column order
+MISMATCH_FIELDS = ("Table", "Primary Key", "Column", "Old Value", "New Value", "Details")
+
+# Column types that can be concatenated into a row hash
+# (DATE and TIMESTAMP columns are formatted separately in row_text_expression)
+HASHABLE_TYPES = ("VARCHAR2", "NVARCHAR2", "CHAR", "NCHAR", "NUMBER", "FLOAT",
+                  "BINARY_FLOAT", "BINARY_DOUBLE", "RAW")
+
+def init_session(connection, requested_tag):
+    # Tables are merge-joined in Python by primary key, so ORDER BY must
+    # sort strings by code point, the way Python compares them
+    cursor = connection.cursor()
+    cursor.execute("ALTER SESSION SET NLS_SORT = BINARY")
+    cursor.close()
+
+def get_oracle_pool(user, password, dsn):
+    """
+    Creates a session pool so each worker thread can use its own connection.
+    acquire() waits for a free session once all of them are in use.
+    """
     try:
-        connection = oracledb.connect(user=user, password=password, dsn=dsn)
+        pool = oracledb.create_pool(
+            user=user,
+            password=password,
+            dsn=dsn,
+            min=MAX_WORKERS,
+            # Table workers give up their session before waiting on range
+            # workers, so this many sessions can never be exhausted
+            max=MAX_WORKERS + RANGE_WORKERS,
+            increment=1,
+            getmode=oracledb.POOL_GETMODE_WAIT,
+            session_callback=init_session
+        )
         print(f"[INFO] Connected to {dsn} as {user}")
-        return connection
+        return pool
     except oracledb.DatabaseError as e:
         print(f"[ERROR] Connection failed: {e}")
         raise
 
+def make_bulk_cursor(connection, arraysize=FETCH_ARRAYSIZE):
+    """
+    Returns a cursor tuned for multi-row fetches. prefetchrows is arraysize + 1
+    so a result that fits in one batch needs no extra round trip to detect the end.
+    """
+    cursor = connection.cursor()
+    cursor.arraysize = arraysize
+    cursor.prefetchrows = arraysize + 1
+    return cursor
+
 def execute_query(cursor, query, params=None):
     try:
         cursor.execute(query, params or {})
@@ -21,11 +86,12 @@ def execute_query(cursor, query, params=None):
         raise
 
 def get_table_list(connection):
-    cursor = connection.cursor()
-    query = "SELECT table_name FROM user_tables"
+    cursor = make_bulk_cursor(connection)
+    # Sorted by the database; NLS_SORT = BINARY matches Python's string order
+    query = "SELECT table_name FROM user_tables ORDER BY table_name"
     tables = execute_query(cursor, query)
     cursor.close()
-    return sorted([row[0] for row in tables])  # Sort table names alphabetically
+    return [row[0] for row in tables]
 
 def get_primary_key_columns(connection, table_name):
     cursor = connection.cursor()
@@ -42,35 +108,188 @@ def get_primary_key_columns(connection, table_name):
     cursor.close()
     return pk_columns
 
-def get_primary_keys(connection, table_name, pk_columns):
+def get_column_types(connection, table_name):
     cursor = connection.cursor()
-    pk_query = f"SELECT {', '.join(pk_columns)} FROM {table_name}"
-    cursor.execute(pk_query)
-    pk_rows = cursor.fetchall()
+    query = """
+        SELECT column_name, data_type
+        FROM user_tab_columns
+        WHERE table_name = :table_name
+        ORDER BY column_id
+    """
+    cursor.execute(query, table_name=table_name.upper())
+    column_types = {row[0]: row[1] for row in cursor.fetchall()}
     cursor.close()
-    return sorted(pk_rows, key=lambda x: x[0])  # Sort primary keys numerically
+    return column_types
 
-def fetch_row_by_pk(connection, table_name, pk_columns, pk_values):
-    pk_clause = " AND ".join([f"{col} = :{idx+1}" for idx, col in enumerate(pk_columns)])
-    query = f"SELECT * FROM {table_name} WHERE {pk_clause}"
-    cursor = connection.cursor()
-    cursor.execute(query, pk_values)
-    row = cursor.fetchone()
-    columns = [desc[0] for desc in cursor.description] if row else []
-    cursor.close()
-    return columns, row
+def row_text_expression(column_types):
+    """
+    Builds a concatenation of every column that no two different rows share,
+    or returns None when a column type (e.g. LOBs, LONG) cannot be
+    concatenated. Each value is prefixed with its length and NULL is written
+    as N. Dates and timestamps are formatted explicitly so the time part is
+    always included.
+    """
+    parts = []
+    for col, data_type in column_types.items():
+        if data_type == "DATE":
+            parts.append(f"TO_CHAR({col}, 'YYYY-MM-DD HH24:MI:SS')")
+        elif data_type.startswith("TIMESTAMP"):
+            tz = " TZR" if "TIME ZONE" in data_type else ""
+            parts.append(f"TO_CHAR({col}, 'YYYY-MM-DD HH24:MI:SS.FF9{tz}')")
+        elif data_type in HASHABLE_TYPES:
+            parts.append(col)
+        else:
+            return None
+    return " || ".join(f"NVL2({part}, LENGTH({part}) || ':' || {part}, 'N')" for part in parts)
+
+def pk_order_hint(pk_columns, pk_range=None):
+    """
+    Hint for the key-range streams: range-scan the primary key index in key
+    order, so a slice of a large table comes back sorted without reading the
+    rest of it. Whole-table streams get no hint; for them a full scan plus
+    sort usually beats a full index walk with a ROWID lookup per row, so the
+    plan is left to the optimizer. The index is named by its columns, so no
+    dictionary lookup is needed.
+    """
+    if pk_range is None:
+        return ""
+    return f"/*+ INDEX_ASC(t ({', '.join(pk_columns)})) */ "
+
+def pk_range_filter(pk_columns, pk_range):
+    """
+    Returns (WHERE clause, binds) limiting a query to the half-open key range
+    [low, high) of a single-column primary key, or ("", {}) for the whole table.
+    """
+    if pk_range is None:
+        return "", {}
+    return f"WHERE {pk_columns[0]} >= :low AND {pk_columns[0]} < :high", {"low": pk_range[0], "high": pk_range[1]}
+
+def fetch_row_hashes(connection, table_name, pk_columns, text_expr, pk_range=None):
+    """
+    Streams (primary key tuple, MD5 of the row) pairs ordered by primary key.
+    Only the key and a 16 byte hash cross the network for each row.
+    """
+    cursor = make_bulk_cursor(connection, HASH_ARRAYSIZE)
+    pk_list = ", ".join(pk_columns)
+    where, binds = pk_range_filter(pk_columns, pk_range)
+    cursor.execute(f"""
+        SELECT {pk_order_hint(pk_columns, pk_range)}{pk_list}, STANDARD_HASH({text_expr}, 'MD5') h
+        FROM {table_name} t
+        {where}
+        ORDER BY {pk_list}
+    """, binds)
+    key_len = len(pk_columns)
+    try:
+        while True:
+            batch = cursor.fetchmany(HASH_ARRAYSIZE)
+            if not batch:
+                break
+            for row in batch:
+                yield row[:key_len], row[key_len]
+    finally:
+        cursor.close()
+
+def fetch_rows_by_pk(connection, table_name, pk_columns, pk_values_list):
+    """
+    Fetches full rows for the given primary key tuples, IN_LIST_CHUNK keys per
+    query. The statement is prepared once per table: the last chunk is padded
+    by repeating its final key, so every execute reuses the same parse.
+    Returns (columns, {pk tuple: row}).
+    """
+    columns, rows_by_pk = [], {}
+    if not pk_values_list:
+        return columns, rows_by_pk
+
+    key_len = len(pk_columns)
+    if key_len == 1:
+        key_ref, placeholder = pk_columns[0], ":{}"
+    else:
+        key_ref = f"({', '.join(pk_columns)})"
+        placeholder = "(" + ", ".join(f":{{{i}}}" for i in range(key_len)) + ")"
+    chunk_size = min(IN_LIST_CHUNK, len(pk_values_list))
+    in_list = ", ".join(
+        placeholder.format(*range(n * key_len + 1, (n + 1) * key_len + 1))
+        for n in range(chunk_size)
+    )
+
+    cursor = make_bulk_cursor(connection)
+    try:
+        cursor.prepare(f"SELECT * FROM {table_name} WHERE {key_ref} IN ({in_list})")
+        for start in range(0, len(pk_values_list), chunk_size):
+            chunk = pk_values_list[start:start + chunk_size]
+            chunk += [chunk[-1]] * (chunk_size - len(chunk))
+            cursor.execute(None, [value for pk_values in chunk for value in pk_values])
+            if not columns:
+                columns = [desc[0] for desc in cursor.description]
+                pk_idx = [columns.index(col) for col in pk_columns]
+            for row in cursor.fetchall():
+                rows_by_pk[tuple(row[i] for i in pk_idx)] = row
+    finally:
+        cursor.close()
+    return columns, rows_by_pk
+
+def fetch_rows_in_pk_order(connection, table_name, pk_columns, pk_range=None):
+    """
+    Streams all rows of a table ordered by its primary key, FETCH_ARRAYSIZE
+    rows per round trip. Returns (columns, row iterator); the cursor is
+    closed once the iterator is exhausted.
+    """
+    cursor = make_bulk_cursor(connection)
+    where, binds = pk_range_filter(pk_columns, pk_range)
+    cursor.execute(
+        f"SELECT {pk_order_hint(pk_columns, pk_range)}t.* FROM {table_name} t {where} ORDER BY {', '.join(pk_columns)}",
+        binds
+    )
+    columns = [desc[0] for desc in cursor.description]
+
+    def rows():
+        try:
+            while True:
+                batch = cursor.fetchmany(FETCH_ARRAYSIZE)
+                if not batch:
+                    break
+                yield from batch
+        finally:
+            cursor.close()
+
+    return columns, rows()
+
+def merge_by_pk(old_items, new_items, old_key, new_key):
+    """
+    Walks two streams ordered by primary key together, yielding
+    (old_item, new_item) pairs; the item missing on one side is None.
+    """
+    old_item = next(old_items, None)
+    new_item = next(new_items, None)
+    while old_item is not None or new_item is not None:
+        old_pk = old_key(old_item) if old_item is not None else None
+        new_pk = new_key(new_item) if new_item is not None else None
+
+        if new_pk is None or (old_pk is not None and old_pk < new_pk):
+            yield old_item, None
+            old_item = next(old_items, None)
+        elif old_pk is None or new_pk < old_pk:
+            yield None, new_item
+            new_item = next(new_items, None)
+        else:
+            yield old_item, new_item
+            old_item = next(old_items, None)
+            new_item = next(new_items, None)
+
+def record_missing_in_old(new_row, pk_values, table_name, mismatches):
+    print(f"[DISCREPANCY] Row with PK {pk_values} missing in old DB.")
+    mismatches.append((table_name, pk_values, "N/A", "Row Missing", new_row,
+                       "Row exists in new DB but missing in old DB"))
 
 def compare_rows(old_row, new_row, columns, pk_values, table_name, mismatches):
     if not new_row:
         print(f"[DISCREPANCY] Row with PK {pk_values} missing in new DB.")
-        mismatches.append({
-            "Table": table_name,
-            "Primary Key": pk_values,
-            "Column": "N/A",
-            "Old Value": old_row,
-            "New Value": "Row Missing",
-            "Details": "Row exists in old DB but missing in new DB"
-        })
+        mismatches.append((table_name, pk_values, "N/A", old_row, "Row Missing",
+                           "Row exists in old DB but missing in new DB"))
+        return
+
+    # Whole-tuple equality runs in C; only differing rows pay for the column loop
+    if old_row == new_row:
         return
 
     for idx, col in enumerate(columns):
@@ -78,71 +297,258 @@ def compare_rows(old_row, new_row, columns, pk_values, table_name, mismatches):
             print(f"[MISMATCH] Table: {table_name}, PK: {pk_values}, Column: {col}")
             print(f"  Old Value: {old_row[idx]}")
             print(f"  New Value: {new_row[idx]}")
-            mismatches.append({
-                "Table": table_name,
-                "Primary Key": pk_values,
-                "Column": col,
-                "Old Value": old_row[idx],
-                "New Value": new_row[idx],
-                "Details": "Value Mismatch"
-            })
-
-def compare_entire_database(old_conn, new_conn, output_dir):
-    mismatches = []
-    tables_without_pk = []
+            mismatches.append((table_name, pk_values, col, old_row[idx], new_row[idx], "Value Mismatch"))
 
-    # Get and sort table lists
-    old_tables = get_table_list(old_conn)
-    new_tables = get_table_list(new_conn)
-    common_tables = sorted(set(old_tables).intersection(new_tables))  # Sort alphabetically
+def compare_table_via_minus(old_conn, table, pk_columns, column_types, db_link, mismatches):
+    """
+    Lets the OLD database diff the table against the NEW one over `db_link`
+    with MINUS in both directions, so only the delta reaches Python. Delta
+    rows are paired back up on the primary key to classify them.
+    """
+    new_ref = f"{table}@{db_link}"
+    # MINUS matches columns by position: name them so both sides line up
+    columns = list(column_types)
+    col_list = ", ".join(columns)
+    cursor = make_bulk_cursor(old_conn)
+    try:
+        cursor.execute(f"""
+            SELECT 'OLD' side, d.* FROM (
+                SELECT {col_list} FROM {table} MINUS SELECT {col_list} FROM {new_ref}
+            ) d
+            UNION ALL
+            SELECT 'NEW' side, d.* FROM (
+                SELECT {col_list} FROM {new_ref} MINUS SELECT {col_list} FROM {table}
+            ) d
+        """)
+        pk_idx = [columns.index(col) for col in pk_columns]
+        old_delta, new_delta = {}, {}
+        for row in cursor:
+            delta = old_delta if row[0] == "OLD" else new_delta
+            delta[tuple(row[i + 1] for i in pk_idx)] = row[1:]
+    finally:
+        cursor.close()
 
-    for table in common_tables:
-        print(f"\n[INFO] Comparing table: {table}")
-        pk_columns = get_primary_key_columns(old_conn, table)
-        if not pk_columns:
-            print(f"[WARN] No primary key found for table {table}. Logging and Skipping.")
-            tables_without_pk.append({"Table": table})
+    for pk_values in sorted(old_delta.keys() | new_delta.keys()):
+        old_row = old_delta.get(pk_values)
+        if old_row is None:
+            record_missing_in_old(new_delta[pk_values], pk_values, table, mismatches)
             continue
+        if VERBOSE:
+            print(f"[INFO] Comparing row with PK {pk_values} in table {table}")
+        compare_rows(old_row, new_delta.get(pk_values), columns, pk_values, table, mismatches)
 
-        # Get and sort primary keys
-        pk_rows = get_primary_keys(old_conn, table, pk_columns)
+def compare_table_rows(old_conn, new_conn, table, pk_columns, mismatches, pk_range=None):
+    """One ordered scan of full rows per side, merge-joined on the primary key."""
+    old_columns, old_rows = fetch_rows_in_pk_order(old_conn, table, pk_columns, pk_range)
+    new_columns, new_rows = fetch_rows_in_pk_order(new_conn, table, pk_columns, pk_range)
+    old_pk_idx = [old_columns.index(col) for col in pk_columns]
+    new_pk_idx = [new_columns.index(col) for col in pk_columns]
+    old_key = lambda row: tuple(row[i] for i in old_pk_idx)
+    new_key = lambda row: tuple(row[i] for i in new_pk_idx)
 
-        for pk_values in pk_rows:
+    for old_row, new_row in merge_by_pk(old_rows, new_rows, old_key, new_key):
+        if old_row is None:
+            record_missing_in_old(new_row, new_key(new_row), table, mismatches)
+            continue
+        pk_values = old_key(old_row)
+        if VERBOSE:
             print(f"[INFO] Comparing row with PK {pk_values} in table {table}")
+        compare_rows(old_row, new_row, old_columns, pk_values, table, mismatches)
 
-            old_columns, old_row = fetch_row_by_pk(old_conn, table, pk_columns, pk_values)
-            _, new_row = fetch_row_by_pk(new_conn, table, pk_columns, pk_values)
-
-            if old_row:
-                compare_rows(old_row, new_row, old_columns, pk_values, table, mismatches)
-            else:
-                print(f"[DISCREPANCY] Row with PK {pk_values} missing in old DB.")
-                mismatches.append({
-                    "Table": table,
-                    "Primary Key": pk_values,
-                    "Column": "N/A",
-                    "Old Value": "Row Missing",
-                    "New Value": new_row,
-                    "Details": "Row exists in new DB but missing in old DB"
-                })
-
-    # Save results to CSV
-    save_mismatches_to_csv(mismatches, output_dir)
-    save_tables_without_pk_to_csv(tables_without_pk, output_dir)
+def compare_table_by_hash(old_conn, new_conn, table, pk_columns, text_expr, mismatches, pk_range=None):
+    """
+    Merge-joins (pk, row hash) streams from both sides and only fetches full
+    rows for keys whose hashes differ or that exist on one side only.
+    """
+    old_hashes = fetch_row_hashes(old_conn, table, pk_columns, text_expr, pk_range)
+    new_hashes = fetch_row_hashes(new_conn, table, pk_columns, text_expr, pk_range)
+    key = lambda item: item[0]
 
-def save_mismatches_to_csv(mismatches, output_dir):
-    if not mismatches:
-        print("\n[INFO] No mismatches found. Database comparison completed successfully.")
+    changed_pks, old_only_pks, new_only_pks = [], [], []
+    for old_item, new_item in merge_by_pk(old_hashes, new_hashes, key, key):
+        if new_item is None:
+            old_only_pks.append(old_item[0])
+        elif old_item is None:
+            new_only_pks.append(new_item[0])
+        elif old_item[1] != new_item[1]:
+            changed_pks.append(old_item[0])
+
+    if not (changed_pks or old_only_pks or new_only_pks):
         return
 
+    columns, old_rows = fetch_rows_by_pk(old_conn, table, pk_columns, changed_pks + old_only_pks)
+    _, new_rows = fetch_rows_by_pk(new_conn, table, pk_columns, changed_pks + new_only_pks)
+
+    for pk_values in sorted(changed_pks + old_only_pks + new_only_pks):
+        old_row = old_rows.get(pk_values)
+        if old_row is None:
+            record_missing_in_old(new_rows.get(pk_values), pk_values, table, mismatches)
+            continue
+        if VERBOSE:
+            print(f"[INFO] Comparing row with PK {pk_values} in table {table}")
+        compare_rows(old_row, new_rows.get(pk_values), columns, pk_values, table, mismatches)
+
+def compare_table_in_python(old_conn, new_conn, table, pk_columns, text_expr, mismatches, pk_range=None):
+    """Hash pre-pass when the row can be hashed, otherwise the full-row merge."""
+    if text_expr is not None:
+        try:
+            compare_table_by_hash(old_conn, new_conn, table, pk_columns, text_expr, mismatches, pk_range)
+            return
+        except oracledb.DatabaseError as e:
+            # e.g. STANDARD_HASH missing (pre-12c) or a row text over the 4000 byte VARCHAR2 limit (ORA-01489)
+            print(f"[WARN] Row hashing failed for {table}, comparing full rows: {e}")
+            mismatches.clear()
+
+    compare_table_rows(old_conn, new_conn, table, pk_columns, mismatches, pk_range)
+
+def get_pk_ranges(old_conn, new_conn, table, pk_columns):
+    """
+    Splits a large table with a single integer primary key into
+    RANGE_PARTITIONS half-open key ranges spanning both sides.
+    The size comes from the optimizer statistics (USER_TABLES.NUM_ROWS), so
+    small tables cost no scan; only candidates read MIN/MAX of the key, which
+    Oracle takes from the two ends of the primary key index.
+    Returns None when the table should be compared in one piece.
+    """
+    if len(pk_columns) != 1:
+        return None
+    pk = pk_columns[0]
+    connections = (old_conn, new_conn)
+
+    row_count = 0
+    for connection in connections:
+        cursor = connection.cursor()
+        rows = execute_query(cursor, "SELECT num_rows FROM user_tables WHERE table_name = :table_name",
+                             {"table_name": table})
+        cursor.close()
+        if rows and rows[0][0]:
+            row_count = max(row_count, rows[0][0])
+    if row_count < PARTITION_MIN_ROWS:
+        return None
+
+    # Separate scalar subqueries, so each can use an index MIN/MAX lookup
+    query = f"SELECT (SELECT MIN({pk}) FROM {table}), (SELECT MAX({pk}) FROM {table}) FROM dual"
+    bounds = []
+    for connection in connections:
+        cursor = connection.cursor()
+        low, high = execute_query(cursor, query)[0]
+        cursor.close()
+        bounds += [value for value in (low, high) if value is not None]
+
+    if not bounds or not all(type(value) is int for value in bounds):
+        return None
+    low, high = min(bounds), max(bounds) + 1
+    edges = [low + (high - low) * i // RANGE_PARTITIONS for i in range(RANGE_PARTITIONS)] + [high]
+    return [(start, end) for start, end in zip(edges, edges[1:]) if start < end]
+
+# Compares the key ranges of large tables. Range tasks never submit work
+# themselves, so table workers waiting on them cannot deadlock.
+_RANGE_EXECUTOR = ThreadPoolExecutor(max_workers=RANGE_WORKERS)
+
+def compare_pk_range(table, pk_columns, text_expr, pk_range, old_pool, new_pool):
+    """Compares one key range of a table on its own pair of pooled sessions."""
+    mismatches = []
+    with old_pool.acquire() as old_conn, new_pool.acquire() as new_conn:
+        compare_table_in_python(old_conn, new_conn, table, pk_columns, text_expr, mismatches, pk_range)
+    return mismatches
+
+def compare_one_table(table, old_pool, new_pool, db_link=""):
+    """
+    Compares one table on its own pair of pooled sessions.
+    Returns (mismatches, has_primary_key).
+    """
+    mismatches = []
+    print(f"\n[INFO] Comparing table: {table}")
+    with old_pool.acquire() as old_conn, new_pool.acquire() as new_conn:
+        pk_columns = get_primary_key_columns(old_conn, table)
+        if not pk_columns:
+            print(f"[WARN] No primary key found for table {table}. Logging and Skipping.")
+            return mismatches, False
+
+        # Keys are ordered and compared in Python, which needs the same key
+        # types on both sides (e.g. NUMBER and VARCHAR2 keys do not compare)
+        column_types = get_column_types(old_conn, table)
+        new_column_types = get_column_types(new_conn, table)
+        old_pk_types = [column_types.get(col) for col in pk_columns]
+        new_pk_types = [new_column_types.get(col) for col in pk_columns]
+        if old_pk_types != new_pk_types:
+            print(f"[WARN] Primary key types differ for table {table}. Logging and Skipping.")
+            mismatches.append((table, "N/A", ", ".join(pk_columns), old_pk_types, new_pk_types,
+                               "Primary key column types differ; rows not compared"))
+            return mismatches, True
+
+        # Server-side comparisons need the same columns and types on both sides
+        same_columns = column_types == new_column_types
+
+        if db_link and same_columns:
+            try:
+                compare_table_via_minus(old_conn, table, pk_columns, column_types, db_link, mismatches)
+                return mismatches, True
+            except oracledb.DatabaseError as e:
+                # e.g. LOB columns, which MINUS cannot compare
+                print(f"[WARN] MINUS over {db_link} failed for {table}, comparing in Python: {e}")
+
+        text_expr = row_text_expression(column_types) if same_columns else None
+
+        pk_ranges = get_pk_ranges(old_conn, new_conn, table, pk_columns)
+        if pk_ranges is None:
+            compare_table_in_python(old_conn, new_conn, table, pk_columns, text_expr, mismatches)
+            return mismatches, True
+
+    # Ranges are disjoint and in key order, so concatenating keeps the report sorted
+    print(f"[INFO] Splitting {table} into {len(pk_ranges)} primary key ranges")
+    results = _RANGE_EXECUTOR.map(
+        lambda pk_range: compare_pk_range(table, pk_columns, text_expr, pk_range, old_pool, new_pool),
+        pk_ranges
+    )
+    for range_mismatches in results:
+        mismatches.extend(range_mismatches)
+    return mismatches, True
+
+def compare_entire_database(old_pool, new_pool, output_dir, db_link=""):
+    tables_without_pk = []
     output_file = os.path.join(output_dir, "database_mismatches.csv")
-    with open(output_file, mode='w', newline='') as file:
-        writer = csv.DictWriter(file, fieldnames=["Table", "Primary Key", "Column", "Old Value", "New Value", "Details"])
-        writer.writeheader()
-        for row in mismatches:
-            writer.writerow(row)
+    file = None
+    mismatch_count = 0
 
-    print(f"\n[INFO] Mismatches saved to {output_file}")
+    # Get and sort table lists
+    with old_pool.acquire() as old_conn:
+        old_tables = get_table_list(old_conn)
+    with new_pool.acquire() as new_conn:
+        new_tables = get_table_list(new_conn)
+    # Both lists are sorted, so one merge walk yields the common tables in order
+    same = lambda name: name
+    common_tables = [
+        old_table for old_table, new_table in merge_by_pk(iter(old_tables), iter(new_tables), same, same)
+        if old_table is not None and new_table is not None
+    ]
+
+    # Each worker returns the mismatches of one table; they are written to the
+    # CSV as soon as that table is done, so only one table's worth is held.
+    # map() keeps table order.
+    try:
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            results = executor.map(lambda t: compare_one_table(t, old_pool, new_pool, db_link), common_tables)
+            for table, (table_mismatches, has_pk) in zip(common_tables, results):
+                if not has_pk:
+                    tables_without_pk.append((table,))
+                if not table_mismatches:
+                    continue
+                if file is None:
+                    file = open(output_file, mode='w', newline='', buffering=CSV_BUFFER_SIZE)
+                    writer = csv.writer(file)
+                    writer.writerow(MISMATCH_FIELDS)
+                writer.writerows(table_mismatches)
+                mismatch_count += len(table_mismatches)
+    finally:
+        if file is not None:
+            file.close()
+
+    if mismatch_count:
+        print(f"\n[INFO] {mismatch_count} mismatches saved to {output_file}")
+    else:
+        print("\n[INFO] No mismatches found. Database comparison completed successfully.")
+    save_tables_without_pk_to_csv(tables_without_pk, output_dir)
 
 def save_tables_without_pk_to_csv(tables_without_pk, output_dir):
     if not tables_without_pk:
@@ -151,10 +557,9 @@ def save_tables_without_pk_to_csv(tables_without_pk, output_dir):
 
     output_file = os.path.join(output_dir, "tables_without_primary_key.csv")
     with open(output_file, mode='w', newline='') as file:
-        writer = csv.DictWriter(file, fieldnames=["Table"])
-        writer.writeheader()
-        for row in tables_without_pk:
-            writer.writerow(row)
+        writer = csv.writer(file)
+        writer.writerow(("Table",))
+        writer.writerows(tables_without_pk)
 
     print(f"[INFO] Tables without primary keys saved to {output_file}")
 
@@ -167,6 +572,7 @@ def main():
     new_user = input("Enter NEW DB Username: ").strip()
     new_password = input("Enter NEW DB Password: ").strip()
     new_dsn = input("Enter NEW DB DSN (e.g., host:port/service_name): ").strip()
+    db_link = input("Enter DB link from OLD DB to NEW DB (leave blank if none): ").strip()
 
     # Generate timestamped output directory
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -175,15 +581,15 @@ def main():
 
     print(f"[INFO] Output will be saved to: {output_dir}")
 
-    # Establish connections
-    old_conn = get_oracle_connection(old_user, old_password, old_dsn)
-    new_conn = get_oracle_connection(new_user, new_password, new_dsn)
+    # Establish connection pools
+    old_pool = get_oracle_pool(old_user, old_password, old_dsn)
+    new_pool = get_oracle_pool(new_user, new_password, new_dsn)
 
     try:
-        compare_entire_database(old_conn, new_conn, output_dir)
+        compare_entire_database(old_pool, new_pool, output_dir, db_link)
     finally:
-        old_conn.close()
-        new_conn.close()
+        old_pool.close()
+        new_pool.close()
 
 if __name__ == "__main__":
     main()
@@ -1,5 +1,47 @@
+import atexit
+import queue
+import threading
+from contextlib import ExitStack
+
 from torpy.http.requests import TorRequests
 
+# One Tor circuit and HTTP session shared by every notification of the
+# process; building a circuit takes several seconds, so it is not redone per call
+_tor_stack = None
+_tor_session = None
+_tor_lock = threading.Lock()
+
+
+def _get_tor_session():
+    """Returns the shared Tor-routed session, creating it on first use."""
+    global _tor_stack, _tor_session
+    if _tor_session is None:
+        stack = ExitStack()
+        try:
+            tor_requests = stack.enter_context(TorRequests())
+            _tor_session = stack.enter_context(tor_requests.get_session())
+        except Exception:
+            stack.close()
+            raise
+        _tor_stack = stack
+    return _tor_session
+
+
+def close_tor_session():
+    """Tears down the shared Tor session; the next notification builds a new one."""
+    global _tor_stack, _tor_session
+    with _tor_lock:
+        if _tor_stack is not None:
+            try:
+                _tor_stack.close()
+            except Exception as e:
+                print(f"[WARN] Closing Tor session failed: {e}")
+        _tor_stack = None
+        _tor_session = None
+
+
+atexit.register(close_tor_session)
+
 
 def send_telegram_notification(bot_token, chat_ids, message):
     """
@@ -12,20 +54,87 @@ def send_telegram_notification(bot_token, chat_ids, message):
     """
     url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
 
-    # Use TorRequests as a context manager for automatic setup and teardown.
-    with TorRequests() as tor_requests:
-        # Get a session that routes HTTP requests through Tor.
-        with tor_requests.get_session() as session:
-            for chat_id in chat_ids:
-                payload = {"chat_id": chat_id, "text": message}
-                try:
-                    response = session.post(url, json=payload, timeout=10)
-                    if response.status_code == 200:
-                        print(f"[INFO] Notification sent successfully to chat_id {chat_id}!")
-                    else:
-                        print(f"[ERROR] Notification failed for chat_id {chat_id}: {response.text}")
-                except Exception as e:
-                    print(f"[ERROR] Exception for chat_id {chat_id}: {e}")
+    broken = False
+    with _tor_lock:
+        try:
+            # Reuse the shared session that routes HTTP requests through Tor.
+            session = _get_tor_session()
+        except Exception as e:
+            print(f"[ERROR] Could not open Tor session: {e}")
+            return
+
+        for chat_id in chat_ids:
+            payload = {"chat_id": chat_id, "text": message}
+            try:
+                response = session.post(url, json=payload, timeout=10)
+                if response.status_code == 200:
+                    print(f"[INFO] Notification sent successfully to chat_id {chat_id}!")
+                else:
+                    print(f"[ERROR] Notification failed for chat_id {chat_id}: {response.text}")
+            except Exception as e:
+                print(f"[ERROR] Exception for chat_id {chat_id}: {e}")
+                broken = True
+
+    # A failed post may mean the circuit died; start fresh next time
+    if broken:
+        close_tor_session()
+
+
+# Notifications queued by the audits, posted by one background thread so the
+# audit never waits on Tor/HTTP
+_notification_queue = queue.Queue()
+_worker_lock = threading.Lock()
+_worker = None
+
+
+def _notification_worker():
+    while True:
+        batch = [_notification_queue.get()]
+        # Coalesce whatever else is already pending into as few posts as possible
+        while True:
+            try:
+                batch.append(_notification_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        groups = []
+        for bot_token, chat_ids, message in batch:
+            if groups and groups[-1][0] == (bot_token, chat_ids):
+                groups[-1][1].append(message)
+            else:
+                groups.append(((bot_token, chat_ids), [message]))
+
+        for (bot_token, chat_ids), messages in groups:
+            try:
+                send_telegram_notification(bot_token, list(chat_ids), "\n".join(messages))
+            except Exception as e:
+                print(f"[ERROR] Queued notification failed: {e}")
+
+        for _ in batch:
+            _notification_queue.task_done()
+
+
+def queue_telegram_notification(bot_token, chat_ids, message):
+    """
+    Queues a notification for the background sender and returns immediately.
+    Messages queued while a post is in flight are sent together as one message.
+    """
+    global _worker
+    with _worker_lock:
+        if _worker is None:
+            _worker = threading.Thread(target=_notification_worker, name="telegram-notifier", daemon=True)
+            _worker.start()
+    _notification_queue.put((bot_token, tuple(chat_ids), message))
+
+
+def flush_notifications():
+    """Blocks until every queued notification has been posted."""
+    if _worker is not None:
+        _notification_queue.join()
+
+
+# Registered after close_tor_session, so it runs first at exit
+atexit.register(flush_notifications)
 
 
 if __name__ == "__main__":
@@ -1,6 +1,10 @@
 import oracledb
 import random
 import string
+from itertools import islice
+
+# Rows bound per executemany() round trip
+INSERT_BATCH_SIZE = 10000
 
 def get_oracle_connection(user, password, dsn):
     try:
@@ -18,6 +22,19 @@ def execute_query(cursor, query, params=None):
         print(f"[ERROR] Query failed: {e}")
         raise
 
+def execute_many(cursor, query, rows, batch_size=INSERT_BATCH_SIZE):
+    """Array-binds `rows` into `query`, batch_size rows per round trip."""
+    rows = iter(rows)
+    try:
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                break
+            cursor.executemany(query, batch)
+    except oracledb.DatabaseError as e:
+        print(f"[ERROR] Query failed: {e}")
+        raise
+
 def create_schema(cursor, schema_name, schema_password):
     try:
         execute_query(cursor, f"DROP USER {schema_name} CASCADE")
@@ -62,14 +79,17 @@ def create_table_without_pk(cursor, schema_name, table_index):
 
 def populate_table(cursor, schema_name, table_name, num_rows, is_old_db=True):
     # Insert base data
-    for i in range(1, num_rows + 1):
-        name = f"User_{i}"
-        email = f"user{i}@example.com"
-        balance = round(random.uniform(100, 1000), 2)
-        execute_query(cursor, f"""
-            INSERT INTO {schema_name}.{table_name} (ID, NAME, EMAIL, BALANCE, CREATED_AT)
-            VALUES (:1, :2, :3, :4, SYSDATE)
-        """, (i, name, email, balance))
+    # Balances are drawn as whole cents, which avoids a float round() per row
+    randrange = random.randrange
+    rows = (
+        (i, f"User_{i}", f"user{i}@example.com", randrange(10000, 100001) / 100)
+        for i in range(1, num_rows + 1)
+    )
+    cursor.setinputsizes(int, 100, 100, float)
+    execute_many(cursor, f"""
+        INSERT INTO {schema_name}.{table_name} (ID, NAME, EMAIL, BALANCE, CREATED_AT)
+        VALUES (:1, :2, :3, :4, SYSDATE)
+    """, rows)
 
     # Introduce discrepancies in NEW DB
     if not is_old_db:
@@ -88,12 +108,12 @@ def populate_table(cursor, schema_name, table_name, num_rows, is_old_db=True):
         """, (new_id, 'New_Only_User', 'newonly@example.com', 500.00))
 
 def populate_table_without_pk(cursor, schema_name, table_name, num_rows):
-    for i in range(1, num_rows + 1):
-        message = f"Log Message {i}"
-        execute_query(cursor, f"""
-            INSERT INTO {schema_name}.{table_name} (LOG_ID, MESSAGE, LOGGED_AT)
-            VALUES (:1, :2, SYSDATE)
-        """, (i, message))
+    rows = ((i, f"Log Message {i}") for i in range(1, num_rows + 1))
+    cursor.setinputsizes(int, 255)
+    execute_many(cursor, f"""
+        INSERT INTO {schema_name}.{table_name} (LOG_ID, MESSAGE, LOGGED_AT)
+        VALUES (:1, :2, SYSDATE)
+    """, rows)
 
 def main():
     # Prompt user for Oracle DBA credentials